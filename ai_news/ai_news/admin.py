@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import NewsArticle, BlogSummary
+from .models import NewsArticle, BlogSummary, FeedCacheState, HackerNewsItem, SourceWatermark, EmbeddingCacheEntry
 
 
 @admin.register(NewsArticle)
@@ -36,4 +36,33 @@ class BlogSummaryAdmin(admin.ModelAdmin):
     def article_count(self, obj):
         return obj.articles.count()
     
-    article_count.short_description = 'Article Count'
\ No newline at end of file
+    article_count.short_description = 'Article Count'
+
+
+@admin.register(FeedCacheState)
+class FeedCacheStateAdmin(admin.ModelAdmin):
+    list_display = ['feed_url', 'last_status', 'etag', 'last_modified', 'last_checked']
+    search_fields = ['feed_url']
+    readonly_fields = ['last_checked']
+
+
+@admin.register(HackerNewsItem)
+class HackerNewsItemAdmin(admin.ModelAdmin):
+    list_display = ['item_id', 'fetched_at']
+    search_fields = ['item_id']
+    readonly_fields = ['fetched_at']
+
+
+@admin.register(SourceWatermark)
+class SourceWatermarkAdmin(admin.ModelAdmin):
+    list_display = ['source', 'newest_published', 'updated_at']
+    search_fields = ['source']
+    readonly_fields = ['updated_at']
+
+
+@admin.register(EmbeddingCacheEntry)
+class EmbeddingCacheEntryAdmin(admin.ModelAdmin):
+    list_display = ['model', 'content_hash', 'dimension', 'last_used']
+    list_filter = ['model']
+    search_fields = ['content_hash']
+    exclude = ['vector']
@@ -8,6 +8,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.throttling import AnonRateThrottle
 from django.core.cache import cache
+from django.db.models import Prefetch
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
 from django.http import Http404
@@ -29,6 +30,11 @@ from .src.security import SecurityAuditor
 logger = logging.getLogger(__name__)
 
 
+def summary_articles_prefetch() -> Prefetch:
+    """Prefetch artykułów summary - serializers potrzebują tylko source (bez content)."""
+    return Prefetch('articles', queryset=NewsArticle.objects.only('id', 'source'))
+
+
 class BaseSecureAPIView(APIView):
     """
     Base API view with security features and standardized responses.
@@ -156,7 +162,7 @@ class LatestSummaryAPIView(BaseSecureAPIView):
         try:
             # Get the most recent summary
             try:
-                latest_summary = BlogSummary.objects.prefetch_related('articles').latest('created_date')
+                latest_summary = BlogSummary.objects.prefetch_related(summary_articles_prefetch()).latest('created_date')
             except BlogSummary.DoesNotExist:
                 return self.build_error_response(
                     "no_summaries",
@@ -214,7 +220,7 @@ class SummaryListAPIView(BaseSecureAPIView, generics.ListAPIView):
         Get queryset of recent summaries.
         Optimized query with prefetch_related for performance.
         """
-        return BlogSummary.objects.prefetch_related('articles').order_by('-created_date')
+        return BlogSummary.objects.prefetch_related(summary_articles_prefetch()).order_by('-created_date')
     
     @method_decorator(cache_page(60 * 10))  # Cache for 10 minutes
     def list(self, request, *args, **kwargs):
@@ -270,8 +276,10 @@ class SystemStatusAPIView(BaseSecureAPIView):
         try:
             # Calculate system statistics
             total_summaries = BlogSummary.objects.count()
-            total_articles = NewsArticle.objects.count()
-            unique_articles = NewsArticle.objects.filter(is_duplicate=False).count()
+            from .src.article_stats import collect_article_statistics
+            article_stats = collect_article_statistics()
+            total_articles = article_stats['total_articles']
+            unique_articles = article_stats['unique_articles']
             
             # Get available sources count
             from .src.parsers import ScraperFactory
@@ -356,7 +364,7 @@ class SummaryDetailAPIView(BaseSecureAPIView):
         try:
             # Get specific summary
             try:
-                summary = BlogSummary.objects.prefetch_related('articles').get(id=summary_id)
+                summary = BlogSummary.objects.prefetch_related(summary_articles_prefetch()).get(id=summary_id)
             except BlogSummary.DoesNotExist:
                 return self.build_error_response(
                     "summary_not_found",
@@ -32,6 +32,47 @@ class AppConfig:
     qdrant_port: int = 6333
     qdrant_collection_name: str = "news_articles"
     
+    # Vector store backend: "qdrant" lub "faiss" (in-process index, bez Qdrant server)
+    vector_store_backend: str = "qdrant"
+    faiss_index_path: str = "faiss_index/news_articles.faiss"
+    
+    # Embedding backend: "openai" lub "sentence-transformers" (lokalny CPU model)
+    embedding_backend: str = "openai"
+    local_embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    local_embedding_device: str = "cpu"
+    
+    # Dedup window (semantic i MinHash) w dniach wokół published_date (0 = cała kolekcja)
+    dedup_window_days: int = 7
+    
+    # Near-duplicate (MinHash + LSH) Jaccard threshold (0 = disabled)
+    near_duplicate_threshold: float = 0.8
+    
+    # Binary storage embeddings w DB: "float32" lub "float16"
+    embedding_storage_dtype: str = "float32"
+    
+    # Embedding cache configuration (0 = disabled)
+    embedding_cache_max_entries: int = 50000
+    
+    # Retention: artykułów per chunk (jeden vector delete + jedna transakcja)
+    retention_chunk_size: int = 500
+    
+    # Scraping configuration
+    scrape_max_workers: int = 8
+    scrape_per_host_limit: int = 2
+    scrape_use_async: bool = False
+    
+    # Summarization: równoległe LLM calls w map phase
+    summary_map_concurrency: int = 8
+    
+    # Cache map-step extractions (0 = disabled)
+    summary_map_cache_max_entries: int = 20000
+    
+    # Budżet tokenów treści artykułów per map call (ograniczony context window modelu)
+    summary_map_max_tokens: int = 6000
+    
+    # Budżet tokenów input reduce call - powyżej tree collapse (ograniczony context window modelu)
+    summary_reduce_max_tokens: int = 12000
+    
     # LangChain configuration
     langchain_tracing_v2: bool = True
     langchain_project: str = "ai-news-scraper"
@@ -76,6 +117,27 @@ class EnvironmentConfigProvider(ConfigProvider):
             qdrant_host=os.getenv('QDRANT_HOST', 'localhost'),
             qdrant_port=int(os.getenv('QDRANT_PORT', '6333')),
             qdrant_collection_name=os.getenv('QDRANT_COLLECTION_NAME', 'news_articles'),
+            vector_store_backend=os.getenv('VECTOR_STORE_BACKEND', 'qdrant'),
+            faiss_index_path=os.getenv('FAISS_INDEX_PATH', 'faiss_index/news_articles.faiss'),
+            embedding_backend=os.getenv('EMBEDDING_BACKEND', 'openai'),
+            local_embedding_model=os.getenv('LOCAL_EMBEDDING_MODEL', 'sentence-transformers/all-MiniLM-L6-v2'),
+            local_embedding_device=os.getenv('LOCAL_EMBEDDING_DEVICE', 'cpu'),
+            dedup_window_days=int(os.getenv('DEDUP_WINDOW_DAYS', '7')),
+            near_duplicate_threshold=float(os.getenv('NEAR_DUPLICATE_THRESHOLD', '0.8')),
+            embedding_storage_dtype=os.getenv('EMBEDDING_STORAGE_DTYPE', 'float32'),
+            embedding_cache_max_entries=int(os.getenv('EMBEDDING_CACHE_MAX_ENTRIES', '50000')),
+            retention_chunk_size=int(os.getenv('RETENTION_CHUNK_SIZE', '500')),
+            
+            # Scraping configuration
+            scrape_max_workers=int(os.getenv('SCRAPE_MAX_WORKERS', '8')),
+            scrape_per_host_limit=int(os.getenv('SCRAPE_PER_HOST_LIMIT', '2')),
+            scrape_use_async=os.getenv('SCRAPE_USE_ASYNC', 'false').lower() == 'true',
+            
+            # Summarization configuration
+            summary_map_concurrency=int(os.getenv('SUMMARY_MAP_CONCURRENCY', '8')),
+            summary_map_cache_max_entries=int(os.getenv('SUMMARY_MAP_CACHE_MAX_ENTRIES', '20000')),
+            summary_map_max_tokens=int(os.getenv('SUMMARY_MAP_MAX_TOKENS', '6000')),
+            summary_reduce_max_tokens=int(os.getenv('SUMMARY_REDUCE_MAX_TOKENS', '12000')),
             
             # LangChain configuration
             langchain_tracing_v2=os.getenv('LANGCHAIN_TRACING_V2', 'true').lower() == 'true',
@@ -162,6 +224,27 @@ class GCPSecretManagerProvider(ConfigProvider):
                 qdrant_host=self.get_secret('qdrant-host') or os.getenv('QDRANT_HOST', 'localhost'),
                 qdrant_port=int(self.get_secret('qdrant-port') or os.getenv('QDRANT_PORT', '6333')),
                 qdrant_collection_name=self.get_secret('qdrant-collection-name') or os.getenv('QDRANT_COLLECTION_NAME', 'news_articles'),
+                vector_store_backend=os.getenv('VECTOR_STORE_BACKEND', 'qdrant'),
+                faiss_index_path=os.getenv('FAISS_INDEX_PATH', 'faiss_index/news_articles.faiss'),
+                embedding_backend=os.getenv('EMBEDDING_BACKEND', 'openai'),
+                local_embedding_model=os.getenv('LOCAL_EMBEDDING_MODEL', 'sentence-transformers/all-MiniLM-L6-v2'),
+                local_embedding_device=os.getenv('LOCAL_EMBEDDING_DEVICE', 'cpu'),
+                dedup_window_days=int(os.getenv('DEDUP_WINDOW_DAYS', '7')),
+                near_duplicate_threshold=float(os.getenv('NEAR_DUPLICATE_THRESHOLD', '0.8')),
+                embedding_storage_dtype=os.getenv('EMBEDDING_STORAGE_DTYPE', 'float32'),
+                embedding_cache_max_entries=int(os.getenv('EMBEDDING_CACHE_MAX_ENTRIES', '50000')),
+                retention_chunk_size=int(os.getenv('RETENTION_CHUNK_SIZE', '500')),
+                
+                # Scraping configuration (environment only - not secrets)
+                scrape_max_workers=int(os.getenv('SCRAPE_MAX_WORKERS', '8')),
+                scrape_per_host_limit=int(os.getenv('SCRAPE_PER_HOST_LIMIT', '2')),
+                scrape_use_async=os.getenv('SCRAPE_USE_ASYNC', 'false').lower() == 'true',
+                
+                # Summarization configuration (environment only - not secrets)
+                summary_map_concurrency=int(os.getenv('SUMMARY_MAP_CONCURRENCY', '8')),
+                summary_map_cache_max_entries=int(os.getenv('SUMMARY_MAP_CACHE_MAX_ENTRIES', '20000')),
+                summary_map_max_tokens=int(os.getenv('SUMMARY_MAP_MAX_TOKENS', '6000')),
+                summary_reduce_max_tokens=int(os.getenv('SUMMARY_REDUCE_MAX_TOKENS', '12000')),
                 
                 # LangChain configuration (fallback to environment)
                 langchain_tracing_v2=(self.get_secret('langchain-tracing-v2') or os.getenv('LANGCHAIN_TRACING_V2', 'true')).lower() == 'true',
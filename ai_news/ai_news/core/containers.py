@@ -36,7 +36,7 @@ class ApplicationContainer(containers.DeclarativeContainer):
     
     # Core services
     vector_deduplicator = providers.Singleton(
-        "ai_news.src.deduplication.VectorDeduplicator",
+        "ai_news.src.deduplication.create_vector_deduplicator",
         qdrant_url=config.provided.qdrant_url,
         qdrant_api_key=config.provided.qdrant_api_key,
         qdrant_host=config.provided.qdrant_host,
@@ -97,6 +97,9 @@ class ApplicationContainer(containers.DeclarativeContainer):
         embedding_model=config.provided.default_embedding_model,
         llm_model=config.provided.default_llm_model,
         temperature=config.provided.default_temperature,
+        scrape_max_workers=config.provided.scrape_max_workers,
+        scrape_per_host_limit=config.provided.scrape_per_host_limit,
+        scrape_use_async=config.provided.scrape_use_async,
         deduplication_service=deduplication_service,
         blog_summary_service=blog_summary_service,
         langchain_orchestrator=langchain_orchestrator
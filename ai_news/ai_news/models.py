@@ -1,6 +1,24 @@
 from django.db import models
 from django.utils import timezone
 import hashlib
+import numpy as np
+
+
+class NewsArticleQuerySet(models.QuerySet):
+    """QuerySet z lean projection - list queries bez ciężkich kolumn."""
+    HEAVY_FIELDS = ('content', 'embedding_vector')
+    
+    def lean(self):
+        """Defer content i embedding_vector (listy, serializers, statystyki)."""
+        return self.defer(*self.HEAVY_FIELDS)
+    
+    def with_body(self):
+        """Pełne wiersze (cofa lean() / defer)."""
+        return self.defer(None)
+
+
+class NewsArticleManager(models.Manager.from_queryset(NewsArticleQuerySet)):
+    """Default manager - pełne wiersze; listy opt-in przez .lean()."""
 
 
 class NewsArticle(models.Model):
@@ -11,10 +29,13 @@ class NewsArticle(models.Model):
     published_date = models.DateTimeField()
     scraped_date = models.DateTimeField(default=timezone.now)
     content_hash = models.CharField(max_length=64, unique=True)
+    # Legacy JSON storage - nowe embeddings trafiają do ArticleEmbedding (migrate_embeddings)
     embedding_vector = models.JSONField(null=True, blank=True)
     is_duplicate = models.BooleanField(default=False)
     duplicate_of = models.ForeignKey('self', on_delete=models.CASCADE, null=True, blank=True)
     
+    objects = NewsArticleManager()
+    
     class Meta:
         ordering = ['-published_date']
         indexes = [
@@ -29,19 +50,169 @@ class NewsArticle(models.Model):
             ).hexdigest()
         super().save(*args, **kwargs)
     
+    def get_embedding(self):
+        """Embedding jako numpy array (binary side table, fallback na legacy JSON) albo None."""
+        try:
+            return self.embedding.as_array()
+        except ArticleEmbedding.DoesNotExist:
+            if self.embedding_vector:
+                return np.asarray(self.embedding_vector, dtype=np.float32)
+            return None
+    
     def __str__(self):
         return f"{self.title} - {self.source}"
 
 
 class BlogSummary(models.Model):
+    # Okres summary - weekly składa się z daily summaries (incremental reduce)
+    PERIODS = [
+        ('daily', 'Daily'),
+        ('weekly', 'Weekly'),
+        ('custom', 'Custom'),
+    ]
+    
     title = models.CharField(max_length=300)
     summary = models.TextField()
     articles = models.ManyToManyField(NewsArticle, related_name='blog_summaries')
     created_date = models.DateTimeField(default=timezone.now)
     topic_category = models.CharField(max_length=100)
+    period = models.CharField(max_length=10, choices=PERIODS, default='custom', db_index=True)
     
     class Meta:
         ordering = ['-created_date']
     
     def __str__(self):
-        return f"{self.title} - {self.created_date.date()}"
\ No newline at end of file
+        return f"{self.title} - {self.created_date.date()}"
+
+
+class FeedCacheState(models.Model):
+    """HTTP validators (ETag / Last-Modified) z ostatniego fetchu feedu - conditional GET."""
+    feed_url = models.URLField(max_length=500, unique=True)
+    etag = models.CharField(max_length=255, blank=True, default='')
+    last_modified = models.CharField(max_length=100, blank=True, default='')
+    last_status = models.IntegerField(null=True, blank=True)
+    last_checked = models.DateTimeField(default=timezone.now)
+    
+    def __str__(self):
+        return f"{self.feed_url} ({self.last_status})"
+
+
+class HackerNewsItem(models.Model):
+    """Cached HN item document (/item/{id}.json) - persistuje między runs scrapera, TTL po fetched_at."""
+    item_id = models.BigIntegerField(unique=True)
+    payload = models.JSONField()
+    fetched_at = models.DateTimeField(default=timezone.now, db_index=True)
+    
+    def __str__(self):
+        return f"HN item {self.item_id}"
+
+
+class SourceWatermark(models.Model):
+    """High-water mark per źródło - najnowszy published_date i ostatnie URLs (early stop scrapera)."""
+    source = models.CharField(max_length=100, unique=True)
+    newest_published = models.DateTimeField(null=True, blank=True)
+    recent_urls = models.JSONField(default=list, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"{self.source} (newest: {self.newest_published})"
+
+
+class EmbeddingCacheEntry(models.Model):
+    """Cached embedding per (model, content_hash) - float32 bytes, LRU eviction po last_used."""
+    model = models.CharField(max_length=100)
+    content_hash = models.CharField(max_length=64)
+    vector = models.BinaryField()
+    dimension = models.IntegerField()
+    last_used = models.DateTimeField(default=timezone.now, db_index=True)
+    
+    class Meta:
+        unique_together = [('model', 'content_hash')]
+    
+    def __str__(self):
+        return f"{self.model}:{self.content_hash[:12]} ({self.dimension}d)"
+
+
+class MapExtractionCacheEntry(models.Model):
+    """Cached map-step extraction per (content_hash, model, prompt_version) - LRU eviction po last_used."""
+    content_hash = models.CharField(max_length=64)
+    model = models.CharField(max_length=100)
+    prompt_version = models.CharField(max_length=64)
+    extraction = models.TextField()
+    last_used = models.DateTimeField(default=timezone.now, db_index=True)
+    
+    class Meta:
+        unique_together = [('content_hash', 'model', 'prompt_version')]
+    
+    def __str__(self):
+        return f"{self.model}:{self.prompt_version}:{self.content_hash[:12]}"
+
+
+class MinHashBand(models.Model):
+    """LSH band key z MinHash sygnatury unikalnego artykułu - lookup near-duplicate kandydatów."""
+    article = models.ForeignKey(NewsArticle, on_delete=models.CASCADE, related_name='minhash_bands')
+    band_key = models.BigIntegerField(db_index=True)
+    
+    def __str__(self):
+        return f"{self.article_id}:{self.band_key}"
+
+
+class ArticleEmbedding(models.Model):
+    """Embedding artykułu jako float32/float16 blob (6 KB / 3 KB zamiast ~30 KB JSON dla 1536d)."""
+    STORAGE_DTYPES = ('float32', 'float16')
+    
+    article = models.OneToOneField(NewsArticle, on_delete=models.CASCADE, primary_key=True,
+                                   related_name='embedding')
+    vector = models.BinaryField()
+    dtype = models.CharField(max_length=10, default='float32')
+    dimension = models.IntegerField()
+    
+    def as_array(self) -> np.ndarray:
+        """Zero-copy read-only view na blob (np.frombuffer)."""
+        return np.frombuffer(self.vector, dtype=self.dtype)
+    
+    @classmethod
+    def from_vector(cls, article_id: int, vector, dtype: str = 'float32') -> 'ArticleEmbedding':
+        if dtype not in cls.STORAGE_DTYPES:
+            raise ValueError(f"Unsupported embedding storage dtype: {dtype}")
+        array = np.asarray(vector, dtype=dtype)
+        return cls(article_id=article_id, vector=array.tobytes(), dtype=dtype, dimension=array.size)
+    
+    @classmethod
+    def store_many(cls, vectors_by_article_id, dtype: str = 'float32') -> int:
+        """Upsert embeddings (article_id -> vector) jednym bulk_create."""
+        rows = [cls.from_vector(article_id, vector, dtype) for article_id, vector in vectors_by_article_id.items()]
+        cls.objects.bulk_create(
+            rows, update_conflicts=True, unique_fields=['article'],
+            update_fields=['vector', 'dtype', 'dimension']
+        )
+        return len(rows)
+    
+    def __str__(self):
+        return f"{self.article_id} ({self.dimension}d {self.dtype})"
+
+
+class SourceStats(models.Model):
+    """Rollup per źródło aktualizowany przy ingestion - statystyki bez skanowania NewsArticle."""
+    source = models.CharField(max_length=100, unique=True)
+    total_articles = models.IntegerField(default=0)
+    unique_articles = models.IntegerField(default=0)
+    duplicate_articles = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"{self.source}: {self.unique_articles} unique / {self.total_articles} total"
+
+
+class DailyStats(models.Model):
+    """Rollup per dzień publikacji (published_date w current timezone)."""
+    day = models.DateField(unique=True)
+    total_articles = models.IntegerField(default=0)
+    unique_articles = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['-day']
+    
+    def __str__(self):
+        return f"{self.day}: {self.total_articles} articles"
@@ -0,0 +1,272 @@
+"""
+Wspólny statistics engine dla news_stats, status API i agent tool.
+
+Odczyty idą z rollup tables (SourceStats per źródło, DailyStats per dzień),
+które ingestion aktualizuje inkrementalnie (F() deltas) - koszt statystyk
+nie rośnie z rozmiarem archiwum. Grouped aggregate nad NewsArticle
+(values('source').annotate(...) z conditional Count) jest używany tylko
+przez rebuild_stats (reconcile drift), do backfill przy pierwszym ingestion
+po upgrade (pusty rollup) i jako fallback, gdy rollup jest pusty.
+
+Usage:
+    stats = collect_article_statistics()
+    stats['source_statistics']['OpenAI Blog']  # {'total': 12, 'unique': 10}
+
+    record_ingested_articles(created, duplicate_flags)  # po dedup stage
+"""
+import logging
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+logger = logging.getLogger(__name__)
+
+
+def _statistics_from_sources(source_stats: Dict) -> Dict:
+    """Sumy liczone w Pythonie z per-source wierszy {source: {'total', 'unique'}}."""
+    total_articles = sum(stats['total'] for stats in source_stats.values())
+    unique_articles = sum(stats['unique'] for stats in source_stats.values())
+    duplicates = total_articles - unique_articles
+
+    return {
+        'total_articles': total_articles,
+        'unique_articles': unique_articles,
+        'duplicates': duplicates,
+        'duplicate_rate': (duplicates / total_articles * 100) if total_articles > 0 else 0,
+        'source_count': len(source_stats),
+        'source_statistics': source_stats,
+    }
+
+
+def aggregate_article_statistics() -> Dict:
+    """
+    Article statistics z jednego GROUP BY source query (pełny scan NewsArticle).
+
+    order_by() czyści Meta.ordering (-published_date) - inaczej Django dodałby
+    published_date do GROUP BY i zwrócił wiersz per artykuł zamiast per źródło.
+
+    Returns:
+        Dict: Jak collect_article_statistics()
+    """
+    from ..models import NewsArticle
+
+    rows = NewsArticle.objects.order_by().values('source').annotate(
+        total=Count('id'),
+        unique=Count('id', filter=Q(is_duplicate=False))
+    )
+    return _statistics_from_sources({
+        row['source']: {'total': row['total'], 'unique': row['unique']}
+        for row in rows
+    })
+
+
+def collect_article_statistics() -> Dict:
+    """
+    Article statistics z SourceStats rollup (jeden query po małej tabeli).
+
+    Gdy rollup jest pusty, a artykuły istnieją (deployment sprzed rollup, przed
+    pierwszym ingestion), wynik pochodzi z aggregate_article_statistics().
+    Drift naprawia rebuild_stats.
+
+    Returns:
+        Dict: 'total_articles', 'unique_articles', 'duplicates', 'duplicate_rate',
+              'source_count' i 'source_statistics' ({source: {'total', 'unique'}})
+    """
+    from ..models import NewsArticle, SourceStats
+
+    source_stats = {
+        row['source']: {'total': row['total_articles'], 'unique': row['unique_articles']}
+        for row in SourceStats.objects.order_by('source').values('source', 'total_articles', 'unique_articles')
+        if row['total_articles'] > 0
+    }
+    if not source_stats and NewsArticle.objects.exists():
+        logger.warning("Statistics rollup is empty - run 'python manage.py rebuild_stats'")
+        return aggregate_article_statistics()
+
+    return _statistics_from_sources(source_stats)
+
+
+def daily_article_counts(days: int = 7) -> Dict[date, Dict[str, int]]:
+    """
+    Per-day counts z DailyStats dla ostatnich `days` dni (najnowsze najpierw).
+
+    Returns:
+        Dict[date, Dict[str, int]]: {day: {'total', 'unique'}}
+    """
+    from ..models import DailyStats
+
+    since = timezone.localdate() - timedelta(days=max(0, days - 1))
+    return {
+        row['day']: {'total': row['total_articles'], 'unique': row['unique_articles']}
+        for row in DailyStats.objects.filter(day__gte=since).values('day', 'total_articles', 'unique_articles')
+    }
+
+
+def _article_day(published_date) -> date:
+    """
+    Dzień publikacji w current timezone - ta sama semantyka co TruncDate w rebuild.
+
+    Po bulk_create published_date może być jeszcze stringiem z InputSanitizer
+    (Django parsuje go dopiero przy zapisie, nie na instancji).
+    """
+    if isinstance(published_date, str):
+        published_date = parse_datetime(published_date) or timezone.now()
+    if timezone.is_naive(published_date):
+        published_date = timezone.make_aware(published_date)
+    return timezone.localdate(published_date)
+
+
+def _apply_deltas(model, key_field: str, deltas: Dict, fields: List[str]):
+    """
+    Dodaje deltas ({key: {field: delta}}) do rollup rows przez F() update.
+
+    Brakujący row jest tworzony tylko dla dodatnich delt - ujemne delty
+    dla pustego rollup zostawiają fallback/rebuild nienaruszony.
+    """
+    now = timezone.now()
+    for key, delta in deltas.items():
+        updates = {field: F(field) + delta[field] for field in fields if delta[field]}
+        if not updates:
+            continue
+        updated = model.objects.filter(**{key_field: key}).update(updated_at=now, **updates)
+        if not updated and all(delta[field] >= 0 for field in fields):
+            model.objects.create(**{key_field: key}, **{field: delta[field] for field in fields})
+
+
+def _apply_rollup_deltas(source_deltas: Dict, day_deltas: Dict):
+    from ..models import DailyStats, SourceStats
+
+    with transaction.atomic():
+        _apply_deltas(SourceStats, 'source', source_deltas,
+                      ['total_articles', 'unique_articles', 'duplicate_articles'])
+        _apply_deltas(DailyStats, 'day', day_deltas, ['total_articles', 'unique_articles'])
+
+
+def record_ingested_articles(articles: List, duplicate_flags: Optional[List[bool]] = None):
+    """
+    Inkrementalny update rollup po ingestion batcha (jeden UPDATE per źródło/dzień).
+
+    Pusty rollup (pierwsze ingestion po upgrade) jest najpierw przeliczany
+    z NewsArticle - deltas do pustej tabeli dałyby rollup z samym tym batchem.
+
+    Args:
+        articles: Nowo zapisane NewsArticle
+        duplicate_flags: Wynik dedup per article (None = wszystkie unique)
+    """
+    if not articles:
+        return
+
+    from ..models import SourceStats
+
+    if duplicate_flags is None:
+        duplicate_flags = [False] * len(articles)
+
+    source_deltas = defaultdict(lambda: {'total_articles': 0, 'unique_articles': 0, 'duplicate_articles': 0})
+    day_deltas = defaultdict(lambda: {'total_articles': 0, 'unique_articles': 0})
+    try:
+        if not SourceStats.objects.exists():
+            # Backfill - batch jest już zapisany, więc rebuild go obejmuje
+            rebuild_statistics_rollup()
+            return
+
+        for article, is_duplicate in zip(articles, duplicate_flags):
+            unique = 0 if is_duplicate else 1
+            source_delta = source_deltas[article.source]
+            source_delta['total_articles'] += 1
+            source_delta['unique_articles'] += unique
+            source_delta['duplicate_articles'] += 1 - unique
+
+            day_delta = day_deltas[_article_day(article.published_date)]
+            day_delta['total_articles'] += 1
+            day_delta['unique_articles'] += unique
+
+        _apply_rollup_deltas(source_deltas, day_deltas)
+    except Exception as e:
+        # Rollup drift naprawia rebuild_stats - ingestion nie może failować przez statystyki
+        logger.error(f"Could not update statistics rollup: {e}")
+
+
+def record_deleted_articles(queryset):
+    """
+    Odejmuje od rollup artykuły z queryset (wywoływać przed delete()).
+
+    Dwa grouped aggregates (per źródło i per dzień) nad usuwanymi rows.
+    """
+    unique = Count('id', filter=Q(is_duplicate=False))
+    try:
+        rows = queryset.order_by()
+        source_deltas = {
+            row['source']: {
+                'total_articles': -row['total'],
+                'unique_articles': -row['unique'],
+                'duplicate_articles': row['unique'] - row['total'],
+            }
+            for row in rows.values('source').annotate(total=Count('id'), unique=unique)
+        }
+        day_deltas = {
+            row['day']: {'total_articles': -row['total'], 'unique_articles': -row['unique']}
+            for row in rows.annotate(day=TruncDate('published_date')).values('day').annotate(
+                total=Count('id'), unique=unique
+            )
+        }
+        _apply_rollup_deltas(source_deltas, day_deltas)
+    except Exception as e:
+        logger.error(f"Could not update statistics rollup: {e}")
+
+
+def rebuild_statistics_rollup() -> Dict[str, int]:
+    """
+    Przelicza SourceStats i DailyStats od zera z NewsArticle (reconcile drift).
+
+    Returns:
+        Dict[str, int]: Liczba źródeł/dni, których rollup różnił się od rzeczywistości
+    """
+    from ..models import DailyStats, NewsArticle, SourceStats
+
+    unique = Count('id', filter=Q(is_duplicate=False))
+    articles = NewsArticle.objects.order_by()
+
+    sources = {
+        row['source']: (row['total'], row['unique'], row['total'] - row['unique'])
+        for row in articles.values('source').annotate(total=Count('id'), unique=unique)
+    }
+    days = {
+        row['day']: (row['total'], row['unique'])
+        for row in articles.annotate(day=TruncDate('published_date')).values('day').annotate(
+            total=Count('id'), unique=unique
+        )
+    }
+
+    with transaction.atomic():
+        old_sources = {
+            row[0]: row[1:] for row in SourceStats.objects.values_list(
+                'source', 'total_articles', 'unique_articles', 'duplicate_articles')
+        }
+        old_days = {
+            row[0]: row[1:] for row in DailyStats.objects.values_list('day', 'total_articles', 'unique_articles')
+        }
+
+        SourceStats.objects.all().delete()
+        DailyStats.objects.all().delete()
+        SourceStats.objects.bulk_create([
+            SourceStats(source=source, total_articles=total, unique_articles=unique_count,
+                        duplicate_articles=duplicates)
+            for source, (total, unique_count, duplicates) in sources.items()
+        ])
+        DailyStats.objects.bulk_create([
+            DailyStats(day=day, total_articles=total, unique_articles=unique_count)
+            for day, (total, unique_count) in days.items()
+        ])
+
+    return {
+        'sources_corrected': sum(1 for key in sources.keys() | old_sources.keys()
+                                 if sources.get(key) != old_sources.get(key)),
+        'days_corrected': sum(1 for key in days.keys() | old_days.keys()
+                              if days.get(key) != old_days.get(key)),
+    }
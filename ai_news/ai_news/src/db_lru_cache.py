@@ -0,0 +1,117 @@
+"""
+Wspólna baza persistent caches w lokalnej bazie keyed by content_hash.
+
+DatabaseLRUCache implementuje bounded LRU na tabeli z polami content_hash
+i last_used: get_many (jeden query + jeden UPDATE last_used), set_many
+(bulk_create z ignore_conflicts) i eviction najdawniej używanych wpisów
+ponad max_entries. Subklasy (EmbeddingCache, MapExtractionCache) definiują
+tylko model, pozostałe pola klucza i (de)serializację wartości.
+"""
+import logging
+from typing import Any, Dict, Iterable
+
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseLRUCache:
+    """Size-bounded LRU cache content_hash -> value w tabeli Django"""
+
+    # Pole modelu z wartością i nazwa cache w logach
+    value_field = 'value'
+    label = 'cache'
+
+    def __init__(self, max_entries: int):
+        """
+        Args:
+            max_entries: Maksymalna liczba wpisów w tabeli (0 = cache wyłączony)
+        """
+        self.max_entries = max_entries
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def _entry_model(self):
+        """Model Django z wpisami cache (lazy import w subklasie)."""
+        raise NotImplementedError
+
+    def _key_fields(self) -> Dict[str, Any]:
+        """Pola klucza poza content_hash (np. model, prompt_version)."""
+        return {}
+
+    def _decode(self, value) -> Any:
+        return value
+
+    def _entry_fields(self, value) -> Dict[str, Any]:
+        """Pola nowego wpisu z wartością."""
+        return {self.value_field: value}
+
+    def get_many(self, content_hashes: Iterable[str]) -> Dict[str, Any]:
+        """
+        Zwraca cached values dla podanych content_hash (jeden query).
+
+        Trafienia dostają odświeżony last_used (jeden UPDATE), więc eviction
+        usuwa wpisy najdawniej używane, a nie najdawniej dodane.
+
+        Returns:
+            Dict[str, Any]: content_hash -> value (tylko trafienia)
+        """
+        hashes = list({content_hash for content_hash in content_hashes if content_hash})
+        if not self.enabled or not hashes:
+            return {}
+
+        model = self._entry_model()
+        try:
+            entries = list(model.objects.filter(
+                content_hash__in=hashes, **self._key_fields()
+            ).values_list('id', 'content_hash', self.value_field))
+
+            if entries:
+                model.objects.filter(
+                    id__in=[entry_id for entry_id, _, _ in entries]
+                ).update(last_used=timezone.now())
+            return {content_hash: self._decode(value) for _, content_hash, value in entries}
+        except Exception as e:
+            logger.warning(f"{self.label.capitalize()} lookup failed: {e}")
+            return {}
+
+    def set_many(self, values: Dict[str, Any]):
+        """
+        Zapisuje nowe values (content_hash -> value) i przycina cache do max_entries.
+
+        Args:
+            values: content_hash -> value; istniejące klucze są pomijane
+        """
+        if not self.enabled or not values:
+            return
+
+        model = self._entry_model()
+        try:
+            now = timezone.now()
+            model.objects.bulk_create(
+                [
+                    model(content_hash=content_hash, last_used=now,
+                          **self._key_fields(), **self._entry_fields(value))
+                    for content_hash, value in values.items() if content_hash
+                ],
+                ignore_conflicts=True
+            )
+            self._evict()
+        except Exception as e:
+            logger.warning(f"{self.label.capitalize()} write failed: {e}")
+
+    def _evict(self):
+        """Usuwa najdawniej używane wpisy ponad max_entries."""
+        model = self._entry_model()
+
+        overflow = model.objects.count() - self.max_entries
+        if overflow <= 0:
+            return
+
+        stale_ids = list(
+            model.objects.order_by('last_used', 'id').values_list('id', flat=True)[:overflow]
+        )
+        model.objects.filter(id__in=stale_ids).delete()
+        logger.info(f"Evicted {len(stale_ids)} {self.label} entries")
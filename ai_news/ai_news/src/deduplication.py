@@ -1,6 +1,10 @@
+from dataclasses import dataclass
+from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 import logging
+import numpy as np
 from django.conf import settings
+from django.utils.dateparse import parse_datetime
 
 # LangChain imports - zintegrowane z OpenAI i Qdrant dla Python 3.12
 from langchain_openai import OpenAIEmbeddings
@@ -8,11 +12,50 @@ from langchain_core.documents import Document
 from langchain_qdrant import QdrantVectorStore
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+from qdrant_client.models import Distance, VectorParams, PointStruct, PointIdsList, PayloadSchemaType
+
+from .embedding_cache import EmbeddingCache
 
 # Logger dla systemu deduplikacji
 logger = logging.getLogger(__name__)
 
+# Rozmiary wektorów znanych modeli OpenAI (bez próbnego API call)
+OPENAI_EMBEDDING_SIZES = {
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "text-embedding-ada-002": 1536,
+}
+
+# Indexed numeric payload field dla time-windowed dedup (epoch seconds)
+PUBLISHED_TS_FIELD = f"{QdrantVectorStore.METADATA_KEY}.published_ts"
+
+# Nazwy EMBEDDING_BACKEND wybierające lokalny sentence-transformers model
+LOCAL_EMBEDDING_BACKENDS = ("sentence-transformers", "sentence_transformers", "local")
+
+
+
+@dataclass
+class ArticleHit:
+    """Lightweight search result zbudowany z payload indeksu (bez DB round-trip)."""
+    article_id: int
+    title: str
+    source: str
+    url: str
+    published_date: Optional[datetime]
+    score: float
+    
+    @classmethod
+    def from_metadata(cls, metadata: Dict, score: float) -> "ArticleHit":
+        published = metadata.get("published_date")
+        return cls(
+            article_id=metadata.get("article_id"),
+            title=metadata.get("title", ""),
+            source=metadata.get("source", ""),
+            url=metadata.get("url", ""),
+            published_date=published if isinstance(published, datetime) else parse_datetime(published or ""),
+            score=score
+        )
+
 
 class VectorDeduplicator:
     """
@@ -52,7 +95,12 @@ class VectorDeduplicator:
                  similarity_threshold: float = 0.85,
                  model: str = "text-embedding-3-small",
                  qdrant_client=None,
-                 embeddings=None):
+                 embeddings=None,
+                 embedding_batch_size: int = 64,
+                 embedding_cache=None,
+                 embedding_cache_max_entries: Optional[int] = None,
+                 embedding_backend: Optional[str] = None,
+                 dedup_window_days: Optional[int] = None):
         """
         Inicjalizuje VectorDeduplicator z konfiguracją Qdrant i OpenAI.
         
@@ -70,6 +118,13 @@ class VectorDeduplicator:
             model: Model OpenAI embeddings (default "text-embedding-3-small")
             qdrant_client: Injected Qdrant client (optional)
             embeddings: Injected OpenAI embeddings (optional)
+            embedding_batch_size: Teksty per embed_documents() call w batch API (default 64)
+            embedding_cache: Injected EmbeddingCache (optional)
+            embedding_cache_max_entries: Limit wpisów cache; None = z AppConfig, 0 = wyłączony
+            embedding_backend: "openai" lub "sentence-transformers" (lokalny CPU model);
+                               None = z AppConfig. Ignorowany gdy embeddings jest injected
+            dedup_window_days: Duplikaty szukane tylko wśród artykułów published_date ± N dni
+                               (0 = cała kolekcja); None = z AppConfig
             
         Note:
             Automatically tworzy kolekcję Qdrant jeśli nie istnieje.
@@ -94,22 +149,73 @@ class VectorDeduplicator:
             
         self.collection_name = collection_name
         self.similarity_threshold = similarity_threshold
+        self.embedding_batch_size = max(1, embedding_batch_size)
+        self._setup_embeddings(model, embeddings, embedding_backend,
+                               embedding_cache, embedding_cache_max_entries)
+        self._setup_dedup_window(dedup_window_days)
+        
+        # Zapewniamy że kolekcja Qdrant istnieje
+        self._ensure_collection_exists()
         
+        # Inicjalizujemy LangChain Qdrant vector store dla unified interface
+        self.vector_store = QdrantVectorStore(
+            client=self.client,
+            collection_name=self.collection_name,
+            embedding=self.embeddings
+        )
+    
+    def _setup_embeddings(self, model: str, embeddings, embedding_backend: Optional[str],
+                          embedding_cache, embedding_cache_max_entries: Optional[int]):
+        """
+        Konfiguruje embeddings backend, rozmiar wektora, EmbeddingCache i text splitter.
+        
+        Wspólne dla wszystkich vector store backends (Qdrant, FAISS) - argumenty
+        jak w __init__().
+        """
         # Use injected embeddings or create new ones
         if embeddings is not None:
             self.embeddings = embeddings
         else:
             from ..core.config import get_app_config
             config = get_app_config()
-            import os
-            # Set OpenAI API key directly in environment to avoid parameter conflicts
-            os.environ["OPENAI_API_KEY"] = config.openai_api_key
+            backend = (embedding_backend or config.embedding_backend).lower()
             
-            # Initialize without passing api_key parameter to avoid version conflicts
-            self.embeddings = OpenAIEmbeddings(
-                model=model
+            if backend in LOCAL_EMBEDDING_BACKENDS:
+                # Lokalny sentence-transformers model na CPU - bez API calls
+                from .local_embeddings import SentenceTransformerEmbeddings
+                self.embeddings = SentenceTransformerEmbeddings(
+                    model=config.local_embedding_model,
+                    device=config.local_embedding_device,
+                    batch_size=self.embedding_batch_size
+                )
+            else:
+                import os
+                # Set OpenAI API key directly in environment to avoid parameter conflicts
+                os.environ["OPENAI_API_KEY"] = config.openai_api_key
+                
+                # Initialize without passing api_key parameter to avoid version conflicts
+                self.embeddings = OpenAIEmbeddings(
+                    model=model
+                )
+        
+        # Rozmiar wektorów zależy od backendu - kolekcja jest tworzona pod ten rozmiar
+        self.embedding_size = self._detect_embedding_size()
+        
+        # Persistent cache (model, content_hash) -> vector, konsultowany przed API call
+        if embedding_cache is not None:
+            self.embedding_cache = embedding_cache
+        else:
+            if embedding_cache_max_entries is None:
+                from ..core.config import get_app_config
+                embedding_cache_max_entries = get_app_config().embedding_cache_max_entries
+            self.embedding_cache = EmbeddingCache(
+                model_name=getattr(self.embeddings, 'model', None) or model,
+                max_entries=embedding_cache_max_entries
             )
-        self.embedding_size = 1536  # Rozmiar wektorów dla text-embedding-3-small
+        
+        # Format binary storage embeddings w DB (float32 lub float16)
+        from ..core.config import get_app_config
+        self.embedding_storage_dtype = get_app_config().embedding_storage_dtype
         
         # Text splitter dla długich dokumentów - intelligent chunking
         self.text_splitter = RecursiveCharacterTextSplitter(
@@ -117,16 +223,41 @@ class VectorDeduplicator:
             chunk_overlap=100,   # Overlap między chunkami dla kontekstu
             separators=["\n\n", "\n", ".", "!", "?", ",", " ", ""]  # Hierarchical splitting
         )
+    
+    def _setup_dedup_window(self, dedup_window_days: Optional[int]):
+        """Ustala dedup window (0 = bez filtra czasowego)."""
+        if dedup_window_days is None:
+            from ..core.config import get_app_config
+            dedup_window_days = get_app_config().dedup_window_days
+        self.dedup_window_days = max(0, dedup_window_days)
+    
+    def _time_range(self, article) -> Optional[Tuple[float, float]]:
+        """(od, do) published_ts kandydatów na duplikat artykułu albo None (bez okna)."""
+        published = getattr(article, 'published_date', None)
+        if not self.dedup_window_days or not isinstance(published, datetime):
+            return None
+        window = self.dedup_window_days * 86400
+        return published.timestamp() - window, published.timestamp() + window
+    
+    def _detect_embedding_size(self) -> int:
+        """
+        Wykrywa rozmiar wektora dla aktualnego embeddings backend.
         
-        # Zapewniamy że kolekcja Qdrant istnieje
-        self._ensure_collection_exists()
+        Kolejność: atrybut dimension backendu (sentence-transformers), znane
+        modele OpenAI, a na końcu próbny embedding (jeden call).
         
-        # Inicjalizujemy LangChain Qdrant vector store dla unified interface
-        self.vector_store = QdrantVectorStore(
-            client=self.client,
-            collection_name=self.collection_name,
-            embedding=self.embeddings
-        )
+        Returns:
+            int: Liczba wymiarów wektora
+        """
+        dimension = getattr(self.embeddings, 'dimension', None)
+        if isinstance(dimension, int) and dimension > 0:
+            return dimension
+        
+        model_name = getattr(self.embeddings, 'model', None)
+        if model_name in OPENAI_EMBEDDING_SIZES:
+            return OPENAI_EMBEDDING_SIZES[model_name]
+        
+        return len(self.embeddings.embed_query("dimension probe"))
     
     def _ensure_collection_exists(self):
         """
@@ -136,8 +267,9 @@ class VectorDeduplicator:
         Jeśli nie, tworzy nową kolekcję z odpowiednimi parametrami wektorów.
         
         Konfiguracja kolekcji:
-        - Vector size: 1536 (text-embedding-3-small)
+        - Vector size: embedding_size (1536 dla text-embedding-3-small, 384 dla all-MiniLM-L6-v2)
         - Distance metric: Cosine similarity
+        - Payload index: metadata.published_ts (FLOAT) dla dedup window
         - Optimized for semantic search
         
         Wywoływana przez:
@@ -152,19 +284,43 @@ class VectorDeduplicator:
             collection_names = [col.name for col in collections.collections]
             
             # Sprawdzamy czy nasza kolekcja już istnieje
-            if self.collection_name not in collection_names:
+            if self.collection_name in collection_names:
+                existing_size = self._get_collection_vector_size()
+                if existing_size is not None and existing_size != self.embedding_size:
+                    logger.error(
+                        f"Qdrant collection '{self.collection_name}' has {existing_size}d vectors but "
+                        f"embedding backend produces {self.embedding_size}d - use a separate "
+                        f"QDRANT_COLLECTION_NAME per embedding model"
+                    )
+            else:
                 # Tworzymy nową kolekcję z cosine similarity dla semantic search
                 self.client.create_collection(
                     collection_name=self.collection_name,
                     vectors_config=VectorParams(
-                        size=self.embedding_size,  # 1536 dla text-embedding-3-small
+                        size=self.embedding_size,  # Wykryty z embeddings backend
                         distance=Distance.COSINE    # Najlepsze dla semantic similarity
                     )
                 )
                 logger.info(f"Created Qdrant collection: {self.collection_name}")
+            
+            # Payload index dla filtra dedup window - istniejące kolekcje też go dostają
+            self.client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name=PUBLISHED_TS_FIELD,
+                field_schema=PayloadSchemaType.FLOAT
+            )
         except Exception as e:
             logger.error(f"Error creating Qdrant collection: {e}")
     
+    def _get_collection_vector_size(self) -> Optional[int]:
+        """Vector size istniejącej kolekcji (None gdy nie da się odczytać)."""
+        try:
+            vectors = self.client.get_collection(self.collection_name).config.params.vectors
+            size = getattr(vectors, 'size', None)
+            return size if isinstance(size, int) else None
+        except Exception:
+            return None
+    
     def _generate_embedding(self, text: str) -> List[float]:
         """
         Generuje embedding vector dla podanego tekstu używając OpenAI API.
@@ -216,7 +372,7 @@ class VectorDeduplicator:
         content = self._create_searchable_text(article)
         
         # Tworzymy Document z comprehensive metadata
-        return Document(
+        document = Document(
             page_content=content,
             metadata={
                 "article_id": article.id,           # ID dla referencji
@@ -227,13 +383,20 @@ class VectorDeduplicator:
                 "content_hash": article.content_hash  # Hash dla exact deduplication
             }
         )
+        if isinstance(article.published_date, datetime):
+            # Numeric timestamp dla range filter (dedup window)
+            document.metadata["published_ts"] = article.published_date.timestamp()
+        return document
     
-    def find_similar_articles(self, article, limit: int = 5) -> List[Tuple]:
+    def find_similar_articles(self, article, limit: int = 5,
+                              vector: Optional[List[float]] = None) -> List[Tuple]:
         """
-        Znajduje semantycznie podobne artykuły używając LangChain vector search.
+        Znajduje semantycznie podobne artykuły w vector index.
         
         Główna metoda do wykrywania duplikatów semantycznych. Konwertuje artykuł
-        na embedding i przeszukuje vector store w poszukiwaniu podobnych treści.
+        na embedding i przeszukuje Qdrant w poszukiwaniu podobnych treści.
+        Gdy caller ma już embedding (np. DuplicationService), przekazuje go
+        przez vector i artykuł nie jest embedowany ponownie.
         
         Wykorzystywana przez:
         - DuplicationService.process_article_for_duplicates() - wykrywanie duplikatów
@@ -243,87 +406,295 @@ class VectorDeduplicator:
         Args:
             article: NewsArticle object do porównania
             limit: Maksymalna liczba podobnych artykułów do zwrócenia (default 5)
+            vector: Gotowy embedding artykułu (optional)
             
         Returns:
-            List[Tuple]: Lista tupli (Document, similarity_score) dla podobnych artykułów
+            List[Tuple]: Lista tupli (NewsArticle, similarity_score) dla podobnych artykułów
                         Posortowana według similarity score (malejąco)
                         
         Note:
             Używa similarity_threshold (default 0.85) do filtrowania wyników.
             Score 1.0 = identyczne, 0.0 = kompletnie różne.
         """
-        from ..models import NewsArticle
-        
         try:
-            query_text = self._create_searchable_text(article)
-            
-            # Używamy LangChain similarity search z relevance scores
-            # score_threshold filtruje wyniki poniżej naszego progu (default 85%)
-            similar_docs = self.vector_store.similarity_search_with_relevance_scores(
-                query=query_text,
-                k=limit,
-                score_threshold=self.similarity_threshold
-            )
-            
-            # Konwertujemy Documents z powrotem na NewsArticle objects
-            similar_articles = []
-            for doc, relevance_score in similar_docs:
-                try:
-                    article_id = doc.metadata.get("article_id")
-                    # Pomijamy ten sam artykuł i invalid IDs
-                    if article_id and article_id != article.id:
-                        similar_article = NewsArticle.objects.get(id=article_id)
-                        similar_articles.append((similar_article, relevance_score))
-                except (NewsArticle.DoesNotExist, ValueError):
-                    # Graceful handling missing articles (mogły być usunięte)
-                    continue
-            
-            return similar_articles
+            if vector is None:
+                vector = self.embed_articles([article])[0]
+            return self._search_by_vectors([article], [vector], limit)[0]
             
         except Exception as e:
             logger.error(f"Error searching for similar articles: {e}")
             return []
     
-    def add_article_to_index(self, article) -> bool:
-        """Add article to vector index using LangChain"""
-        try:
-            document = self._create_document(article)
-            
-            # Add to vector store with unique ID
-            ids = [str(article.id)]
-            self.vector_store.add_documents(documents=[document], ids=ids)
-            
-            # Store embedding for later use (optional)
-            try:
-                embedding = self.embeddings.embed_query(document.page_content)
-                article.embedding_vector = embedding
-                article.save(update_fields=['embedding_vector'])
-            except Exception as embed_error:
-                logger.warning(f"Could not store embedding: {embed_error}")
-            
-            logger.info(f"Added article to vector index: {article.title}")
-            return True
+    def add_article_to_index(self, article, vector: Optional[List[float]] = None) -> bool:
+        """
+        Add article to vector index, embedding it at most once.
+        
+        Ten sam wektor idzie do Qdrant upsert i do ArticleEmbedding w DB
+        (wcześniej add_documents embedował tekst, a potem embed_query drugi raz).
+        
+        Args:
+            article: Zapisany NewsArticle object
+            vector: Gotowy embedding z wcześniejszego kroku pipeline (optional)
             
+        Returns:
+            bool: True gdy artykuł trafił do indeksu
+        """
+        try:
+            if vector is None:
+                vector = self.embed_articles([article])[0]
         except Exception as e:
             logger.error(f"Error adding article to index: {e}")
             return False
+        
+        return self.index_articles([article], vectors=[vector]) == 1
     
-    def check_and_mark_duplicates(self, article) -> bool:
-        """Check for duplicates and mark them"""
-        similar_articles = self.find_similar_articles(article)
+    def check_and_mark_duplicates(self, article, vector: Optional[List[float]] = None) -> bool:
+        """Check for duplicates and mark them (vector: optional precomputed embedding)"""
+        similar_articles = self.find_similar_articles(article, vector=vector)
         
         if similar_articles:
             original_article, similarity_score = similar_articles[0]
-            article.is_duplicate = True
-            article.duplicate_of = original_article
-            article.save(update_fields=['is_duplicate', 'duplicate_of'])
-            
-            logger.info(f"Marked article as duplicate: {article.title} "
-                       f"(similar to: {original_article.title}, score: {similarity_score:.3f})")
+            self.mark_as_duplicate(article, original_article, similarity_score)
             return True
         
         return False
     
+    def mark_as_duplicate(self, article, original_article, similarity_score: float):
+        """Mark article as semantic duplicate of original_article"""
+        article.is_duplicate = True
+        article.duplicate_of = original_article
+        article.save(update_fields=['is_duplicate', 'duplicate_of'])
+        
+        logger.info(f"Marked article as duplicate: {article.title} "
+                   f"(similar to: {original_article.title}, score: {similarity_score:.3f})")
+    
+    def embed_articles(self, articles: List) -> List[List[float]]:
+        """
+        Generuje embeddings dla wielu artykułów przez embed_documents() w chunkach.
+        
+        Najpierw konsultuje EmbeddingCache po (model, content_hash) - do OpenAI idą
+        tylko teksty bez cached vector, jeden round-trip per embedding_batch_size
+        artykułów zamiast jednego embed_query() per artykuł.
+        
+        Args:
+            articles: NewsArticle objects (title + content)
+            
+        Returns:
+            List[List[float]]: Wektory w kolejności articles
+        """
+        hashes = [article.content_hash if isinstance(getattr(article, 'content_hash', None), str) else None
+                  for article in articles]
+        cached = self.embedding_cache.get_many(hashes)
+        vectors = [cached.get(content_hash) if content_hash else None for content_hash in hashes]
+        
+        missing = [position for position, vector in enumerate(vectors) if vector is None]
+        for start in range(0, len(missing), self.embedding_batch_size):
+            chunk = missing[start:start + self.embedding_batch_size]
+            texts = [self._create_searchable_text(articles[position]) for position in chunk]
+            for position, vector in zip(chunk, self.embeddings.embed_documents(texts)):
+                vectors[position] = vector
+        
+        if missing:
+            self.embedding_cache.set_many({
+                hashes[position]: vectors[position] for position in missing if hashes[position]
+            })
+        return vectors
+    
+    def find_similar_batch(self, articles: List, limit: int = 5,
+                           vectors: Optional[List[List[float]]] = None) -> List[List[Tuple]]:
+        """
+        Batch wariant find_similar_articles() - jeden embedding call per chunk
+        i jeden Qdrant query_batch_points zamiast search per artykuł.
+        
+        Args:
+            articles: NewsArticle objects do porównania
+            limit: Maksymalna liczba podobnych artykułów per article (default 5)
+            vectors: Gotowe embeddings (np. z embed_articles()) - pomija embedding call
+            
+        Returns:
+            List[List[Tuple]]: Dla każdego article lista (NewsArticle, relevance_score)
+                              powyżej similarity_threshold, malejąco po score.
+                              Puste listy przy błędzie (jak find_similar_articles)
+        """
+        if not articles:
+            return []
+        
+        try:
+            if vectors is None:
+                vectors = self.embed_articles(articles)
+            return self._search_by_vectors(articles, vectors, limit)
+            
+        except Exception as e:
+            logger.error(f"Error batch searching for similar articles: {e}")
+            return [[] for _ in articles]
+    
+    def _search_by_vectors(self, articles: List, vectors: List[List[float]], limit: int) -> List[List[Tuple]]:
+        """
+        Jeden batch search w indeksie dla gotowych wektorów + jeden in_bulk dla trafień.
+        
+        Przy dedup window każdy artykuł jest porównywany tylko z artykułami
+        opublikowanymi w published_date ± dedup_window_days.
+        
+        Returns:
+            List[List[Tuple]]: Per article lista (NewsArticle, relevance_score) bez samego artykułu
+        """
+        from ..models import NewsArticle
+        
+        time_ranges = [self._time_range(article) for article in articles]
+        hits = self._query_index(vectors, limit, time_ranges=time_ranges)
+        
+        # Jeden query dla wszystkich trafionych artykułów
+        article_ids = {article_id for row in hits for article_id, _ in row if article_id}
+        articles_by_id = NewsArticle.objects.in_bulk(list(article_ids))
+        
+        return [
+            [(articles_by_id[article_id], score) for article_id, score in row
+             if article_id and article_id != article.id and article_id in articles_by_id
+             and self._in_time_range(articles_by_id[article_id], time_range)]
+            for article, row, time_range in zip(articles, hits, time_ranges)
+        ]
+    
+    @staticmethod
+    def _in_time_range(article, time_range: Optional[Tuple[float, float]]) -> bool:
+        """Okno na published_date z DB - dla punktów Qdrant bez published_ts i jako safety net."""
+        if time_range is None or not isinstance(article.published_date, datetime):
+            return True
+        return time_range[0] <= article.published_date.timestamp() <= time_range[1]
+    
+    def _query_index(self, vectors: List[List[float]], limit: int,
+                     apply_threshold: bool = True,
+                     time_ranges: Optional[List[Optional[Tuple[float, float]]]] = None) -> List[List[Tuple[int, float]]]:
+        """
+        Batch search w indeksie dla wielu wektorów.
+        
+        Args:
+            vectors: Query embeddings
+            limit: Max trafień per wektor
+            apply_threshold: Filtr similarity_threshold (False = top-k bez progu)
+            time_ranges: Per wektor (od, do) published_ts albo None (bez filtra)
+            
+        Returns:
+            List[List[Tuple[int, float]]]: Per wektor lista (article_id, relevance_score)
+        """
+        return [
+            [(metadata.get("article_id"), score) for metadata, score in row]
+            for row in self._query_payloads(vectors, limit, apply_threshold, time_ranges)
+        ]
+    
+    def _query_payloads(self, vectors: List[List[float]], limit: int,
+                        apply_threshold: bool = True,
+                        time_ranges: Optional[List[Optional[Tuple[float, float]]]] = None) -> List[List[Tuple[Dict, float]]]:
+        """
+        Jeden Qdrant query_batch_points dla wielu wektorów.
+        
+        Time range to filtr na indexed metadata.published_ts - search obejmuje tylko
+        okno czasowe, więc koszt lookup nie rośnie z rozmiarem archiwum. Punkty
+        zindeksowane przed dodaniem published_ts (brak pola) nie są odrzucane przez
+        filtr - okno stosuje dla nich _in_time_range() na published_date z DB.
+        
+        Returns:
+            List[List[Tuple[Dict, float]]]: Per wektor lista (payload metadata, relevance_score)
+        """
+        from qdrant_client.models import (
+            QueryRequest, Filter, FieldCondition, Range, IsEmptyCondition, PayloadField
+        )
+        
+        # Qdrant zwraca surowe cosine similarity - threshold przeliczamy na tę skalę
+        raw_threshold = 2.0 * self.similarity_threshold - 1.0 if apply_threshold else None
+        requests = []
+        for position, vector in enumerate(vectors):
+            time_range = time_ranges[position] if time_ranges else None
+            query_filter = Filter(should=[
+                FieldCondition(key=PUBLISHED_TS_FIELD, range=Range(gte=time_range[0], lte=time_range[1])),
+                IsEmptyCondition(is_empty=PayloadField(key=PUBLISHED_TS_FIELD))
+            ]) if time_range else None
+            requests.append(QueryRequest(query=vector, limit=limit, score_threshold=raw_threshold,
+                                         filter=query_filter, with_payload=True))
+        responses = self.client.query_batch_points(
+            collection_name=self.collection_name,
+            requests=requests
+        )
+        
+        return [
+            [((point.payload or {}).get(QdrantVectorStore.METADATA_KEY) or {}, self._relevance_score(point.score))
+             for point in response.points]
+            for response in responses
+        ]
+    
+    def _upsert_vectors(self, articles: List, vectors: List[List[float]]):
+        """
+        Qdrant batch upsert w chunkach embedding_batch_size.
+        
+        Payload ma ten sam układ co LangChain QdrantVectorStore (page_content + metadata),
+        więc search_similar_content() przez vector_store widzi te punkty.
+        """
+        points = []
+        for article, vector in zip(articles, vectors):
+            document = self._create_document(article)
+            points.append(PointStruct(
+                id=article.id,
+                vector=vector,
+                payload={
+                    QdrantVectorStore.CONTENT_KEY: document.page_content,
+                    QdrantVectorStore.METADATA_KEY: document.metadata,
+                }
+            ))
+        
+        for start in range(0, len(points), self.embedding_batch_size):
+            self.client.upsert(
+                collection_name=self.collection_name,
+                points=points[start:start + self.embedding_batch_size]
+            )
+    
+    def index_articles(self, articles: List, vectors: Optional[List[List[float]]] = None) -> int:
+        """
+        Batch wariant add_article_to_index() - embed_documents w chunkach i batch upsert
+        do indeksu (_upsert_vectors). Embeddings są zapisywane jako binary blob w ArticleEmbedding
+        jednym bulk upsert.
+        
+        Args:
+            articles: Zapisane NewsArticle objects (wymagane article.id)
+            vectors: Gotowe embeddings (np. z embed_articles()) - pomija embedding call
+            
+        Returns:
+            int: Liczba zaindeksowanych artykułów (0 przy błędzie)
+        """
+        from ..models import ArticleEmbedding
+        
+        if not articles:
+            return 0
+        
+        try:
+            if vectors is None:
+                vectors = self.embed_articles(articles)
+            
+            self._upsert_vectors(articles, vectors)
+            
+            # Store embeddings for later use (optional)
+            try:
+                ArticleEmbedding.store_many(
+                    {article.id: vector for article, vector in zip(articles, vectors)},
+                    dtype=self.embedding_storage_dtype
+                )
+            except Exception as embed_error:
+                logger.warning(f"Could not store embeddings: {embed_error}")
+            
+            logger.info(f"Added {len(articles)} articles to vector index")
+            return len(articles)
+            
+        except Exception as e:
+            logger.error(f"Error batch adding articles to index: {e}")
+            return 0
+    
+    @staticmethod
+    def _relevance_score(score: float) -> float:
+        """Cosine similarity → relevance [0, 1] (ta sama normalizacja co LangChain QdrantVectorStore)"""
+        return (score + 1.0) / 2.0
+    
+    def flush(self):
+        """Persistuje zmiany indeksu po batchu - Qdrant zapisuje server-side, więc no-op (FAISS nadpisuje)."""
+        pass
+    
     def remove_article_from_index(self, article_id: int):
         """Remove article from vector index"""
         try:
@@ -336,32 +707,70 @@ class VectorDeduplicator:
         except Exception as e:
             logger.error(f"Error removing article from index: {e}")
     
-    def search_similar_content(self, query: str, limit: int = 5) -> List:
-        """Search for content similar to query"""
-        from ..models import NewsArticle
+    def remove_articles_from_index(self, article_ids: List[int]) -> bool:
+        """
+        Remove many articles z vector index jednym delete call (PointIdsList selector).
         
+        Używane przez retention engine - jeden request per chunk zamiast per article.
+        
+        Returns:
+            bool: True gdy delete się powiódł
+        """
+        if not article_ids:
+            return True
         try:
-            similar_docs = self.vector_store.similarity_search(
-                query=query,
-                k=limit
+            self.client.delete(
+                collection_name=self.collection_name,
+                points_selector=PointIdsList(points=list(article_ids))
             )
+            logger.info(f"Removed {len(article_ids)} articles from vector index")
+            return True
+        except Exception as e:
+            logger.error(f"Error removing {len(article_ids)} articles from index: {e}")
+            return False
+    
+    def search_similar_content(self, query: str, limit: int = 5, payload_only: bool = False) -> List:
+        """
+        Search for content similar to query (top-k, kolejność po score).
+        
+        Trafienia są ładowane jednym in_bulk zamiast get() per hit. Z payload_only=True
+        zwraca ArticleHit (title, source, url, published_date, score) wprost z payload
+        indeksu - bez zapytania do bazy.
+        
+        Args:
+            query: Natural language query
+            limit: Maksymalna liczba wyników (default 5)
+            payload_only: ArticleHit zamiast NewsArticle objects
             
-            similar_articles = []
-            for doc in similar_docs:
-                try:
-                    article_id = doc.metadata.get("article_id")
-                    if article_id:
-                        article = NewsArticle.objects.get(id=article_id)
-                        similar_articles.append(article)
-                except (NewsArticle.DoesNotExist, ValueError):
-                    continue
+        Returns:
+            List: NewsArticle objects lub ArticleHit, malejąco po similarity
+        """
+        try:
+            vector = self.embeddings.embed_query(query)
+            
+            if payload_only:
+                return [
+                    ArticleHit.from_metadata(metadata, score)
+                    for metadata, score in self._query_payloads([vector], limit, apply_threshold=False)[0]
+                    if metadata.get("article_id")
+                ]
             
-            return similar_articles
+            article_ids = [article_id for article_id, _ in self._query_index([vector], limit, apply_threshold=False)[0]]
+            return self._articles_in_order(article_ids)
             
         except Exception as e:
             logger.error(f"Error searching similar content: {e}")
             return []
     
+    @staticmethod
+    def _articles_in_order(article_ids: List[int]) -> List:
+        """Jeden in_bulk query; wynik w kolejności article_ids (pomija usunięte)."""
+        from ..models import NewsArticle
+        
+        article_ids = [article_id for article_id in article_ids if article_id]
+        articles_by_id = NewsArticle.objects.in_bulk(article_ids)
+        return [articles_by_id[article_id] for article_id in article_ids if article_id in articles_by_id]
+    
     def get_collection_info(self) -> Dict:
         """Get collection information"""
         try:
@@ -378,6 +787,32 @@ class VectorDeduplicator:
             return {}
 
 
+def create_vector_deduplicator(vector_store_backend: Optional[str] = None, **kwargs) -> VectorDeduplicator:
+    """
+    Tworzy VectorDeduplicator dla wybranego vector store backend.
+    
+    Args:
+        vector_store_backend: "qdrant" (default) lub "faiss" (in-process index na dysku);
+                              None = AppConfig.vector_store_backend
+        **kwargs: Argumenty VectorDeduplicator (qdrant_* są ignorowane dla FAISS)
+        
+    Returns:
+        VectorDeduplicator: Qdrant-backed lub FaissVectorDeduplicator
+    """
+    from ..core.config import get_app_config
+    config = get_app_config()
+    backend = (vector_store_backend or config.vector_store_backend).lower()
+    
+    if backend == "faiss":
+        from .faiss_store import FaissVectorDeduplicator
+        for key in ("qdrant_url", "qdrant_api_key", "qdrant_host", "qdrant_port", "qdrant_client"):
+            kwargs.pop(key, None)
+        kwargs.setdefault("index_path", config.faiss_index_path)
+        return FaissVectorDeduplicator(**kwargs)
+    
+    return VectorDeduplicator(**kwargs)
+
+
 class ContentHashDeduplicator:
     """Simple content hash-based deduplication"""
     
@@ -395,6 +830,25 @@ class ContentHashDeduplicator:
             logger.error(f"Error finding hash duplicates: {e}")
             return None
     
+    @staticmethod
+    def find_hash_duplicates_batch(articles: List) -> Dict:
+        """Map article.id -> existing article with the same content_hash (one query)"""
+        from ..models import NewsArticle
+        
+        try:
+            existing = NewsArticle.objects.filter(
+                content_hash__in=[article.content_hash for article in articles]
+            ).exclude(id__in=[article.id for article in articles])
+            by_hash = {}
+            for original in existing:
+                by_hash.setdefault(original.content_hash, original)
+            
+            return {article.id: by_hash[article.content_hash]
+                    for article in articles if article.content_hash in by_hash}
+        except Exception as e:
+            logger.error(f"Error finding hash duplicates: {e}")
+            return {}
+    
     @staticmethod
     def mark_as_hash_duplicate(article, original):
         article.is_duplicate = True
@@ -415,23 +869,32 @@ class DuplicationService:
                  qdrant_port: int = 6333,
                  collection_name: str = "news_articles",
                  vector_deduplicator=None, 
-                 hash_deduplicator=None):
+                 hash_deduplicator=None,
+                 embedding_backend: Optional[str] = None,
+                 near_duplicate_deduplicator=None):
         if vector_deduplicator is not None:
             self.vector_deduplicator = vector_deduplicator
         else:
-            self.vector_deduplicator = VectorDeduplicator(
+            self.vector_deduplicator = create_vector_deduplicator(
                 model=model,
                 qdrant_url=qdrant_url,
                 qdrant_api_key=qdrant_api_key,
                 qdrant_host=qdrant_host,
                 qdrant_port=qdrant_port,
-                collection_name=collection_name
+                collection_name=collection_name,
+                embedding_backend=embedding_backend
             )
             
         if hash_deduplicator is not None:
             self.hash_deduplicator = hash_deduplicator
         else:
             self.hash_deduplicator = ContentHashDeduplicator()
+        
+        if near_duplicate_deduplicator is not None:
+            self.near_duplicate_deduplicator = near_duplicate_deduplicator
+        else:
+            from .near_duplicates import MinHashDeduplicator
+            self.near_duplicate_deduplicator = MinHashDeduplicator()
     
     def process_article_for_duplicates(self, article) -> bool:
         """Process article for both hash and semantic duplicates"""
@@ -443,25 +906,180 @@ class DuplicationService:
             logger.info(f"Article '{article.title[:60]}...' rejected - exact match duplicate with ID {hash_duplicate.id}")
             return True
         
+        # Lekko edytowane kopie (MinHash + LSH) - bez embedding call
+        near_duplicate = self.near_duplicate_deduplicator.find_near_duplicate(article)
+        if near_duplicate:
+            original, similarity = near_duplicate
+            self.near_duplicate_deduplicator.mark_as_near_duplicate(article, original, similarity)
+            logger.info(f"Article '{article.title[:60]}...' rejected - near duplicate of ID {original.id}")
+            return True
+        
+        # Embedding liczony raz - reużywany przez search, Qdrant upsert i ArticleEmbedding
+        try:
+            vector = self.vector_deduplicator.embed_articles([article])[0]
+        except Exception as e:
+            logger.error(f"Error generating embedding: {e}")
+            vector = None
+        
         # Then check for semantic duplicates using LangChain + OpenAI
-        if self.vector_deduplicator.check_and_mark_duplicates(article):
+        if self.vector_deduplicator.check_and_mark_duplicates(article, vector=vector):
             logger.info(f"Article '{article.title[:60]}...' rejected - semantic similarity duplicate")
             return True
         
         # If no duplicates found, add to vector index for future comparisons
-        self.vector_deduplicator.add_article_to_index(article)
+        self.vector_deduplicator.add_article_to_index(article, vector=vector)
+        self.near_duplicate_deduplicator.index_articles([article])
         logger.info(f"Article '{article.title[:60]}...' accepted as unique")
         return False
     
-    def get_unique_articles(self, limit: Optional[int] = None) -> List:
-        """Get unique (non-duplicate) articles"""
+    def process_articles_for_duplicates(self, articles: List) -> List[bool]:
+        """
+        Batch pipeline for saved articles; returns is_duplicate flag per article (same order).
+        
+        One hash query, one MinHash band query, chunked embed_documents (tylko dla artykułów
+        bez exact/near duplicate), one Qdrant batch search and batch upsert.
+        Articles w tym samym batchu nie są jeszcze w indeksie, więc najpierw są klastrowane
+        między sobą (_cluster_batch) - do Qdrant idą tylko leaderzy klastrów.
+        """
+        if not articles:
+            return []
+        
+        flags = [False] * len(articles)
+        
+        # First check for exact hash duplicates (faster)
+        hash_duplicates = self.hash_deduplicator.find_hash_duplicates_batch(articles)
+        candidates = []
+        for position, article in enumerate(articles):
+            original = hash_duplicates.get(article.id)
+            if original is not None:
+                self.hash_deduplicator.mark_as_hash_duplicate(article, original)
+                logger.info(f"Article '{article.title[:60]}...' rejected - exact match duplicate with ID {original.id}")
+                flags[position] = True
+            else:
+                candidates.append(position)
+        
+        # Then lexical near duplicates - lekko edytowane kopie nie idą do embeddings
+        near_duplicates = self.near_duplicate_deduplicator.find_near_duplicates_batch(
+            [articles[position] for position in candidates]
+        )
+        remaining = []
+        for position in candidates:
+            article = articles[position]
+            match = near_duplicates.get(article.id)
+            if match is not None:
+                original, similarity = match
+                self.near_duplicate_deduplicator.mark_as_near_duplicate(article, original, similarity)
+                logger.info(f"Article '{article.title[:60]}...' rejected - near duplicate of ID {original.id}")
+                flags[position] = True
+            else:
+                remaining.append(position)
+        candidates = remaining
+        
+        if not candidates:
+            return flags
+        
+        vector_deduplicator = self.vector_deduplicator
+        candidate_articles = [articles[position] for position in candidates]
+        try:
+            vectors = vector_deduplicator.embed_articles(candidate_articles)
+        except Exception as e:
+            logger.error(f"Error generating embeddings for batch: {e}")
+            return flags
+        
+        # Intra-batch clustering przed Qdrant - kopie tego samego newsa z kilku feedów
+        clusters = self._cluster_batch(candidate_articles, vectors)
+        representatives = [index for index, (leader, _) in enumerate(clusters) if leader == index]
+        
+        # Then check for semantic duplicates against the index (tylko representatives)
+        similar = vector_deduplicator.find_similar_batch(
+            [candidate_articles[index] for index in representatives],
+            vectors=[vectors[index] for index in representatives]
+        )
+        index_matches = {index: (matches[0] if matches else None)
+                         for index, matches in zip(representatives, similar)}
+        
+        accepted, accepted_vectors = [], []
+        for index, (position, article, vector) in enumerate(zip(candidates, candidate_articles, vectors)):
+            try:
+                leader, similarity_score = clusters[index]
+                if leader != index:
+                    # Duplikat wcześniejszego artykułu z batcha - wskazujemy na jego oryginał
+                    leader_match = index_matches[leader]
+                    match = (leader_match[0] if leader_match else candidate_articles[leader], similarity_score)
+                else:
+                    match = index_matches[index]
+                
+                if match:
+                    original_article, similarity_score = match
+                    vector_deduplicator.mark_as_duplicate(article, original_article, similarity_score)
+                    logger.info(f"Article '{article.title[:60]}...' rejected - semantic similarity duplicate")
+                    flags[position] = True
+                else:
+                    accepted.append(article)
+                    accepted_vectors.append(vector)
+                    logger.info(f"Article '{article.title[:60]}...' accepted as unique")
+            except Exception as e:
+                # Error isolation - jeden article nie zatrzymuje batcha
+                logger.error(f"Error processing article {article.id} for duplicates: {e}")
+        
+        # If no duplicates found, add to vector index for future comparisons
+        vector_deduplicator.index_articles(accepted, vectors=accepted_vectors)
+        self.near_duplicate_deduplicator.index_articles(accepted)
+        # Jeden zapis lokalnego indeksu (FAISS) per batch
+        vector_deduplicator.flush()
+        return flags
+    
+    def _cluster_batch(self, articles: List, vectors: List) -> List[Tuple[int, float]]:
+        """
+        Intra-batch duplicate clustering na jednej pairwise cosine similarity matrix (NumPy).
+        
+        Każdy artykuł dołącza do najbardziej podobnego wcześniejszego leadera z batcha
+        (relevance >= similarity_threshold, w dedup window) albo sam zostaje leaderem -
+        ten sam wynik co sekwencyjne index-then-search, ale bez round-trip per artykuł.
+        
+        Returns:
+            List[Tuple[int, float]]: Per article (pozycja leadera, relevance); leader wskazuje na siebie
+        """
+        vector_deduplicator = self.vector_deduplicator
+        count = len(articles)
+        
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.where(norms == 0, 1.0, norms)
+        relevance = (matrix @ matrix.T + 1.0) / 2.0
+        
+        # Kandydaci: tylko wcześniejsze artykuły z batcha powyżej threshold
+        linked = (relevance >= vector_deduplicator.similarity_threshold) & np.tri(count, k=-1, dtype=bool)
+        
+        if vector_deduplicator.dedup_window_days:
+            timestamps = np.array([
+                article.published_date.timestamp() if isinstance(article.published_date, datetime) else np.nan
+                for article in articles
+            ])
+            # NaN (brak daty) nie wyklucza pary - jak _in_time_range()
+            linked &= ~(np.abs(timestamps[:, None] - timestamps[None, :]) > vector_deduplicator.dedup_window_days * 86400)
+        
+        leaders = np.zeros(count, dtype=bool)
+        clusters = []
+        for index in range(count):
+            options = np.flatnonzero(linked[index] & leaders)
+            if options.size:
+                best = int(options[np.argmax(relevance[index, options])])
+                clusters.append((best, float(relevance[index, best])))
+            else:
+                leaders[index] = True
+                clusters.append((index, 1.0))
+        return clusters
+    
+    def get_unique_articles(self, limit: Optional[int] = None, lean: bool = False) -> List:
+        """Get unique (non-duplicate) articles (lean=True - content i embedding_vector deferred)"""
         from ..models import NewsArticle
         
-        queryset = NewsArticle.objects.filter(is_duplicate=False)
+        queryset = (NewsArticle.objects.lean() if lean else NewsArticle.objects).filter(is_duplicate=False)
         if limit:
             queryset = queryset[:limit]
         return list(queryset)
     
-    def search_similar_content(self, query: str, limit: int = 5) -> List:
-        """Search for articles similar to a query"""
-        return self.vector_deduplicator.search_similar_content(query, limit)
\ No newline at end of file
+    def search_similar_content(self, query: str, limit: int = 5, payload_only: bool = False) -> List:
+        """Search for articles similar to a query (payload_only: ArticleHit bez DB round-trip)"""
+        return self.vector_deduplicator.search_similar_content(query, limit, payload_only=payload_only)
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""
+Persistent embedding cache keyed by (model, content_hash).
+
+Embedding zależy tylko od tekstu i modelu, a NewsArticle.content_hash
+(SHA-256 z title + content) już identyfikuje tekst. Cache w lokalnej bazie
+(EmbeddingCacheEntry) pozwala re-indeksować, odbudować kolekcję Qdrant po wipe
+lub przetworzyć repost tej samej treści z innego źródła bez API calls.
+
+Vectors są trzymane jako float32 bytes, a rozmiar cache jest ograniczony
+przez max_entries z eviction najdawniej używanych wpisów (DatabaseLRUCache).
+"""
+from typing import Dict, List
+
+import numpy as np
+
+from .db_lru_cache import DatabaseLRUCache
+
+
+class EmbeddingCache(DatabaseLRUCache):
+    """Size-bounded LRU cache embeddings w tabeli EmbeddingCacheEntry"""
+
+    value_field = 'vector'
+    label = 'embedding cache'
+
+    def __init__(self, model_name: str, max_entries: int = 50000):
+        """
+        Args:
+            model_name: Nazwa modelu embeddings (część klucza - inny model = inny wektor)
+            max_entries: Maksymalna liczba wpisów dla wszystkich modeli (0 = cache wyłączony)
+        """
+        super().__init__(max_entries)
+        self.model_name = model_name
+
+    def _entry_model(self):
+        from ..models import EmbeddingCacheEntry
+        return EmbeddingCacheEntry
+
+    def _key_fields(self) -> Dict[str, str]:
+        return {'model': self.model_name}
+
+    def _decode(self, value) -> List[float]:
+        return np.frombuffer(bytes(value), dtype=np.float32).tolist()
+
+    def _entry_fields(self, vector: List[float]) -> Dict:
+        return {'vector': np.asarray(vector, dtype=np.float32).tobytes(), 'dimension': len(vector)}
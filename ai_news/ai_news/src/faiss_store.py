@@ -0,0 +1,300 @@
+"""
+In-process FAISS vector store dla deduplikacji (alternatywa dla Qdrant).
+
+FaissVectorDeduplicator ma ten sam interfejs co VectorDeduplicator (add, search
+z similarity_threshold, remove by id, collection info), ale każdy lookup jest
+lokalnym exact inner-product search zamiast network call do Qdrant - dla
+single-node deployments bez Qdrant server.
+
+Index (IndexIDMap2 nad IndexFlatIP, ID = NewsArticle.id) jest ładowany przez
+memory-mapping (faiss.IO_FLAG_MMAP). Upsert/remove tylko oznaczają index jako
+dirty - plik jest zapisywany przez flush() raz per batch (DuplicationService,
+retention engine), a niezapisane zmiany najpóźniej przy wyjściu procesu.
+
+Usage:
+    VECTOR_STORE_BACKEND=faiss
+    FAISS_INDEX_PATH=faiss_index/news_articles.faiss
+"""
+import atexit
+import logging
+import os
+import threading
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .deduplication import VectorDeduplicator
+
+logger = logging.getLogger(__name__)
+
+# Instancje z niezapisanymi zmianami są flushowane przy wyjściu procesu
+_open_indexes: "weakref.WeakSet[FaissVectorDeduplicator]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_indexes():
+    for deduplicator in list(_open_indexes):
+        deduplicator.flush()
+
+
+def _import_faiss():
+    """Lazy import - faiss-cpu jest wymagany tylko gdy ten backend jest wybrany."""
+    try:
+        import faiss
+    except ImportError as e:
+        raise ImportError(
+            "faiss-cpu is required for VECTOR_STORE_BACKEND=faiss. "
+            "Install it with: pip install faiss-cpu"
+        ) from e
+    return faiss
+
+
+class FaissVectorDeduplicator(VectorDeduplicator):
+    """
+    VectorDeduplicator z lokalnym FAISS index zamiast Qdrant collection.
+
+    Wektory są L2-normalizowane, więc inner product == cosine similarity
+    i relevance/threshold mają tę samą skalę co w Qdrant backend.
+    IndexFlatIP (exact search) wspiera remove_ids, czego HNSW nie umożliwia.
+
+    Attributes:
+        index_path (str): Plik indeksu (None = tylko w pamięci)
+        index: faiss.IndexIDMap2 z article.id jako ID
+    """
+
+    # FAISS nie ma payload filter - przy dedup window search pobiera więcej kandydatów
+    # (cały index, gdy jest mały), a okno czasowe jest stosowane przed obcięciem do limit
+    WINDOW_OVERFETCH_FACTOR = 20
+    WINDOW_FULL_SCAN_MAX_VECTORS = 20000
+
+    def __init__(self,
+                 index_path: Optional[str] = None,
+                 collection_name: str = "news_articles",
+                 similarity_threshold: float = 0.85,
+                 model: str = "text-embedding-3-small",
+                 embeddings=None,
+                 embedding_batch_size: int = 64,
+                 embedding_cache=None,
+                 embedding_cache_max_entries: Optional[int] = None,
+                 embedding_backend: Optional[str] = None,
+                 dedup_window_days: Optional[int] = None):
+        """
+        Args:
+            index_path: Ścieżka pliku FAISS index (tworzony przy pierwszym zapisie)
+            collection_name: Nazwa raportowana w get_collection_info()
+            Pozostałe argumenty jak w VectorDeduplicator.__init__()
+        """
+        self._faiss = _import_faiss()
+
+        self.client = None
+        self.vector_store = None
+        self.index_path = index_path
+        self.collection_name = collection_name
+        self.similarity_threshold = similarity_threshold
+        self.embedding_batch_size = max(1, embedding_batch_size)
+        self._lock = threading.RLock()
+        self._setup_embeddings(model, embeddings, embedding_backend,
+                               embedding_cache, embedding_cache_max_entries)
+        self._setup_dedup_window(dedup_window_days)
+
+        self.index = self._load_index()
+        self._dirty = False
+        _open_indexes.add(self)
+
+    def _new_index(self):
+        return self._faiss.IndexIDMap2(self._faiss.IndexFlatIP(self.embedding_size))
+
+    def _load_index(self):
+        """
+        Ładuje index z index_path przez memory-mapping lub tworzy pusty.
+
+        Index o innym wymiarze niż embedding backend jest pomijany
+        (zostanie nadpisany przy następnym zapisie).
+        """
+        if not self.index_path or not os.path.exists(self.index_path):
+            return self._new_index()
+
+        try:
+            index = self._faiss.read_index(self.index_path, self._faiss.IO_FLAG_MMAP)
+        except Exception as e:
+            logger.error(f"Error loading FAISS index {self.index_path}: {e}")
+            return self._new_index()
+
+        if index.d != self.embedding_size:
+            logger.error(
+                f"FAISS index {self.index_path} has {index.d}d vectors but embedding backend "
+                f"produces {self.embedding_size}d - starting with an empty index"
+            )
+            return self._new_index()
+
+        logger.info(f"Loaded FAISS index {self.index_path} ({index.ntotal} vectors)")
+        return index
+
+    def _save_index(self):
+        """Atomic zapis indeksu (tmp file + os.replace - bezpieczne przy mmap readers)."""
+        if not self.index_path:
+            return
+
+        directory = os.path.dirname(self.index_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.index_path}.tmp"
+        self._faiss.write_index(self.index, tmp_path)
+        os.replace(tmp_path, self.index_path)
+
+    def flush(self):
+        """Zapisuje index na dysk, jeśli od ostatniego zapisu był zmieniony (jeden zapis per batch)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self._save_index()
+                self._dirty = False
+            except Exception as e:
+                logger.error(f"Error saving FAISS index {self.index_path}: {e}")
+
+    def _as_matrix(self, vectors: List[List[float]]) -> np.ndarray:
+        """float32 matrix z L2-normalizacją wierszy (inner product == cosine)."""
+        matrix = np.array(vectors, dtype=np.float32).reshape(-1, self.embedding_size)
+        self._faiss.normalize_L2(matrix)
+        return matrix
+
+    def _query_index(self, vectors: List[List[float]], limit: int,
+                     apply_threshold: bool = True,
+                     time_ranges: Optional[List[Optional[Tuple[float, float]]]] = None) -> List[List[Tuple[int, float]]]:
+        """
+        Jeden batch search w FAISS dla wielu wektorów.
+
+        FAISS nie ma payload filter - przy time_ranges search jest over-fetched
+        (WINDOW_OVERFETCH_FACTOR x limit albo cały index do WINDOW_FULL_SCAN_MAX_VECTORS),
+        trafienia spoza okna są odrzucane (_filter_time_ranges), a dopiero potem
+        wynik jest obcinany do limit. Dzięki temu duplikat z okna nie ginie za
+        bliższymi wektorami spoza okna - ten sam wynik co Qdrant payload filter.
+
+        Returns:
+            List[List[Tuple[int, float]]]: Per wektor lista (article_id, relevance_score)
+        """
+        if not vectors:
+            return []
+
+        windowed = bool(time_ranges) and any(time_range is not None for time_range in time_ranges)
+        with self._lock:
+            ntotal = self.index.ntotal
+            if not windowed:
+                k = min(limit, ntotal)
+            elif ntotal <= self.WINDOW_FULL_SCAN_MAX_VECTORS:
+                k = ntotal
+            else:
+                k = min(limit * self.WINDOW_OVERFETCH_FACTOR, ntotal)
+            if k <= 0:
+                return [[] for _ in vectors]
+            scores, ids = self.index.search(self._as_matrix(vectors), k)
+
+        raw_threshold = 2.0 * self.similarity_threshold - 1.0 if apply_threshold else None
+        hits = []
+        for score_row, id_row in zip(scores, ids):
+            hits.append([
+                (int(article_id), self._relevance_score(float(score)))
+                for score, article_id in zip(score_row, id_row)
+                if article_id != -1 and (raw_threshold is None or score >= raw_threshold)
+            ])
+
+        if windowed:
+            hits = self._filter_time_ranges(hits, time_ranges)
+        return [row[:limit] for row in hits]
+
+    @staticmethod
+    def _filter_time_ranges(hits: List[List[Tuple[int, float]]],
+                            time_ranges: List[Optional[Tuple[float, float]]]) -> List[List[Tuple[int, float]]]:
+        """Odrzuca trafienia spoza okna (published_date z jednego values_list query)."""
+        from ..models import NewsArticle
+
+        article_ids = {article_id for row in hits for article_id, _ in row}
+        published = {
+            article_id: published_date.timestamp()
+            for article_id, published_date in NewsArticle.objects.filter(
+                id__in=article_ids
+            ).values_list('id', 'published_date')
+        }
+        return [
+            row if time_range is None else [
+                (article_id, score) for article_id, score in row
+                if article_id in published and time_range[0] <= published[article_id] <= time_range[1]
+            ]
+            for row, time_range in zip(hits, time_ranges)
+        ]
+
+    def _upsert_vectors(self, articles: List, vectors: List[List[float]]):
+        """Upsert jak w Qdrant - istniejące ID są zastępowane; zapis na dysk w flush()."""
+        ids = np.array([article.id for article in articles], dtype=np.int64)
+        matrix = self._as_matrix(vectors)
+
+        with self._lock:
+            self.index.remove_ids(ids)
+            self.index.add_with_ids(matrix, ids)
+            self._dirty = True
+
+    def remove_article_from_index(self, article_id: int):
+        """Remove article from vector index"""
+        try:
+            with self._lock:
+                removed = self.index.remove_ids(np.array([article_id], dtype=np.int64))
+                self._dirty = True
+            if removed:
+                logger.info(f"Removed article {article_id} from vector index")
+        except Exception as e:
+            logger.error(f"Error removing article from index: {e}")
+
+    def remove_articles_from_index(self, article_ids: List[int]) -> bool:
+        """Batch remove_ids (zapis na dysk w flush())."""
+        if not article_ids:
+            return True
+        try:
+            with self._lock:
+                removed = self.index.remove_ids(np.array(list(article_ids), dtype=np.int64))
+                self._dirty = True
+            logger.info(f"Removed {removed} articles from vector index")
+            return True
+        except Exception as e:
+            logger.error(f"Error removing {len(article_ids)} articles from index: {e}")
+            return False
+
+    def _query_payloads(self, vectors: List[List[float]], limit: int,
+                        apply_threshold: bool = True,
+                        time_ranges: Optional[List[Optional[Tuple[float, float]]]] = None) -> List[List[Tuple[Dict, float]]]:
+        """
+        FAISS nie trzyma payload - metadata z jednego values() query (bez content).
+
+        Returns:
+            List[List[Tuple[Dict, float]]]: Per wektor lista (metadata, relevance_score)
+        """
+        from ..models import NewsArticle
+
+        hits = self._query_index(vectors, limit, apply_threshold, time_ranges)
+        article_ids = {article_id for row in hits for article_id, _ in row}
+        metadata = {
+            row['id']: {"article_id": row['id'], **row}
+            for row in NewsArticle.objects.filter(id__in=article_ids).values(
+                'id', 'title', 'source', 'url', 'published_date'
+            )
+        }
+        return [
+            [(metadata[article_id], score) for article_id, score in row if article_id in metadata]
+            for row in hits
+        ]
+
+    def get_collection_info(self) -> Dict:
+        """Get collection information"""
+        with self._lock:
+            total = int(self.index.ntotal)
+        return {
+            "status": "green",
+            "vectors_count": total,
+            "indexed_vectors_count": total,
+            "embedding_model": getattr(self.embeddings, 'model', None),
+            "embedding_size": self.embedding_size,
+            "backend": "faiss",
+            "index_path": self.index_path
+        }
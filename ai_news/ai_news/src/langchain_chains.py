@@ -566,8 +566,8 @@ class NewsProcessingAgent:
             try:
                 from .deduplication import DuplicationService
                 service = DuplicationService()
-                # Semantic search using vector embeddings
-                articles = service.search_similar_content(query, limit=5)
+                # Semantic search - lightweight hits z payload (tool potrzebuje tylko title i source)
+                articles = service.search_similar_content(query, limit=5, payload_only=True)
                 
                 if not articles:
                     return "No similar articles found."
@@ -590,13 +590,12 @@ class NewsProcessingAgent:
             unique articles (after deduplication), i number of sources.
             """
             try:
-                from ..models import NewsArticle
-                # Database queries dla comprehensive stats
-                total = NewsArticle.objects.count()
-                unique = NewsArticle.objects.filter(is_duplicate=False).count()
-                sources = NewsArticle.objects.values_list('source', flat=True).distinct().count()
+                from .article_stats import collect_article_statistics
+                # Jeden grouped aggregate query dla comprehensive stats
+                stats = collect_article_statistics()
                 
-                return f"Database stats: {total} total articles, {unique} unique, {sources} sources"
+                return (f"Database stats: {stats['total_articles']} total articles, "
+                        f"{stats['unique_articles']} unique, {stats['source_count']} sources")
             except Exception as e:
                 return f"Error getting stats: {e}"
         
@@ -0,0 +1,86 @@
+"""
+Local/offline embedding backend dla VectorDeduplicator.
+
+LangChain-compatible Embeddings uruchamiający model sentence-transformers
+lokalnie na CPU - deduplikacja bez network latency i per-token cost,
+np. do benchmarków na air-gapped maszynach.
+
+Usage:
+    embeddings = SentenceTransformerEmbeddings("sentence-transformers/all-MiniLM-L6-v2")
+    deduplicator = VectorDeduplicator(embeddings=embeddings)  # collection 384d
+"""
+import logging
+from typing import List
+
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+# Default lokalny model - 384 wymiary, szybki na CPU
+DEFAULT_LOCAL_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+class SentenceTransformerEmbeddings(Embeddings):
+    """
+    Embeddings backend oparty o sentence-transformers (batch encoding na CPU).
+
+    Model jest ładowany leniwie przy pierwszym użyciu, więc sentence-transformers
+    (i torch) są wymagane tylko gdy ten backend jest wybrany.
+
+    Attributes:
+        model (str): Nazwa modelu - używana w get_collection_info() i jako klucz EmbeddingCache
+        dimension (int): Rozmiar wektora wykryty z modelu
+    """
+
+    def __init__(self, model: str = DEFAULT_LOCAL_EMBEDDING_MODEL, device: str = "cpu",
+                 batch_size: int = 64, normalize: bool = True):
+        """
+        Args:
+            model: Nazwa modelu HuggingFace / ścieżka lokalna
+            device: Device dla encode() (default "cpu")
+            batch_size: Teksty per forward pass
+            normalize: L2-normalizacja wektorów (cosine == dot product, jak OpenAI)
+        """
+        self.model = model
+        self.device = device
+        self.batch_size = batch_size
+        self.normalize = normalize
+        self._encoder = None
+
+    @property
+    def encoder(self):
+        """Lazily loaded SentenceTransformer instance."""
+        if self._encoder is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError as e:
+                raise ImportError(
+                    "sentence-transformers is required for EMBEDDING_BACKEND=sentence-transformers. "
+                    "Install it with: pip install sentence-transformers"
+                ) from e
+
+            logger.info(f"Loading local embedding model {self.model} on {self.device}")
+            self._encoder = SentenceTransformer(self.model, device=self.device)
+        return self._encoder
+
+    @property
+    def dimension(self) -> int:
+        """Rozmiar wektora raportowany przez model."""
+        return int(self.encoder.get_sentence_embedding_dimension())
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Batch encoding wielu tekstów."""
+        if not texts:
+            return []
+        vectors = self.encoder.encode(
+            list(texts),
+            batch_size=self.batch_size,
+            normalize_embeddings=self.normalize,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return vectors.tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        """Encoding pojedynczego tekstu."""
+        return self.embed_documents([text])[0]
@@ -0,0 +1,44 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import F, Max, Min
+from ai_news.models import BlogSummary
+
+
+class Command(BaseCommand):
+    help = ("Re-label summaries saved before BlogSummary.period existed (period='custom') "
+            "as daily/weekly from the published_date span of their articles")
+
+    # Okna wyboru artykułów w create_daily_summary / create_weekly_summary
+    PERIOD_WINDOWS = (('daily', timedelta(days=1)), ('weekly', timedelta(days=7)))
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many summaries would be re-labelled',
+        )
+
+    def handle(self, *args, **options):
+        legacy = BlogSummary.objects.filter(period='custom').annotate(
+            oldest=Min('articles__published_date'),
+            newest=Max('articles__published_date'),
+        ).filter(oldest__isnull=False, newest__lte=F('created_date'))
+
+        relabelled = {}
+        claimed = set()
+        for period, window in self.PERIOD_WINDOWS:
+            ids = set(
+                legacy.filter(oldest__gte=F('created_date') - window).values_list('id', flat=True)
+            ) - claimed
+            claimed |= ids
+            relabelled[period] = len(ids)
+            if ids and not options['dry_run']:
+                BlogSummary.objects.filter(id__in=ids).update(period=period)
+
+        action = "Would re-label" if options['dry_run'] else "Re-labelled"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{action} {relabelled['daily']} daily and {relabelled['weekly']} weekly summaries"
+            )
+        )
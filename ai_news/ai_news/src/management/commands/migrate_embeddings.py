@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from ai_news.models import NewsArticle, ArticleEmbedding
+from ai_news.core.config import get_app_config
+
+
+class Command(BaseCommand):
+    help = 'Move legacy JSON embedding_vector values into compact binary ArticleEmbedding rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Articles converted per transaction (default: 500)',
+        )
+        parser.add_argument(
+            '--dtype',
+            choices=ArticleEmbedding.STORAGE_DTYPES,
+            default=None,
+            help='Storage dtype (default: EMBEDDING_STORAGE_DTYPE)',
+        )
+        parser.add_argument(
+            '--keep-json',
+            action='store_true',
+            help='Do not clear embedding_vector after conversion',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        dtype = options['dtype'] or get_app_config().embedding_storage_dtype
+        pending = NewsArticle.objects.filter(embedding_vector__isnull=False).order_by('pk')
+
+        total = pending.count()
+        self.stdout.write(f"Converting {total} JSON embeddings to {dtype} blobs...")
+
+        converted = 0
+        last_pk = 0
+        while True:
+            rows = list(pending.filter(pk__gt=last_pk).values_list('pk', 'embedding_vector')[:batch_size])
+            if not rows:
+                break
+            last_pk = rows[-1][0]
+
+            vectors = {pk: vector for pk, vector in rows if vector}
+            with transaction.atomic():
+                ArticleEmbedding.store_many(vectors, dtype=dtype)
+                if not options['keep_json']:
+                    NewsArticle.objects.filter(pk__in=[pk for pk, _ in rows]).update(embedding_vector=None)
+
+            converted += len(vectors)
+            self.stdout.write(f"  {converted}/{total}")
+
+        self.stdout.write(self.style.SUCCESS(f"Converted {converted} embeddings"))
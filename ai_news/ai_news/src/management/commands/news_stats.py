@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from ai_news.src.news_service import NewsOrchestrationService
+from ai_news.src.article_stats import daily_article_counts
 from ai_news.models import NewsArticle, BlogSummary
 
 
@@ -18,6 +19,12 @@ class Command(BaseCommand):
             default=30,
             help='Number of days to keep articles (default: 30)',
         )
+        parser.add_argument(
+            '--cleanup-chunk-size',
+            type=int,
+            default=None,
+            help='Articles deleted per chunk (default: RETENTION_CHUNK_SIZE)',
+        )
 
     def handle(self, *args, **options):
         service = NewsOrchestrationService()
@@ -43,6 +50,12 @@ class Command(BaseCommand):
                 f"  {source}: {source_stats['unique']} unique / {source_stats['total']} total"
             )
         
+        self.stdout.write("\n=== Articles per Day (last 7 days) ===")
+        for day, day_stats in daily_article_counts(days=7).items():
+            self.stdout.write(
+                f"  {day.isoformat()}: {day_stats['unique']} unique / {day_stats['total']} total"
+            )
+        
         # Display recent summaries
         self.stdout.write("\n=== Recent Summaries ===")
         recent_summaries = BlogSummary.objects.all()[:5]
@@ -58,7 +71,11 @@ class Command(BaseCommand):
         if options['cleanup']:
             days = options['cleanup_days']
             self.stdout.write(f"\nCleaning up articles older than {days} days...")
-            cleaned_count = service.cleanup_old_articles(days)
+            cleaned_count = service.cleanup_old_articles(
+                days,
+                chunk_size=options['cleanup_chunk_size'],
+                progress_callback=lambda processed, total: self.stdout.write(f"  {processed}/{total}")
+            )
             self.stdout.write(
                 self.style.SUCCESS(f"Cleaned up {cleaned_count} old articles")
             )
\ No newline at end of file
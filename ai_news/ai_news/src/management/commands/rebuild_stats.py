@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from ai_news.src.article_stats import rebuild_statistics_rollup
+
+
+class Command(BaseCommand):
+    help = 'Recompute the SourceStats/DailyStats rollup from NewsArticle (reconciles drift)'
+
+    def handle(self, *args, **options):
+        self.stdout.write("Rebuilding statistics rollup...")
+        drift = rebuild_statistics_rollup()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rollup rebuilt: {drift['sources_corrected']} sources and "
+                f"{drift['days_corrected']} days corrected"
+            )
+        )
@@ -60,6 +60,8 @@ class Command(BaseCommand):
         --all: Process wszystkie available sources w batch operation
         --generate-summary: Enable AI-powered blog summary generation
         --list-sources: Display wszystkie registered scrapers
+        --workers: Concurrent fetch workers dla --all (override SCRAPE_MAX_WORKERS)
+        --async: Asyncio fetch path dla --all (override SCRAPE_USE_ASYNC)
         
         Argument Design:
         - Mutually exclusive primary operations (source vs all vs list)
@@ -97,6 +99,21 @@ class Command(BaseCommand):
             action='store_true',
             help='List all available scrapers from auto-discovery system',
         )
+        
+        # Performance option: concurrent fetching dla --all
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Number of concurrent fetch workers for --all (1 = sequential, default from SCRAPE_MAX_WORKERS)',
+        )
+        parser.add_argument(
+            '--async',
+            dest='use_async',
+            action='store_true',
+            default=None,
+            help='Use the asyncio fetch path for --all (one event loop, shared HTTP client)',
+        )
 
     def handle(self, *args, **options):
         """
@@ -165,7 +182,10 @@ class Command(BaseCommand):
         elif options['all']:
             self.stdout.write("Starting comprehensive batch scraping...")
             # Execute batch scraping z wszystkich registered sources
-            results = service.scrape_all_sources()
+            results = service.scrape_all_sources(
+                max_workers=options.get('workers'),
+                use_async=options.get('use_async')
+            )
             total = sum(results.values())
             
             # Display detailed per-source results
@@ -0,0 +1,256 @@
+"""
+Lexical near-duplicate detection (shingled MinHash + LSH) między hash a embedding stage.
+
+Lekko edytowane syndykowane kopie tego samego newsa (TechCrunch, VentureBeat,
+AI News) mają inny SHA-256, ale prawie ten sam zbiór word shingles. MinHash
+sygnatura jest dzielona na LSH bands zapisane w MinHashBand - jeden indexed
+query znajduje kandydatów, a exact Jaccard na shingles potwierdza duplikat.
+Tylko artykuły poniżej threshold (przypadki niejednoznaczne) idą do embeddings.
+
+Usage:
+    near = MinHashDeduplicator(threshold=0.8)
+    matches = near.find_near_duplicates_batch(articles)  # article.id -> (original, jaccard)
+"""
+import hashlib
+import logging
+import re
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Prime > 2^32 - (a * h + b) mod p mieści się w uint64 dla 32-bit shingle hashes
+_MINHASH_PRIME = np.uint64(4294967311)
+_MINHASH_SEED = 1
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class MinHashDeduplicator:
+    """
+    Near-duplicate stage: word shingles -> MinHash -> LSH bands w MinHashBand.
+
+    Przy num_perm=64 i num_bands=16 (4 rows per band) próg kandydata LSH to
+    Jaccard ~0.5, a para z Jaccard 0.8 trafia do wspólnego bucketu z p > 0.999.
+
+    Attributes:
+        threshold (float): Minimalny exact Jaccard dla near-duplicate (0 = stage wyłączony)
+        min_shingles (int): Krótsze teksty są pomijane (za mało sygnału - decydują embeddings)
+        dedup_window_days (int): Kandydaci tylko z published_date ± N dni (0 = bez okna)
+    """
+
+    def __init__(self, threshold: Optional[float] = None, num_perm: int = 64,
+                 num_bands: int = 16, shingle_size: int = 3, min_shingles: int = 10,
+                 max_candidates: int = 20, dedup_window_days: Optional[int] = None):
+        """
+        Args:
+            threshold: Jaccard threshold 0.0-1.0; None = AppConfig.near_duplicate_threshold
+            num_perm: Liczba hash permutations w sygnaturze
+            num_bands: Liczba LSH bands (num_perm musi być jej wielokrotnością)
+            shingle_size: Słowa per shingle
+            min_shingles: Minimalna liczba shingles żeby porównywać leksykalnie
+            max_candidates: Max kandydatów per artykuł do exact weryfikacji
+            dedup_window_days: Okno czasowe jak w VectorDeduplicator; None = AppConfig.dedup_window_days
+        """
+        if threshold is None:
+            from ..core.config import get_app_config
+            threshold = get_app_config().near_duplicate_threshold
+        if dedup_window_days is None:
+            from ..core.config import get_app_config
+            dedup_window_days = get_app_config().dedup_window_days
+        if num_perm % num_bands:
+            raise ValueError("num_perm must be a multiple of num_bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.num_bands = num_bands
+        self.rows_per_band = num_perm // num_bands
+        self.shingle_size = shingle_size
+        self.min_shingles = min_shingles
+        self.max_candidates = max_candidates
+        self.dedup_window_days = max(0, dedup_window_days)
+
+        rng = np.random.RandomState(_MINHASH_SEED)
+        self._a = rng.randint(1, 2 ** 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 2 ** 32, size=num_perm, dtype=np.uint64)
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def shingles(self, article) -> Set[int]:
+        """32-bit hashes word shingles z title + content (lowercase)."""
+        tokens = _TOKEN_RE.findall(f"{article.title} {article.content}".lower())
+        size = self.shingle_size
+        return {
+            zlib.crc32(" ".join(tokens[start:start + size]).encode("utf-8"))
+            for start in range(max(1, len(tokens) - size + 1))
+        } if tokens else set()
+
+    def signature(self, shingles: Set[int]) -> np.ndarray:
+        """MinHash sygnatura (num_perm uint64) - min po (a * h + b) mod p."""
+        hashes = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))[:, None]
+        return ((hashes * self._a + self._b) % _MINHASH_PRIME).min(axis=0)
+
+    def band_keys(self, signature: np.ndarray) -> List[int]:
+        """Signed 64-bit key per LSH band (numer bandu jest częścią klucza)."""
+        keys = []
+        for band in range(self.num_bands):
+            rows = signature[band * self.rows_per_band:(band + 1) * self.rows_per_band]
+            digest = hashlib.blake2b(bytes([band]) + rows.astype("<u8").tobytes(), digest_size=8).digest()
+            keys.append(int.from_bytes(digest, "big", signed=True))
+        return keys
+
+    @staticmethod
+    def jaccard(left: Set[int], right: Set[int]) -> float:
+        if not left or not right:
+            return 0.0
+        return len(left & right) / len(left | right)
+
+    def _in_window(self, article, other) -> bool:
+        """Czy published_date obu artykułów mieści się w dedup window (brak daty = bez okna)."""
+        if not self.dedup_window_days:
+            return True
+        if not isinstance(article.published_date, datetime) or not isinstance(other.published_date, datetime):
+            return True
+        return abs(article.published_date - other.published_date) <= timedelta(days=self.dedup_window_days)
+
+    def _band_query(self, keys: Set[int], articles: List):
+        """
+        MinHashBand rows dla band keys - przy dedup window tylko artykuły z zakresu
+        dat całego batcha (ten sam filtr published_date co payload filter Qdrant).
+        """
+        from ..models import MinHashBand
+
+        bands = MinHashBand.objects.filter(band_key__in=list(keys)).exclude(
+            article_id__in=[article.id for article in articles]
+        )
+        published = [article.published_date for article in articles]
+        if self.dedup_window_days and all(isinstance(date, datetime) for date in published):
+            window = timedelta(days=self.dedup_window_days)
+            bands = bands.filter(article__published_date__range=(min(published) - window, max(published) + window))
+        return bands.values_list('band_key', 'article_id')
+
+    def _fingerprint(self, article) -> Optional[Tuple[Set[int], List[int]]]:
+        """(shingles, band_keys) albo None gdy tekst jest za krótki."""
+        shingles = self.shingles(article)
+        if len(shingles) < self.min_shingles:
+            return None
+        return shingles, self.band_keys(self.signature(shingles))
+
+    def find_near_duplicates_batch(self, articles: List) -> Dict:
+        """
+        Map article.id -> (original, jaccard) dla near-duplicates (jeden band query).
+
+        Kandydaci to zaindeksowane artykuły z MinHashBand oraz wcześniejsze
+        artykuły z tego samego batcha, które nie zostały uznane za duplikat -
+        w obu przypadkach tylko z published_date ± dedup_window_days.
+        """
+        from ..models import NewsArticle
+
+        if not self.enabled or not articles:
+            return {}
+
+        try:
+            fingerprints = [self._fingerprint(article) for article in articles]
+            all_keys = {key for fingerprint in fingerprints if fingerprint for key in fingerprint[1]}
+            if not all_keys:
+                return {}
+
+            indexed_by_key: Dict[int, Set[int]] = {}
+            for band_key, article_id in self._band_query(all_keys, articles):
+                indexed_by_key.setdefault(band_key, set()).add(article_id)
+
+            # Kandydaci z indeksu - najwięcej wspólnych bands najpierw
+            candidate_ids = {}
+            for article, fingerprint in zip(articles, fingerprints):
+                if fingerprint is None:
+                    continue
+                shared = {}
+                for key in fingerprint[1]:
+                    for article_id in indexed_by_key.get(key, ()):
+                        shared[article_id] = shared.get(article_id, 0) + 1
+                candidate_ids[article.id] = sorted(shared, key=shared.get, reverse=True)[:self.max_candidates]
+
+            originals = NewsArticle.objects.only('id', 'title', 'content', 'published_date').in_bulk(
+                list({article_id for ids in candidate_ids.values() for article_id in ids})
+            )
+            original_shingles = {article_id: self.shingles(original) for article_id, original in originals.items()}
+
+            matches = {}
+            batch_by_key: Dict[int, List[int]] = {}
+            for position, (article, fingerprint) in enumerate(zip(articles, fingerprints)):
+                if fingerprint is None:
+                    continue
+                shingles, keys = fingerprint
+
+                best = None
+                for article_id in candidate_ids.get(article.id, []):
+                    if article_id in original_shingles and self._in_window(article, originals[article_id]):
+                        score = self.jaccard(shingles, original_shingles[article_id])
+                        if score >= self.threshold and (best is None or score > best[1]):
+                            best = (originals[article_id], score)
+
+                if best is None:
+                    earlier = {other for key in keys for other in batch_by_key.get(key, ())}
+                    for other in sorted(earlier):
+                        if not self._in_window(article, articles[other]):
+                            continue
+                        score = self.jaccard(shingles, fingerprints[other][0])
+                        if score >= self.threshold and (best is None or score > best[1]):
+                            best = (articles[other], score)
+
+                if best is not None:
+                    matches[article.id] = best
+                else:
+                    for key in keys:
+                        batch_by_key.setdefault(key, []).append(position)
+
+            return matches
+        except Exception as e:
+            logger.error(f"Error finding near duplicates: {e}")
+            return {}
+
+    def find_near_duplicate(self, article) -> Optional[Tuple]:
+        """(original, jaccard) dla pojedynczego artykułu albo None"""
+        return self.find_near_duplicates_batch([article]).get(article.id)
+
+    def index_articles(self, articles: List) -> int:
+        """
+        Zapisuje LSH bands unikalnych artykułów (jeden bulk_create).
+
+        Returns:
+            int: Liczba zaindeksowanych artykułów
+        """
+        from ..models import MinHashBand
+
+        if not self.enabled or not articles:
+            return 0
+
+        try:
+            rows = []
+            indexed = 0
+            for article in articles:
+                fingerprint = self._fingerprint(article)
+                if fingerprint is None:
+                    continue
+                rows.extend(MinHashBand(article_id=article.id, band_key=key) for key in set(fingerprint[1]))
+                indexed += 1
+
+            MinHashBand.objects.bulk_create(rows)
+            return indexed
+        except Exception as e:
+            logger.error(f"Error indexing MinHash bands: {e}")
+            return 0
+
+    @staticmethod
+    def mark_as_near_duplicate(article, original, similarity: float):
+        article.is_duplicate = True
+        article.duplicate_of = original
+        article.save(update_fields=['is_duplicate', 'duplicate_of'])
+
+        logger.info(f"Marked article as near duplicate: {article.title} "
+                    f"(duplicate of: {original.title}, jaccard: {similarity:.3f})")
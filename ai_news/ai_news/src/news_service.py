@@ -1,11 +1,17 @@
 from typing import List, Dict, Optional
+import hashlib
 import logging
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+from itertools import groupby
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from django.utils import timezone
-from django.db import transaction
+from django.db import IntegrityError, transaction, connections
 
 # Security imports
 from .security import InputSanitizer, SecurityError, SecurityAuditor
+from .article_stats import collect_article_statistics, record_ingested_articles
 
 logger = logging.getLogger(__name__)
 
@@ -52,13 +58,19 @@ class NewsOrchestrationService:
     - Configurable AI models dla cost optimization
     """
     
+    # Ile ostatnich URLs per źródło trzyma SourceWatermark (pokrywa grace window parserów)
+    WATERMARK_MAX_URLS = 500
+    
     def __init__(self, 
                  embedding_model: str = "text-embedding-3-small",
                  llm_model: str = "gpt-4o-mini",
                  temperature: float = 0.7,
                  deduplication_service=None,
                  blog_summary_service=None,
-                 langchain_orchestrator=None):
+                 langchain_orchestrator=None,
+                 scrape_max_workers: int = 1,
+                 scrape_per_host_limit: int = 2,
+                 scrape_use_async: bool = False):
         """
         Inicjalizuje NewsOrchestrationService z dependency injection support.
         
@@ -75,6 +87,12 @@ class NewsOrchestrationService:
             deduplication_service: Injected deduplication service (optional)
             blog_summary_service: Injected blog summary service (optional)
             langchain_orchestrator: Injected LangChain orchestrator (optional)
+            scrape_max_workers: Liczba równoległych fetch workers w scrape_all_sources()
+                               (default 1 = sequential, >1 = concurrent mode)
+            scrape_per_host_limit: Max równoległych fetchy do jednego hosta
+                                  (default 2 - politeness dla shared domains)
+            scrape_use_async: Domyślnie używaj asyncio fetch path (ascrape())
+                             zamiast thread pool w scrape_all_sources()
         
         Initialized Services:
         - DuplicationService: Uses embedding_model dla vector similarity
@@ -105,8 +123,20 @@ class NewsOrchestrationService:
         else:
             from .langchain_chains import LangChainNewsOrchestrator
             self.langchain_orchestrator = LangChainNewsOrchestrator(model_type="openai")
+        
+        # Concurrent scraping configuration
+        self.scrape_max_workers = max(1, int(scrape_max_workers))
+        self.scrape_per_host_limit = max(1, int(scrape_per_host_limit))
+        # Accepts bool lub env-style string ("true"/"false") z DI containers
+        self.scrape_use_async = str(scrape_use_async).lower() == 'true'
+        
+        # Per-source wall time (seconds) z ostatniego scrape_all_sources()
+        self.last_scrape_timings: Dict[str, float] = {}
     
-    def scrape_all_sources(self) -> Dict[str, int]:
+    def scrape_all_sources(self,
+                           max_workers: Optional[int] = None,
+                           per_host_limit: Optional[int] = None,
+                           use_async: Optional[bool] = None) -> Dict[str, int]:
         """
         Orchestrates scraping ze wszystkich available sources w batch operation.
         
@@ -116,9 +146,12 @@ class NewsOrchestrationService:
         
         Workflow:
         1. Get lista wszystkich available scrapers z Factory
-        2. Iterate przez każdy scraper sequentially
-        3. Execute scraping z error isolation
-        4. Aggregate results i statistics
+        2. Sequential mode (max_workers=1): scrape_single_source() dla każdego
+        3. Concurrent mode (max_workers>1): network fetches overlap w thread pool,
+           ingestion (DB write + dedup) stays serialized w calling thread
+           Async mode (use_async=True): jeden event loop drives ascrape()
+           wszystkich parserów, potem serialized ingestion
+        4. Aggregate results, per-source wall time i statistics
         5. Return comprehensive summary
         
         Wykorzystywana przez:
@@ -127,10 +160,16 @@ class NewsOrchestrationService:
         - Full system refresh operations
         - Development i testing workflows
         
+        Args:
+            max_workers: Override self.scrape_max_workers dla tego runu
+            per_host_limit: Override self.scrape_per_host_limit dla tego runu
+            use_async: Override self.scrape_use_async dla tego runu
+        
         Returns:
             Dict[str, int]: Mapping scraper_name -> articles_count
                            Pokazuje ile unique articles scraped z każdego source
                            0 dla sources z errors
+                           Per-source wall time dostępny w self.last_scrape_timings
                            
         Error Handling:
             Individual scraper failures nie stop batch process
@@ -138,28 +177,42 @@ class NewsOrchestrationService:
             Comprehensive logging dla monitoring
             
         Performance:
-            Sequential processing - nie parallel dla stability
+            Concurrent mode: total time ~ slowest feed zamiast sumy wszystkich
+            Per-host cap chroni shared domains (np. reddit.com, techcrunch.com)
             Each scraper isolated w try/catch dla error recovery
         """
         from .parsers import ScraperFactory
         
+        workers = max(1, int(max_workers or self.scrape_max_workers))
+        host_limit = max(1, int(per_host_limit or self.scrape_per_host_limit))
+        run_async = self.scrape_use_async if use_async is None else use_async
+        
         results = {}
+        self.last_scrape_timings = {}
         # Get wszystkie available scrapers z auto-discovery
         available_scrapers = ScraperFactory.get_available_scrapers()
         
-        logger.info(f"Starting scraping process for {len(available_scrapers)} sources")
+        logger.info(f"Starting scraping process for {len(available_scrapers)} sources "
+                    f"(workers={workers}, per_host_limit={host_limit}, async={run_async})")
         
-        # Process każdy scraper individually z error isolation
-        for scraper_name in available_scrapers:
-            try:
-                # Execute single source scraping z deduplication
-                count = self.scrape_single_source(scraper_name)
-                results[scraper_name] = count
-                logger.info(f"Scraped {count} articles from {scraper_name}")
-            except Exception as e:
-                # Individual scraper failure nie crashes batch process
-                logger.error(f"Error scraping {scraper_name}: {e}")
-                results[scraper_name] = 0
+        if run_async:
+            results = self._scrape_sources_async(available_scrapers, host_limit)
+        elif workers > 1:
+            results = self._scrape_sources_concurrently(available_scrapers, workers, host_limit)
+        else:
+            # Process każdy scraper individually z error isolation
+            for scraper_name in available_scrapers:
+                started = time.monotonic()
+                try:
+                    # Execute single source scraping z deduplication
+                    count = self.scrape_single_source(scraper_name)
+                    results[scraper_name] = count
+                    logger.info(f"Scraped {count} articles from {scraper_name}")
+                except Exception as e:
+                    # Individual scraper failure nie crashes batch process
+                    logger.error(f"Error scraping {scraper_name}: {e}")
+                    results[scraper_name] = 0
+                self.last_scrape_timings[scraper_name] = round(time.monotonic() - started, 3)
         
         # Calculate i log aggregate statistics
         total_articles = sum(results.values())
@@ -167,6 +220,121 @@ class NewsOrchestrationService:
         
         return results
     
+    def _scrape_sources_concurrently(self, scraper_names: List[str],
+                                     max_workers: int, per_host_limit: int) -> Dict[str, int]:
+        """
+        Concurrent fetch phase + serialized ingestion phase dla scrape_all_sources().
+        
+        Network I/O (scraper.scrape()) runs w ThreadPoolExecutor z per-host
+        BoundedSemaphore. Results są consumed w calling thread w kolejności
+        completion, więc DB writes i deduplication nigdy nie biegną równolegle
+        (SQLite write lock, Qdrant/OpenAI ordering).
+        
+        Args:
+            scraper_names: Lista registered scraper names
+            max_workers: Rozmiar thread pool
+            per_host_limit: Max równoległych fetchy per hostname
+            
+        Returns:
+            Dict[str, int]: scraper_name -> unique articles count, w kolejności scraper_names
+        """
+        from .parsers import ScraperFactory
+        
+        host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        semaphores_lock = threading.Lock()
+        
+        def fetch(scraper_name: str):
+            started = time.monotonic()
+            try:
+                scraper = ScraperFactory.create_scraper(scraper_name)
+                with semaphores_lock:
+                    semaphore = host_semaphores.setdefault(
+                        scraper.host, threading.BoundedSemaphore(per_host_limit)
+                    )
+                with semaphore:
+                    articles_data = scraper.scrape()
+                return scraper, articles_data, time.monotonic() - started
+            finally:
+                # Scrapers mogą czytać per-feed state z DB - zamykamy connection worker thread
+                connections.close_all()
+        
+        counts: Dict[str, int] = {}
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scrape") as executor:
+            futures = {executor.submit(fetch, name): name for name in scraper_names}
+            
+            for future in as_completed(futures):
+                scraper_name = futures[future]
+                fetch_time = 0.0
+                try:
+                    scraper, articles_data, fetch_time = future.result()
+                    ingest_started = time.monotonic()
+                    # Ingestion serialized - runs only w calling thread
+                    counts[scraper_name] = self._ingest_scraped_articles(scraper_name, articles_data, scraper)
+                    self.last_scrape_timings[scraper_name] = round(
+                        fetch_time + time.monotonic() - ingest_started, 3
+                    )
+                    logger.info(f"Scraped {counts[scraper_name]} articles from {scraper_name} "
+                                f"in {self.last_scrape_timings[scraper_name]:.2f}s")
+                except Exception as e:
+                    logger.error(f"Error scraping {scraper_name}: {e}")
+                    counts[scraper_name] = 0
+                    self.last_scrape_timings[scraper_name] = round(fetch_time, 3)
+        
+        # Stable ordering niezależnie od completion order
+        return {name: counts.get(name, 0) for name in scraper_names}
+    
+    def _scrape_sources_async(self, scraper_names: List[str], per_host_limit: int) -> Dict[str, int]:
+        """
+        Async fetch phase (jeden event loop, shared httpx client) + serialized ingestion.
+        
+        Wszystkie feedy są pobierane przez ascrape() w asyncio.run(); Django ORM
+        nie może być używany z wnętrza event loop, więc ingestion rusza dopiero
+        po zakończeniu fetch phase, w calling thread.
+        
+        Args:
+            scraper_names: Lista registered scraper names
+            per_host_limit: Max równoległych scrapów per hostname
+            
+        Returns:
+            Dict[str, int]: scraper_name -> unique articles count, w kolejności scraper_names
+        """
+        import asyncio
+        from .parsers import ScraperFactory
+        from .parsers.async_http import scrape_many
+        
+        counts: Dict[str, int] = {name: 0 for name in scraper_names}
+        
+        scrapers = {}
+        for scraper_name in scraper_names:
+            try:
+                scrapers[scraper_name] = ScraperFactory.create_scraper(scraper_name)
+            except Exception as e:
+                logger.error(f"Error scraping {scraper_name}: {e}")
+                self.last_scrape_timings[scraper_name] = 0.0
+        
+        outcomes = asyncio.run(scrape_many(scrapers, per_host_limit=per_host_limit))
+        
+        for scraper_name, outcome in outcomes.items():
+            if isinstance(outcome, BaseException):
+                logger.error(f"Error scraping {scraper_name}: {outcome}")
+                self.last_scrape_timings[scraper_name] = 0.0
+                continue
+            
+            articles_data, fetch_time = outcome
+            ingest_started = time.monotonic()
+            try:
+                counts[scraper_name] = self._ingest_scraped_articles(
+                    scraper_name, articles_data, scrapers[scraper_name]
+                )
+                logger.info(f"Scraped {counts[scraper_name]} articles from {scraper_name}")
+            except Exception as e:
+                logger.error(f"Error scraping {scraper_name}: {e}")
+            self.last_scrape_timings[scraper_name] = round(
+                fetch_time + time.monotonic() - ingest_started, 3
+            )
+        
+        return counts
+    
     def scrape_single_source(self, scraper_name: str) -> int:
         """
         Scrapes articles z single specified source z complete processing pipeline.
@@ -209,7 +377,6 @@ class NewsOrchestrationService:
             Graceful recovery z malformed article data
         """
         from .parsers import ScraperFactory
-        from ..models import NewsArticle
         
         try:
             # Create scraper instance z Factory (auto-discovery)
@@ -217,78 +384,254 @@ class NewsOrchestrationService:
             # Execute scraping dla raw article data
             articles_data = scraper.scrape()
             
-            new_articles_count = 0
-            url_duplicates = 0
-            content_duplicates = 0
+            return self._ingest_scraped_articles(scraper_name, articles_data, scraper)
+        
+        except Exception as e:
+            # Handle scraper-level failures gracefully
+            logger.error(f"Error in scrape_single_source for {scraper_name}: {e}")
+            return 0
+    
+    def _ingest_scraped_articles(self, scraper_name: str, articles_data: List, scraper=None) -> int:
+        """
+        Ingestion stage: sanitization → bulk URL check → bulk insert → batch deduplication.
+        
+        Wydzielona z scrape_single_source() tak żeby concurrent fetch phase
+        w scrape_all_sources() mogła oddać wyniki do serialized ingestion
+        w calling thread. Musi być wywoływana tylko z jednego wątku naraz.
+        
+        Batched workflow (stała liczba DB round-trips per source zamiast kilku per article):
+        1. Sanitization każdego article (CPU only)
+        2. Jeden url__in query dla wszystkich candidate URLs
+        3. Jeden content_hash__in query - content_hash jest unique w DB,
+           więc exact duplicates odrzucamy przed insertem
+        4. bulk_create nowych rows (content_hash liczony tutaj, bo save() jest pomijany)
+        5. Jeden call do DuplicationService.process_articles_for_duplicates()
+        6. Watermark i fetch state scrapera (HTTP validators) dopiero po zapisie
+        
+        Args:
+            scraper_name: Name registered scraper (dla logów)
+            articles_data: Lista NewsArticleData zwrócona przez scraper.scrape()
+            scraper: Scraper, który zwrócił articles_data (commit_fetch_state po ingestion)
             
-            logger.info(f"Processing {len(articles_data)} articles from {scraper_name}")
+        Returns:
+            int: Number unique (non-duplicate) articles added
+        """
+        from ..models import NewsArticle
+        
+        new_articles_count = 0
+        url_duplicates = 0
+        content_duplicates = 0
+        failed_urls = set()
+        
+        logger.info(f"Processing {len(articles_data)} articles from {scraper_name}")
+        
+        # STAGE 1: SECURITY - validate and sanitize każdy article (bez DB access)
+        candidates = []
+        for article_data in articles_data:
+            try:
+                sanitized_data = InputSanitizer.validate_article_data(article_data.__dict__)
+                
+                # Log security event if data was sanitized
+                if (sanitized_data['title'] != article_data.title or 
+                    sanitized_data['content'] != article_data.content or 
+                    sanitized_data['url'] != article_data.url):
+                    SecurityAuditor.log_security_event(
+                        "article_sanitization",
+                        {"source": article_data.source, "url": article_data.url},
+                        "info"
+                    )
+                candidates.append((article_data, sanitized_data))
+            except SecurityError as e:
+                logger.error(f"Security validation failed for article from {scraper_name}: {e}")
+                continue  # Skip malicious articles
+            except Exception as e:
+                logger.error(f"Error processing article {article_data.title}: {e}")
+                failed_urls.add(article_data.url)
+        
+        try:
+            # STAGE 2: Fast path - URL duplicates resolved jednym query
+            existing_urls = set(
+                NewsArticle.objects.filter(
+                    url__in=[data['url'] for _, data in candidates]
+                ).values_list('url', flat=True)
+            )
             
-            # Process każdy article individually z error isolation
-            for article_data in articles_data:
-                try:
-                    # SECURITY: Validate and sanitize article data before processing
-                    try:
-                        sanitized_data = InputSanitizer.validate_article_data(article_data.__dict__)
-                        
-                        # Log security event if data was sanitized
-                        if (sanitized_data['title'] != article_data.title or 
-                            sanitized_data['content'] != article_data.content or 
-                            sanitized_data['url'] != article_data.url):
-                            SecurityAuditor.log_security_event(
-                                "article_sanitization",
-                                {"source": article_data.source, "url": article_data.url},
-                                "info"
-                            )
-                    except SecurityError as e:
-                        logger.error(f"Security validation failed for article from {scraper_name}: {e}")
-                        continue  # Skip malicious articles
-                    
-                    # Use atomic transaction dla data integrity
-                    with transaction.atomic():
-                        # Fast path: check URL-based duplicates first
-                        if NewsArticle.objects.filter(url=sanitized_data['url']).exists():
-                            url_duplicates += 1
-                            continue  # Skip existing articles
-                        
-                        # Create new NewsArticle object z sanitized data
-                        article = NewsArticle(
-                            title=sanitized_data['title'][:500],  # Truncate dla DB constraints
-                            content=sanitized_data['content'],
-                            url=sanitized_data['url'],
-                            source=sanitized_data['source'],
-                            published_date=sanitized_data.get('published_date') or timezone.now(),
-                        )
-                        article.save()  # Triggers automatic content_hash generation
-                        
-                        # Run comprehensive deduplication pipeline
-                        # Includes hash-based + semantic similarity detection
-                        is_duplicate = self.duplication_service.process_article_for_duplicates(article)
-                        
-                        # Count only truly unique articles
-                        if not is_duplicate:
-                            new_articles_count += 1
-                        else:
-                            content_duplicates += 1
-                        
-                        logger.debug(f"Processed article: {article.title}")
+            new_rows = []  # (content_hash, NewsArticle)
+            batch_urls = set()
+            for _, data in candidates:
+                if data['url'] in existing_urls or data['url'] in batch_urls:
+                    url_duplicates += 1
+                    continue  # Skip existing articles
+                batch_urls.add(data['url'])
                 
-                except Exception as e:
-                    # Log individual article failures ale continue processing
-                    logger.error(f"Error processing article {article_data.title}: {e}")
+                title = data['title'][:500]  # Truncate dla DB constraints
+                content_hash = self._compute_content_hash(title, data['content'])
+                new_rows.append((content_hash, NewsArticle(
+                    title=title,
+                    content=data['content'],
+                    url=data['url'],
+                    source=data['source'],
+                    published_date=data.get('published_date') or timezone.now(),
+                    content_hash=content_hash,
+                )))
+            
+            # STAGE 3: Exact content duplicates (unique content_hash) - jeden query
+            existing_hashes = set(
+                NewsArticle.objects.filter(
+                    content_hash__in=[content_hash for content_hash, _ in new_rows]
+                ).values_list('content_hash', flat=True)
+            )
+            rows = []
+            batch_hashes = set()
+            for content_hash, row in new_rows:
+                if content_hash in existing_hashes or content_hash in batch_hashes:
+                    content_duplicates += 1
                     continue
+                batch_hashes.add(content_hash)
+                rows.append(row)
+            
+            # STAGE 4: Bulk insert
+            created, conflicts = self._bulk_insert_articles(rows)
+            url_duplicates += conflicts
             
-            # Summary logging dla source
-            total_processed = len(articles_data)
-            logger.info(f"Source '{scraper_name}' summary: {total_processed} articles found, "
-                       f"{new_articles_count} unique, {url_duplicates} URL duplicates, "
-                       f"{content_duplicates} content duplicates")
+        except Exception as e:
+            logger.error(f"Bulk ingestion failed for {scraper_name}: {e}")
+            failed_urls.update(article_data.url for article_data, _ in candidates)
+            created = []
+        
+        # STAGE 5: Batch deduplication (hash + semantic) dla nowych rows
+        if created:
+            try:
+                duplicate_flags = self.duplication_service.process_articles_for_duplicates(created)
+            except Exception as e:
+                # Rows bez dedup są usuwane i traktowane jak failed - watermark ich nie
+                # przesuwa, validators nie są zapisane, więc wrócą w następnym runie
+                logger.error(f"Batch deduplication failed for {scraper_name}: {e}")
+                self._discard_articles(created)
+                failed_urls.update(article.url for article in created)
+                created = []
+        
+        if created:
+            for is_duplicate in duplicate_flags:
+                # Count only truly unique articles
+                if is_duplicate:
+                    content_duplicates += 1
+                else:
+                    new_articles_count += 1
             
-            return new_articles_count
+            # STAGE 6: Inkrementalny update statistics rollup (SourceStats/DailyStats)
+            record_ingested_articles(created, duplicate_flags)
         
+        # High-water mark przesuwamy dopiero po ingestion - failed articles wrócą w następnym runie
+        self._advance_watermark([a for a in articles_data if a.url not in failed_urls])
+        
+        # Validators tylko gdy cały batch został zapisany - inaczej 304 ukryłby failed entries
+        if scraper is not None and not failed_urls:
+            scraper.commit_fetch_state()
+        
+        # Summary logging dla source
+        total_processed = len(articles_data)
+        logger.info(f"Source '{scraper_name}' summary: {total_processed} articles found, "
+                   f"{new_articles_count} unique, {url_duplicates} URL duplicates, "
+                   f"{content_duplicates} content duplicates")
+        
+        return new_articles_count
+    
+    def _discard_articles(self, articles: List):
+        """
+        Usuwa rows zapisane w batchu, którego deduplikacja nie powiodła się.
+        
+        Punkty, które zdążyły trafić do vector index, są usuwane razem z rows
+        (best effort - błąd jest tylko logowany).
+        """
+        from ..models import NewsArticle
+        
+        article_ids = [article.id for article in articles]
+        try:
+            self.duplication_service.vector_deduplicator.remove_articles_from_index(article_ids)
+            self.duplication_service.vector_deduplicator.flush()
         except Exception as e:
-            # Handle scraper-level failures gracefully
-            logger.error(f"Error in scrape_single_source for {scraper_name}: {e}")
-            return 0
+            logger.error(f"Could not remove {len(article_ids)} articles from vector index: {e}")
+        NewsArticle.objects.filter(id__in=article_ids).delete()
+    
+    @staticmethod
+    def _compute_content_hash(title: str, content: str) -> str:
+        """SHA-256 content_hash identyczny z NewsArticle.save() (bulk_create omija save)."""
+        return hashlib.sha256(f"{title}{content}".encode('utf-8')).hexdigest()
+    
+    def _bulk_insert_articles(self, rows: List):
+        """
+        Zapisuje nowe NewsArticle rows jednym bulk_create.
+        
+        Gdy inny proces wstawił ten sam URL / content_hash między lookup a insertem,
+        bulk_create rzuca IntegrityError - wtedy fallback do per-row save w savepoints.
+        
+        Args:
+            rows: Niezapisane NewsArticle objects z wyliczonym content_hash
+            
+        Returns:
+            Tuple[List, int]: (zapisane articles z PK, liczba rows odrzuconych przez conflict)
+        """
+        from ..models import NewsArticle
+        
+        if not rows:
+            return [], 0
+        
+        try:
+            with transaction.atomic():
+                created = NewsArticle.objects.bulk_create(rows)
+        except IntegrityError as e:
+            logger.warning(f"Bulk insert conflict ({e}), falling back to per-row inserts")
+            created = []
+            for row in rows:
+                try:
+                    with transaction.atomic():
+                        row.save()
+                    created.append(row)
+                except IntegrityError:
+                    continue
+            return created, len(rows) - len(created)
+        
+        # Backends bez RETURNING nie ustawiają PK - deduplication potrzebuje article.id
+        if any(article.pk is None for article in created):
+            by_url = NewsArticle.objects.in_bulk([article.url for article in created], field_name='url')
+            created = [by_url[article.url] for article in created if article.url in by_url]
+        
+        return created, 0
+    
+    def _advance_watermark(self, articles_data: List):
+        """
+        Aktualizuje SourceWatermark źródła po ingestion batcha.
+        
+        Zapisuje najnowszy published_date i najnowsze URLs (bounded przez
+        WATERMARK_MAX_URLS), żeby parser w następnym runie mógł zakończyć
+        feed na pierwszym znanym entry zamiast robić sanitization + DB lookup.
+        
+        Args:
+            articles_data: Przetworzone NewsArticleData (bez failed articles)
+        """
+        if not articles_data:
+            return
+        
+        from ..models import SourceWatermark
+        
+        def aware(value):
+            return timezone.make_aware(value, dt_timezone.utc) if timezone.is_naive(value) else value
+        
+        try:
+            for source, batch in groupby(sorted(articles_data, key=lambda a: a.source), key=lambda a: a.source):
+                batch = sorted(batch, key=lambda a: aware(a.published_date), reverse=True)
+                state, _ = SourceWatermark.objects.get_or_create(source=source)
+                
+                newest = aware(batch[0].published_date)
+                if state.newest_published is None or newest > state.newest_published:
+                    state.newest_published = newest
+                
+                urls = list(dict.fromkeys([a.url for a in batch] + list(state.recent_urls or [])))
+                state.recent_urls = urls[:self.WATERMARK_MAX_URLS]
+                state.save()
+        except Exception as e:
+            logger.warning(f"Could not advance watermark: {e}")
     
     def generate_daily_summary(self, topic_category: str = "AI News") -> Optional:
         """
@@ -451,7 +794,8 @@ class NewsOrchestrationService:
         
         return results
     
-    def get_latest_articles(self, limit: int = 50, unique_only: bool = True) -> List:
+    def get_latest_articles(self, limit: int = 50, unique_only: bool = True,
+                            lean: bool = False) -> List:
         """
         Retrieves lista most recently published articles z database.
         
@@ -469,6 +813,7 @@ class NewsOrchestrationService:
                   Controls pagination i performance
             unique_only: Filter only unique articles (default True)
                         True = only non-duplicates, False = all articles
+            lean: Lean projection dla list views (content i embedding_vector deferred)
                         
         Returns:
             List[NewsArticle]: Ordered lista articles (newest first)
@@ -486,8 +831,8 @@ class NewsOrchestrationService:
         """
         from ..models import NewsArticle
         
-        # Start z base queryset
-        queryset = NewsArticle.objects.all()
+        # Start z base queryset - lean projection opt-in dla list views
+        queryset = NewsArticle.objects.lean() if lean else NewsArticle.objects.all()
         
         # Apply unique filter conditionally
         if unique_only:
@@ -496,7 +841,7 @@ class NewsOrchestrationService:
         # Order by date (newest first) i apply limit
         return list(queryset.order_by('-published_date')[:limit])
     
-    def get_articles_by_source(self, source: str, limit: int = 20) -> List:
+    def get_articles_by_source(self, source: str, limit: int = 20, lean: bool = False) -> List:
         """
         Retrieves articles z specific news source w chronological order.
         
@@ -514,6 +859,7 @@ class NewsOrchestrationService:
                    Must match NewsArticle.source field exactly
             limit: Maximum articles to return (default 20)
                   Reasonable default dla source-specific queries
+            lean: Lean projection (content i embedding_vector deferred)
                   
         Returns:
             List[NewsArticle]: Articles z specified source (newest first)
@@ -532,8 +878,9 @@ class NewsOrchestrationService:
         from ..models import NewsArticle
         
         # Query articles z specific source
+        queryset = NewsArticle.objects.lean() if lean else NewsArticle.objects
         return list(
-            NewsArticle.objects.filter(
+            queryset.filter(
                 source=source,              # Exact source match
                 is_duplicate=False          # Only unique articles
             ).order_by('-published_date')[:limit]  # Newest first, limited
@@ -571,50 +918,43 @@ class NewsOrchestrationService:
                  - 'total_summaries': BlogSummary count
                  
         Performance:
-            Multiple optimized database queries
-            Source statistics calculated efficiently
+            Article counts z SourceStats rollup (collect_article_statistics)
+            plus jeden BlogSummary count - niezależnie od rozmiaru archiwum
             Cached scraper list z Factory
         """
-        from ..models import NewsArticle, BlogSummary
+        from ..models import BlogSummary
         from .parsers import ScraperFactory
         
-        # Core database statistics
-        total_articles = NewsArticle.objects.count()
-        unique_articles = NewsArticle.objects.filter(is_duplicate=False).count()
-        duplicates = NewsArticle.objects.filter(is_duplicate=True).count()
-        
-        # Per-source detailed statistics
-        source_stats = {}
-        for source in NewsArticle.objects.values_list('source', flat=True).distinct():
-            source_stats[source] = {
-                'total': NewsArticle.objects.filter(source=source).count(),
-                'unique': NewsArticle.objects.filter(source=source, is_duplicate=False).count()
-            }
+        # Total/unique/duplicates i per-source breakdown z SourceStats rollup
+        stats = collect_article_statistics()
         
         # Comprehensive system statistics
         return {
-            'total_articles': total_articles,           # All articles w database
-            'unique_articles': unique_articles,         # After deduplication
-            'duplicates': duplicates,                   # Detected duplicates
-            'duplicate_rate': (duplicates / total_articles * 100) if total_articles > 0 else 0,  # Efficiency %
-            'source_statistics': source_stats,          # Per-source breakdown
+            'total_articles': stats['total_articles'],        # All articles w database
+            'unique_articles': stats['unique_articles'],      # After deduplication
+            'duplicates': stats['duplicates'],                # Detected duplicates
+            'duplicate_rate': stats['duplicate_rate'],        # Efficiency %
+            'source_statistics': stats['source_statistics'],  # Per-source breakdown
             'available_scrapers': ScraperFactory.get_available_scrapers(),  # Active scrapers
             'total_summaries': BlogSummary.objects.count()  # Generated content
         }
     
-    def cleanup_old_articles(self, days: int = 30) -> int:
+    def cleanup_old_articles(self, days: int = 30, chunk_size: Optional[int] = None,
+                             progress_callback=None) -> int:
         """
         Performs maintenance cleanup removing old articles i associated data.
         
         Database maintenance operation dla removing articles older than specified
         threshold. Includes cleanup z vector database dla complete removal.
+        Deleguje do ArticleRetentionEngine - pracuje w bounded chunkach, więc
+        pruning dziesiątek tysięcy rows nie trzyma jednej długiej transakcji.
         
-        Workflow:
-        1. Calculate cutoff date based na days parameter
-        2. Query old articles based na scraped_date
-        3. Remove articles z vector index (Qdrant)
-        4. Delete articles z main database
-        5. Return count removed articles
+        Workflow (per chunk):
+        1. Stream IDs old articles (scraped_date < cutoff) w chunkach
+        2. Dołącz duplikaty wskazujące na chunk (duplicate_of CASCADE)
+        3. Jeden batched delete z vector index (Qdrant / FAISS)
+        4. Rollup delta + delete rows w jednej krótkiej transakcji
+        5. Progress report (logger + progress_callback)
         
         Wykorzystywana przez:
         - Scheduled maintenance tasks
@@ -625,46 +965,36 @@ class NewsOrchestrationService:
         Args:
             days: Age threshold w days (default 30)
                  Articles older than this będą removed
+            chunk_size: Articles per chunk (None = AppConfig.retention_chunk_size)
+            progress_callback: Optional callback(processed, total) po każdym chunku
                  
         Returns:
-            int: Number articles removed
+            int: Number articles removed (łącznie z kaskadowanymi duplikatami)
                 0 jeśli no old articles found
                 
         Safety Features:
-            Vector index cleanup before database deletion
-            Error handling dla partial failures
+            Vector index cleanup before database deletion (per chunk)
+            Error handling dla partial failures - failed chunk nie przerywa retencji
             Comprehensive logging dla audit trail
             
-        Performance:
-            Batch deletion dla efficiency
-            Date-based query optimization
-            Two-phase cleanup dla data integrity
-            
         Warning:
             Destructive operation - permanently removes articles
             Should be used carefully w production environments
         """
         from datetime import timedelta
         from ..models import NewsArticle
+        from ..core.config import get_app_config
+        from .retention import ArticleRetentionEngine
         
         # Calculate cutoff date dla cleanup threshold
         cutoff_date = timezone.now() - timedelta(days=days)
         
-        # Query old articles based na scraped_date
-        old_articles = NewsArticle.objects.filter(scraped_date__lt=cutoff_date)
-        count = old_articles.count()
-        
-        # PHASE 1: Remove z vector index first (data consistency)
-        for article in old_articles:
-            try:
-                # Clean vector database dla complete removal
-                self.duplication_service.vector_deduplicator.remove_article_from_index(article.id)
-            except Exception as e:
-                # Log individual failures ale continue cleanup
-                logger.error(f"Error removing article {article.id} from vector index: {e}")
-        
-        # PHASE 2: Delete articles z main database
-        old_articles.delete()
+        engine = ArticleRetentionEngine(
+            vector_deduplicator=self.duplication_service.vector_deduplicator,
+            chunk_size=chunk_size or get_app_config().retention_chunk_size,
+            progress_callback=progress_callback
+        )
+        count = engine.purge(NewsArticle.objects.filter(scraped_date__lt=cutoff_date))
         
         logger.info(f"Cleaned up {count} old articles")
         return count
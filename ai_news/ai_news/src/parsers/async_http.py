@@ -0,0 +1,105 @@
+"""
+Shared asyncio HTTP client dla async fetch path parserów.
+
+Jeden httpx.AsyncClient (connection pooling, keep-alive) współdzielony przez wszystkie
+parsery w danym event loop. Pozwala jednemu event loop obsłużyć wszystkie RSS feedy
+i Hacker News item API zamiast blokować wątek per request.
+
+Usage:
+    import asyncio
+    from ai_news.src.parsers.async_http import scrape_many
+
+    results = asyncio.run(scrape_many({"openai_blog": scraper}))
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, Optional, Tuple, Union, List
+
+import httpx
+
+from .base import BaseScraper, NewsArticleData, DEFAULT_USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+# Pool limits - 41 feedów + HN items mieszczą się w jednym pool
+DEFAULT_TIMEOUT = 15.0
+DEFAULT_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# Client jest związany z event loop, w którym powstał
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Zwraca shared AsyncClient dla bieżącego event loop (tworzy go leniwie).
+
+    httpx connection pool nie może być współdzielony między event loops,
+    więc nowy loop (np. kolejne asyncio.run()) dostaje nowy client.
+
+    Returns:
+        httpx.AsyncClient: Client z browser User-Agent i connection pooling
+
+    Raises:
+        RuntimeError: Gdy wywołana poza działającym event loop
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            headers={'User-Agent': DEFAULT_USER_AGENT},
+            timeout=DEFAULT_TIMEOUT,
+            limits=DEFAULT_LIMITS,
+            follow_redirects=True,
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_async_client():
+    """Zamyka shared client (wywoływać przed zakończeniem event loop)."""
+    global _client, _client_loop
+
+    if _client is not None and not _client.is_closed and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
+
+async def scrape_many(scrapers: Dict[str, BaseScraper],
+                      per_host_limit: int = 2) -> Dict[str, Union[Tuple[List[NewsArticleData], float], Exception]]:
+    """
+    Uruchamia ascrape() wszystkich parserów równolegle w jednym event loop.
+
+    Per-host asyncio.Semaphore ogranicza liczbę równoległych requestów
+    do tej samej domeny. Shared client jest zamykany po zakończeniu.
+
+    Args:
+        scrapers: Mapping scraper_name -> instancja parsera
+        per_host_limit: Max równoległych scrapów per hostname (default 2)
+
+    Returns:
+        Dict: scraper_name -> (articles, wall_time_seconds) lub Exception
+              gdy parser rzucił wyjątek (error isolation per source)
+    """
+    semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def run(scraper: BaseScraper):
+        started = time.monotonic()
+        semaphore = semaphores.setdefault(scraper.host, asyncio.Semaphore(max(1, per_host_limit)))
+        async with semaphore:
+            articles = await scraper.ascrape()
+        return articles, time.monotonic() - started
+
+    names = list(scrapers)
+    try:
+        outcomes = await asyncio.gather(
+            *(run(scrapers[name]) for name in names),
+            return_exceptions=True
+        )
+    finally:
+        await close_async_client()
+
+    return dict(zip(names, outcomes))
@@ -1,12 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from datetime import datetime
+from typing import List, Optional, Set, Tuple
+import asyncio
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
 import requests
 import logging
 
 # Logger do zapisywania informacji o działaniu parserów
 logger = logging.getLogger(__name__)
 
+# User-Agent imitujący przeglądarkę - współdzielony przez sync session i async client
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
 
 class NewsArticleData:
     """
@@ -71,6 +76,9 @@ class BaseScraper(ABC):
     
     Implementacje muszą zdefiniować:
     - scrape(): główna metoda pobierająca dane ze źródła
+    
+    Implementacje mogą nadpisać:
+    - ascrape(): asyncio-native wariant scrape() używający shared async client
     """
     
     def __init__(self, source_name: str):
@@ -92,7 +100,7 @@ class BaseScraper(ABC):
         # Ustawiamy User-Agent żeby wyglądać jak prawdziwa przeglądarka
         # Chroni przed blokowaniem przez systemy anti-bot
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': DEFAULT_USER_AGENT
         })
     
     @abstractmethod
@@ -113,6 +121,112 @@ class BaseScraper(ABC):
         """
         pass
     
+    async def ascrape(self) -> List[NewsArticleData]:
+        """
+        Asynchroniczny wariant scrape() dla async fetch path.
+        
+        Domyślna implementacja uruchamia blokujący scrape() w worker thread,
+        więc każdy parser działa w event loop nawet bez natywnego wsparcia.
+        RSSFeedScraper i HackerNewsScraper nadpisują tę metodę i pobierają
+        dane przez shared httpx.AsyncClient (connection pooling, bez wątku per request).
+        
+        Wykorzystywana przez:
+        - async_http.scrape_many() do równoległego scrapingu w jednym event loop
+        - NewsOrchestrationService.scrape_all_sources(use_async=True)
+        
+        Returns:
+            List[NewsArticleData]: Lista znalezionych artykułów (jak scrape())
+        """
+        return await asyncio.to_thread(self.scrape)
+    
+    async def _afetch(self, url: str, timeout: float = 10, **kwargs):
+        """
+        Pobiera URL przez shared async HTTP client.
+        
+        Args:
+            url: Adres do pobrania
+            timeout: Timeout w sekundach (default 10, jak sync session calls)
+            **kwargs: Dodatkowe argumenty httpx (np. headers)
+            
+        Returns:
+            httpx.Response: Odpowiedź HTTP (caller decyduje o raise_for_status)
+        """
+        from .async_http import get_async_client
+        
+        client = get_async_client()
+        return await client.get(url, timeout=timeout, **kwargs)
+    
+    def commit_fetch_state(self):
+        """
+        Persistuje fetch-side state (np. HTTP validators) ostatniego scrape().
+        
+        Wywoływana przez NewsOrchestrationService dopiero po udanej ingestion
+        artykułów - state zapisany wcześniej pozwoliłby źródłu odpowiedzieć
+        304 Not Modified na entries, które nigdy nie trafiły do bazy.
+        Domyślnie no-op (parser bez fetch state).
+        """
+        pass
+    
+    @property
+    def host(self) -> str:
+        """
+        Zwraca hostname źródła używany do limitowania równoległych połączeń.
+        
+        Wykorzystywana przez NewsOrchestrationService w trybie concurrent scraping
+        do per-host concurrency cap (kilka feedów z tej samej domeny nie może
+        jednocześnie otwierać nieograniczonej liczby połączeń).
+        
+        Returns:
+            str: Hostname endpointu (np. "techcrunch.com") lub source_name
+                 gdy parser nie ma URL-a
+        """
+        endpoint = getattr(self, 'feed_url', None) or getattr(self, 'api_url', None)
+        if endpoint:
+            return urlparse(endpoint).netloc.lower()
+        return self.source_name
+    
+    # High-water mark: entries starsze niż newest_published - grace kończą parsing feedu,
+    # a znane URLs są pomijane bez sanitization / DB lookup w ingestion
+    use_watermark = True
+    watermark_grace = timedelta(days=2)
+    
+    def _load_watermark(self) -> Tuple[Optional[float], Set[str]]:
+        """
+        Wczytuje persisted high-water mark dla tego źródła (SourceWatermark).
+        
+        Grace window pokrywa feedy publikujące entries z opóźnionym pubDate -
+        w tym oknie o "known" decyduje zbiór recent URLs, a nie timestamp.
+        
+        Returns:
+            Tuple: (cutoff_timestamp lub None, set znanych URLs)
+                   (None, set()) gdy brak stanu lub watermark wyłączony
+        """
+        if not self.use_watermark:
+            return None, set()
+        
+        from ...models import SourceWatermark
+        
+        try:
+            state = SourceWatermark.objects.filter(source=self.source_name).first()
+        except Exception as e:
+            logger.warning(f"Could not load watermark for {self.source_name}: {e}")
+            return None, set()
+        
+        if state is None:
+            return None, set()
+        
+        cutoff = None
+        if state.newest_published is not None:
+            cutoff = self._timestamp(state.newest_published - self.watermark_grace)
+        return cutoff, set(state.recent_urls or [])
+    
+    @staticmethod
+    def _timestamp(value: datetime) -> float:
+        """Unix timestamp dla porównań - naive datetimes traktowane jako UTC (jak Django przy zapisie)."""
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    
     def _clean_text(self, text: str) -> str:
         """
         Czyści i normalizuje tekst z różnych źródeł.
@@ -187,4 +301,4 @@ class BaseScraper(ABC):
                 logger.warning(f"Could not parse date: {date_str}")
                 
                 # Fallback do current time - artykuł będzie traktowany jako "fresh"
-                return datetime.now()
\ No newline at end of file
+                return datetime.now()
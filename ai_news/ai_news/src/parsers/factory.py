@@ -47,7 +47,7 @@ class ScraperFactory:
         dziedziczących po BaseScraper. Generuje przyjazne nazwy na podstawie nazw klas.
         
         Mechanizm działania:
-        1. Skanuje pliki .py (pomija base.py, factory.py, __init__.py)
+        1. Skanuje pliki .py (pomija base.py, factory.py, async_http.py, __init__.py)
         2. Importuje każdy moduł używając importlib
         3. Używa inspect.getmembers() do znajdowania klas
         4. Filtruje klasy dziedziczące po BaseScraper
@@ -72,7 +72,7 @@ class ScraperFactory:
         # Skanujemy wszystkie pliki Python w folderze
         for filename in os.listdir(current_dir):
             # Filtrujemy tylko pliki .py, pomijając utility files
-            if filename.endswith('.py') and filename not in ['__init__.py', 'base.py', 'factory.py']:
+            if filename.endswith('.py') and filename not in ['__init__.py', 'base.py', 'factory.py', 'async_http.py']:
                 module_name = filename[:-3]  # Usuwamy rozszerzenie .py
                 
                 try:
@@ -1,6 +1,10 @@
-from typing import List
-from datetime import datetime
+from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import asyncio
 import logging
+import os
+import threading
 import time
 from .base import BaseScraper, NewsArticleData
 from ..security import RateLimiter
@@ -41,8 +45,11 @@ class HackerNewsScraper(BaseScraper):
     - Research workflows dla tech industry insights
     
     Performance Considerations:
-    - Limited to 30 stories (max_stories) dla API efficiency
-    - Individual API calls dla each story (necessary due to API design)
+    - max_stories (default 30, env HN_MAX_STORIES) limituje głębokość top list
+    - Item requests biegną równolegle (HN_MAX_WORKERS) w ramach shared rate budget
+      (HN_REQUESTS_PER_MINUTE), bez fixed delay między requestami
+    - Item cache (tabela HackerNewsItem, row per story id) - stories z poprzednich
+      runów (cron, management command) nie są pobierane ponownie
     - Timeout handling dla network reliability
     - Error isolation - failed stories don't crash entire operation
     
@@ -57,7 +64,8 @@ class HackerNewsScraper(BaseScraper):
     - File: hackernews_scraper.py
     """
     
-    def __init__(self):
+    def __init__(self, max_stories: Optional[int] = None, max_workers: Optional[int] = None,
+                 requests_per_minute: Optional[int] = None, item_cache_ttl: Optional[int] = None):
         """
         Inicjalizuje HackerNewsScraper z API configuration i limits.
         
@@ -67,7 +75,13 @@ class HackerNewsScraper(BaseScraper):
         Configuration:
         - source_name: "Hacker News" dla database identification
         - api_url: Firebase API base URL
-        - max_stories: 30 stories limit dla performance i politeness
+        - max_stories: Głębokość top stories list (default 30)
+        - max_workers: Równoległe item requests (default 8)
+        - requests_per_minute: Rate budget dla item requests (default 120)
+        - item_cache_ttl: TTL item cache w sekundach (default 24h, 0 = bez cache)
+        
+        ScraperFactory tworzy parser bez argumentów, więc defaults pochodzą
+        z env (HN_MAX_STORIES, HN_MAX_WORKERS, HN_REQUESTS_PER_MINUTE, HN_ITEM_CACHE_TTL).
         
         API Architecture:
         - Firebase backend provides JSON endpoints
@@ -75,7 +89,6 @@ class HackerNewsScraper(BaseScraper):
         - No authentication required dla public access
         
         Performance Settings:
-        - 30 stories max balances coverage z API efficiency
         - Individual timeouts dla network reliability
         - Error isolation prevents cascade failures
         """
@@ -84,10 +97,16 @@ class HackerNewsScraper(BaseScraper):
         
         # Firebase API configuration
         self.api_url = "https://hacker-news.firebaseio.com/v0"  # Official API endpoint
-        self.max_stories = 30  # Balance coverage z API politeness
+        self.max_stories = max_stories if max_stories is not None else int(os.getenv('HN_MAX_STORIES', '30'))
+        self.max_workers = max(1, max_workers if max_workers is not None else int(os.getenv('HN_MAX_WORKERS', '8')))
+        self.item_cache_ttl = (item_cache_ttl if item_cache_ttl is not None
+                               else int(os.getenv('HN_ITEM_CACHE_TTL', str(24 * 60 * 60))))
         
-        # Rate limiting dla API protection (10 requests per minute)
-        self.rate_limiter = RateLimiter(max_requests=10, time_window=60)
+        # Rate limiting dla API protection - budget współdzielony przez wszystkie workers
+        requests_per_minute = (requests_per_minute if requests_per_minute is not None
+                               else int(os.getenv('HN_REQUESTS_PER_MINUTE', '120')))
+        self.rate_limiter = RateLimiter(max_requests=max(1, requests_per_minute), time_window=60)
+        self._rate_lock = threading.Lock()
     
     def scrape(self) -> List[NewsArticleData]:
         """
@@ -106,14 +125,15 @@ class HackerNewsScraper(BaseScraper):
                                   
         API Workflow:
         - GET /topstories.json → array of story IDs
-        - For each ID: GET /item/{id}.json → story details
+        - Cached IDs: item document z cache (bez requestu)
+        - Pozostałe IDs: GET /item/{id}.json równolegle (max_workers)
         - Filter: type='story', has URL, has title
         - Transform: API format → NewsArticleData
         
         Error Handling:
         - Individual story failures logged ale don't stop process
         - Network timeouts handled gracefully
-        - API rate limiting respected through reasonable delays
+        - API rate limiting respected through shared rate budget
         - Empty result returned na complete failure
         
         Content Quality:
@@ -139,48 +159,24 @@ class HackerNewsScraper(BaseScraper):
             story_ids = response.json()[:self.max_stories]
             logger.info(f"Retrieved {len(story_ids)} story IDs from top stories")
             
-            # STAGE 2: Fetch individual story details
-            logger.info(f"Processing {len(story_ids)} individual stories...")
+            # STAGE 2: Fetch individual story details (cache first, reszta równolegle)
+            stories = self._get_cached_items(story_ids)
+            missing_ids = [story_id for story_id in story_ids if story_id not in stories]
+            logger.info(f"Processing {len(story_ids)} stories ({len(missing_ids)} not cached)...")
+            
+            if missing_ids:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing_ids))) as executor:
+                    fetched = dict(zip(missing_ids, executor.map(self._fetch_story, missing_ids)))
+                self._cache_items(fetched)
+                stories.update(fetched)
+            
+            # Zachowujemy kolejność top stories; top list nie jest chronologiczna,
+            # więc z high-water mark używamy tylko znanych URLs (bez timestamp cutoff)
+            _, known_urls = self._load_watermark()
             for story_id in story_ids:
-                try:
-                    # SECURITY: Rate limiting protection
-                    if not self.rate_limiter.is_allowed():
-                        wait_time = self.rate_limiter.wait_time()
-                        logger.warning(f"Rate limit reached, waiting {wait_time:.1f}s before next request")
-                        time.sleep(wait_time)
-                    
-                    # Small delay between requests dla API politeness
-                    time.sleep(0.1)  # 100ms delay
-                    
-                    # Fetch individual story data
-                    story_response = self.session.get(
-                        f"{self.api_url}/item/{story_id}.json",
-                        timeout=10  # Per-story timeout
-                    )
-                    story_response.raise_for_status()
-                    story = story_response.json()
-                    
-                    # Quality filtering: only external stories z URLs
-                    # Excludes Ask HN, Show HN, polls, discussions
-                    if (story.get('type') == 'story' and        # Must be story type
-                        story.get('url') and                    # Must have external URL
-                        story.get('title')):                   # Must have title
-                        
-                        # Convert API response to NewsArticleData format
-                        article = NewsArticleData(
-                            title=self._clean_text(story.get('title', '')),     # Clean title
-                            content=self._clean_text(story.get('text', '')),     # Story text (often empty)
-                            url=story.get('url', ''),                           # External link
-                            source=self.source_name,                            # "Hacker News"
-                            published_date=datetime.fromtimestamp(story.get('time', 0)),  # Unix timestamp
-                            author=story.get('by', '')                          # HN username
-                        )
-                        articles.append(article)
-                        
-                except Exception as e:
-                    # Individual story failure doesn't stop batch process
-                    logger.error(f"Error processing Hacker News story {story_id}: {e}")
-                    continue  # Skip failed story, continue z others
+                article = self._story_to_article(stories.get(story_id))
+                if article and article.url not in known_urls:
+                    articles.append(article)
             
             logger.info(f"Successfully scraped {len(articles)} articles from Hacker News")
             
@@ -188,4 +184,171 @@ class HackerNewsScraper(BaseScraper):
             # Handle API-level failures gracefully
             logger.error(f"Error scraping Hacker News API: {e}")
         
-        return articles
\ No newline at end of file
+        return articles
+    
+    async def ascrape(self) -> List[NewsArticleData]:
+        """
+        Asyncio-native wariant scrape() używający shared async client.
+        
+        Top stories list i /item/{id}.json documents są pobierane przez
+        httpx.AsyncClient; niecached item requests biegną równolegle (asyncio.gather
+        ograniczony do max_workers), a RateLimiter jest respektowany przez
+        asyncio.sleep zamiast time.sleep.
+        
+        Returns:
+            List[NewsArticleData]: Processed Hacker News stories (jak scrape())
+        """
+        from asgiref.sync import sync_to_async
+        
+        try:
+            logger.info(f"Starting Hacker News API scraping (async): {self.api_url}")
+            
+            response = await self._afetch(f"{self.api_url}/topstories.json")
+            response.raise_for_status()
+            story_ids = response.json()[:self.max_stories]
+            
+            stories = await self._aget_cached_items(story_ids)
+            missing_ids = [story_id for story_id in story_ids if story_id not in stories]
+            
+            semaphore = asyncio.Semaphore(self.max_workers)
+            
+            async def fetch(story_id):
+                async with semaphore:
+                    return await self._afetch_story(story_id)
+            
+            fetched = dict(zip(missing_ids, await asyncio.gather(*(fetch(story_id) for story_id in missing_ids))))
+            await self._acache_items(fetched)
+            stories.update(fetched)
+            
+            # Zachowujemy kolejność top stories, pomijając URLs znane z high-water mark
+            _, known_urls = await sync_to_async(self._load_watermark)()
+            articles = [article for article in (self._story_to_article(stories.get(story_id))
+                                                for story_id in story_ids)
+                        if article and article.url not in known_urls]
+            logger.info(f"Successfully scraped {len(articles)} articles from Hacker News")
+            return articles
+            
+        except Exception as e:
+            logger.error(f"Error scraping Hacker News API: {e}")
+            return []
+    
+    def _fetch_story(self, story_id) -> Optional[dict]:
+        """Pobiera pojedynczy item przez requests session w ramach rate budget."""
+        try:
+            # SECURITY: Rate limiting protection (shared przez worker threads)
+            while True:
+                with self._rate_lock:
+                    if self.rate_limiter.is_allowed():
+                        break
+                    wait_time = self.rate_limiter.wait_time()
+                logger.warning(f"Rate limit reached, waiting {wait_time:.1f}s before next request")
+                time.sleep(wait_time)
+            
+            story_response = self.session.get(
+                f"{self.api_url}/item/{story_id}.json",
+                timeout=10  # Per-story timeout
+            )
+            story_response.raise_for_status()
+            return story_response.json()
+        except Exception as e:
+            # Individual story failure doesn't stop batch process
+            logger.error(f"Error processing Hacker News story {story_id}: {e}")
+            return None
+    
+    def _item_cache_cutoff(self) -> datetime:
+        """Najstarszy fetched_at, który jest jeszcze w TTL item cache."""
+        from django.utils import timezone
+        return timezone.now() - timedelta(seconds=self.item_cache_ttl)
+    
+    def _get_cached_items(self, story_ids: List[int]) -> Dict[int, dict]:
+        """Zwraca cached item documents dla podanych story IDs (story_id -> item), jeden query."""
+        if self.item_cache_ttl <= 0 or not story_ids:
+            return {}
+        
+        from ...models import HackerNewsItem
+        
+        try:
+            return dict(HackerNewsItem.objects.filter(
+                item_id__in=story_ids, fetched_at__gte=self._item_cache_cutoff()
+            ).values_list('item_id', 'payload'))
+        except Exception as e:
+            logger.warning(f"Hacker News item cache unavailable: {e}")
+            return {}
+    
+    def _cache_items(self, stories: Dict[int, Optional[dict]]):
+        """Upsert pobranych item documents (failed fetches są pomijane) i usunięcie wygasłych."""
+        items = {story_id: story for story_id, story in stories.items() if story}
+        if self.item_cache_ttl <= 0 or not items:
+            return
+        
+        from django.utils import timezone
+        from ...models import HackerNewsItem
+        
+        try:
+            now = timezone.now()
+            HackerNewsItem.objects.bulk_create(
+                [HackerNewsItem(item_id=story_id, payload=story, fetched_at=now) for story_id, story in items.items()],
+                update_conflicts=True,
+                unique_fields=['item_id'],
+                update_fields=['payload', 'fetched_at']
+            )
+            # Wygasłe items nie wrócą z cache - tabela nie rośnie bez końca
+            HackerNewsItem.objects.filter(fetched_at__lt=self._item_cache_cutoff()).delete()
+        except Exception as e:
+            logger.warning(f"Failed to cache Hacker News items: {e}")
+    
+    async def _aget_cached_items(self, story_ids: List[int]) -> Dict[int, dict]:
+        """Async wariant _get_cached_items (ORM nie może działać w event loop)."""
+        from asgiref.sync import sync_to_async
+        return await sync_to_async(self._get_cached_items)(story_ids)
+    
+    async def _acache_items(self, stories: Dict[int, Optional[dict]]):
+        """Async wariant _cache_items."""
+        from asgiref.sync import sync_to_async
+        await sync_to_async(self._cache_items)(stories)
+    
+    async def _afetch_story(self, story_id) -> Optional[dict]:
+        """Pobiera pojedynczy item przez async client z rate limiting."""
+        try:
+            # SECURITY: Rate limiting protection - nie blokuje event loop
+            while not self.rate_limiter.is_allowed():
+                await asyncio.sleep(self.rate_limiter.wait_time())
+            
+            story_response = await self._afetch(f"{self.api_url}/item/{story_id}.json")
+            story_response.raise_for_status()
+            return story_response.json()
+        except Exception as e:
+            logger.error(f"Error processing Hacker News story {story_id}: {e}")
+            return None
+    
+    def _story_to_article(self, story: Optional[dict]) -> Optional[NewsArticleData]:
+        """
+        Konwertuje HN item JSON na NewsArticleData z quality filtering.
+        
+        Only external stories z URLs - excludes Ask HN, Show HN, polls, discussions.
+        
+        Args:
+            story: Item document z /item/{id}.json (może być None)
+            
+        Returns:
+            Optional[NewsArticleData]: Artykuł lub None gdy story nie przechodzi filtrów
+        """
+        if not story:
+            return None
+        
+        # Quality filtering: only external stories z URLs
+        if (story.get('type') == 'story' and        # Must be story type
+            story.get('url') and                    # Must have external URL
+            story.get('title')):                   # Must have title
+            
+            # Convert API response to NewsArticleData format
+            return NewsArticleData(
+                title=self._clean_text(story.get('title', '')),     # Clean title
+                content=self._clean_text(story.get('text', '')),     # Story text (often empty)
+                url=story.get('url', ''),                           # External link
+                source=self.source_name,                            # "Hacker News"
+                published_date=datetime.fromtimestamp(story.get('time', 0)),  # Unix timestamp
+                author=story.get('by', '')                          # HN username
+            )
+        
+        return None
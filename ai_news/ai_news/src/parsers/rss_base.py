@@ -1,4 +1,5 @@
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
+import asyncio
 import feedparser  # Parsing RSS/Atom feeds
 import logging
 from .base import BaseScraper, NewsArticleData
@@ -22,6 +23,8 @@ class RSSFeedScraper(BaseScraper):
     - Strategy Pattern: _extract_content() może być override'owana przez subklasy
     - Error Recovery: graceful handling malformed feeds i missing fields
     - Content Intelligence: próbuje multiple fields do znalezienia treści
+    - Conditional GET: ETag / Last-Modified persistowane w FeedCacheState,
+      304 Not Modified pomija parsing całkowicie
     
     Wykorzystywana przez:
     - OpenAIBlogScraper, GoogleAIBlogScraper, ArsTechnicaScraper (RSS feeds)
@@ -35,6 +38,9 @@ class RSSFeedScraper(BaseScraper):
     - Custom RSS variants z różnymi polami
     """
     
+    # Wysyłaj zapisane validators (If-None-Match / If-Modified-Since) przy fetchu
+    use_conditional_get = True
+    
     def __init__(self, source_name: str, feed_url: str):
         """
         Inicjalizuje RSS scraper z nazwą źródła i URL feedu.
@@ -45,6 +51,8 @@ class RSSFeedScraper(BaseScraper):
         """
         super().__init__(source_name)  # Inicjalizuje BaseScraper (HTTP session etc.)
         self.feed_url = feed_url
+        # Validators ostatniego fetchu (etag, modified, status) - zapisywane w commit_fetch_state()
+        self._pending_validators: Optional[Tuple[Optional[str], Optional[str], Optional[int]]] = None
     
     def scrape(self) -> List[NewsArticleData]:
         """
@@ -69,48 +77,196 @@ class RSSFeedScraper(BaseScraper):
             Używa graceful error handling - pojedynczy broken entry nie crashuje całego feed'u.
             Loguje progress i błędy dla debugowania.
         """
-        articles = []
-        
         try:
             logger.info(f"Scraping RSS feed: {self.feed_url}")
-            # feedparser.parse() obsługuje HTTP requests, caching i różne formaty RSS
-            feed = feedparser.parse(self.feed_url)
+            validators = self._load_validators()
             
-            # Sprawdzamy czy feed ma entries - basic validation RSS format
-            if not hasattr(feed, 'entries'):
-                logger.error(f"Invalid RSS feed format: {self.feed_url}")
-                return articles
+            # feedparser.parse() obsługuje HTTP requests, conditional GET i różne formaty RSS
+            feed = feedparser.parse(self.feed_url, **validators)
             
-            # Przetwarzamy każdy entry w RSS feed
-            for entry in feed.entries:
-                try:
-                    # Ekstraktujemy kluczowe dane artykułu używając RSS fields
-                    title = self._clean_text(entry.get('title', ''))           # <title>
-                    content = self._extract_content(entry)                     # <description>/<content>
-                    url = entry.get('link', '')                               # <link>
-                    published_date = self._parse_date(entry.get('published', ''))  # <pubDate>
-                    author = entry.get('author', '')                          # <author>
-                    
-                    # Minimum required fields validation
-                    if title and url:  # Title i URL są wymagane dla deduplication
-                        article = NewsArticleData(
-                            title=title,
-                            content=content,
-                            url=url,
-                            source=self.source_name,
-                            published_date=published_date,
-                            author=author
-                        )
-                        articles.append(article)
-                        
-                except Exception as e:
-                    logger.error(f"Error processing RSS entry: {e}")
-                    continue
-                    
-            logger.info(f"Successfully scraped {len(articles)} articles from {self.source_name}")
+            status = feed.get('status') if hasattr(feed, 'get') else None
+            if status == 304:
+                logger.info(f"RSS feed not modified since last run: {self.feed_url}")
+                self._pending_validators = (validators.get('etag'), validators.get('modified'), 304)
+                return []
             
+            articles = self._parse_feed(feed, self._load_watermark())
+            self._pending_validators = (feed.get('etag'), feed.get('modified'), status)
+            return articles
         except Exception as e:
             logger.error(f"Error scraping RSS feed {self.feed_url}: {e}")
+            return []
+    
+    async def ascrape(self) -> List[NewsArticleData]:
+        """
+        Asyncio-native wariant scrape() - pobiera feed przez shared async client.
+        
+        Download idzie przez httpx.AsyncClient (connection pooling), a surowe bajty
+        trafiają do feedparser.parse() w worker thread, żeby parsing XML
+        nie blokował event loop dla pozostałych feedów.
+        
+        Returns:
+            List[NewsArticleData]: Lista artykułów z RSS feed (jak scrape())
+        """
+        from asgiref.sync import sync_to_async
+        
+        try:
+            logger.info(f"Scraping RSS feed (async): {self.feed_url}")
+            validators = await sync_to_async(self._load_validators)()
+            
+            headers = {}
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('modified'):
+                headers['If-Modified-Since'] = validators['modified']
+            
+            response = await self._afetch(self.feed_url, headers=headers)
+            if response.status_code == 304:
+                logger.info(f"RSS feed not modified since last run: {self.feed_url}")
+                self._pending_validators = (validators.get('etag'), validators.get('modified'), 304)
+                return []
+            response.raise_for_status()
+            
+            feed = await asyncio.to_thread(feedparser.parse, response.content)
+            articles = self._parse_feed(feed, await sync_to_async(self._load_watermark)())
+            self._pending_validators = (
+                response.headers.get('etag'), response.headers.get('last-modified'), response.status_code
+            )
+            return articles
+        except Exception as e:
+            logger.error(f"Error scraping RSS feed {self.feed_url}: {e}")
+            return []
+    
+    def commit_fetch_state(self):
+        """
+        Zapisuje validators ostatniego fetchu (po udanej ingestion jego artykułów).
+        
+        Gdy ingestion się nie powiedzie, validators nie są zapisywane - następny
+        run robi pełny fetch zamiast dostać 304 dla nie zapisanych entries.
+        """
+        if self._pending_validators is None:
+            return
+        self._store_validators(*self._pending_validators)
+        self._pending_validators = None
+    
+    def _load_validators(self) -> Dict[str, str]:
+        """
+        Wczytuje zapisane ETag / Last-Modified dla tego feedu.
+        
+        Returns:
+            Dict[str, str]: Keyword args dla feedparser.parse() ('etag', 'modified')
+                           Pusty dict gdy brak stanu lub conditional GET wyłączony
+        """
+        if not self.use_conditional_get:
+            return {}
+        
+        from ...models import FeedCacheState
+        
+        try:
+            state = FeedCacheState.objects.filter(feed_url=self.feed_url).first()
+        except Exception as e:
+            logger.warning(f"Could not load feed validators for {self.feed_url}: {e}")
+            return {}
+        
+        validators = {}
+        if state is not None:
+            if state.etag:
+                validators['etag'] = state.etag
+            if state.last_modified:
+                validators['modified'] = state.last_modified
+        return validators
+    
+    def _store_validators(self, etag: Optional[str], modified: Optional[str], status: Optional[int]):
+        """
+        Zapisuje validators z odpowiedzi dla następnego conditional GET.
+        
+        Args:
+            etag: Wartość nagłówka ETag (lub None)
+            modified: Wartość nagłówka Last-Modified (lub None)
+            status: HTTP status ostatniego fetchu
+        """
+        if not self.use_conditional_get:
+            return
+        
+        from django.utils import timezone
+        from ...models import FeedCacheState
+        
+        try:
+            FeedCacheState.objects.update_or_create(
+                feed_url=self.feed_url,
+                defaults={
+                    'etag': etag if isinstance(etag, str) else '',
+                    'last_modified': modified if isinstance(modified, str) else '',
+                    'last_status': status if isinstance(status, int) else None,
+                    'last_checked': timezone.now(),
+                }
+            )
+        except Exception as e:
+            logger.warning(f"Could not store feed validators for {self.feed_url}: {e}")
+    
+    def _parse_feed(self, feed, watermark: Optional[Tuple[Optional[float], Set[str]]] = None) -> List[NewsArticleData]:
+        """
+        Konwertuje sparsowany feedparser result na listę NewsArticleData.
+        
+        Wspólna część sync scrape() i async ascrape() - oba warianty różnią się
+        tylko sposobem pobrania feedu.
+        
+        High-water mark: entries z URL już znanym są pomijane, a pierwszy entry
+        starszy niż cutoff kończy parsing (feed jest newest-first). Skip zamiast
+        stop dla znanych URLs, bo feedy typu Reddit mają pinned posts na górze.
+        
+        Args:
+            feed: Wynik feedparser.parse()
+            watermark: (cutoff_timestamp, known_urls) z _load_watermark() lub None
+            
+        Returns:
+            List[NewsArticleData]: Nowe artykuły z poprawnym title i url
+        """
+        articles = []
+        cutoff, known_urls = watermark or (None, set())
+        skipped = 0
+        
+        # Sprawdzamy czy feed ma entries - basic validation RSS format
+        if not hasattr(feed, 'entries'):
+            logger.error(f"Invalid RSS feed format: {self.feed_url}")
+            return articles
+        
+        # Przetwarzamy każdy entry w RSS feed
+        for entry in feed.entries:
+            try:
+                # Ekstraktujemy kluczowe dane artykułu używając RSS fields
+                title = self._clean_text(entry.get('title', ''))           # <title>
+                content = self._extract_content(entry)                     # <description>/<content>
+                url = entry.get('link', '')                               # <link>
+                if url in known_urls:
+                    skipped += 1
+                    continue  # Już zingestowany w poprzednim runie
+                
+                published_date = self._parse_date(entry.get('published', ''))  # <pubDate>
+                if cutoff is not None and entry.get('published') and self._timestamp(published_date) < cutoff:
+                    logger.info(f"Reached high-water mark for {self.source_name}, stopping feed processing")
+                    break
+                
+                author = entry.get('author', '')                          # <author>
+                
+                # Minimum required fields validation
+                if title and url:  # Title i URL są wymagane dla deduplication
+                    article = NewsArticleData(
+                        title=title,
+                        content=content,
+                        url=url,
+                        source=self.source_name,
+                        published_date=published_date,
+                        author=author
+                    )
+                    articles.append(article)
+                    
+            except Exception as e:
+                logger.error(f"Error processing RSS entry: {e}")
+                continue
+                
+        logger.info(f"Successfully scraped {len(articles)} articles from {self.source_name}"
+                    f"{f' ({skipped} already known)' if skipped else ''}")
         
         return articles
     
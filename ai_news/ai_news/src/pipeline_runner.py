@@ -69,6 +69,11 @@ class AppContainer(containers.DeclarativeContainer):
     config.temperature.from_env("DEFAULT_TEMPERATURE", default=0.7)
     config.max_tokens.from_env("DEFAULT_MAX_TOKENS", default=2000)
     
+    # Scraping concurrency configuration
+    config.scrape_max_workers.from_env("SCRAPE_MAX_WORKERS", as_=int, default=8)
+    config.scrape_per_host_limit.from_env("SCRAPE_PER_HOST_LIMIT", as_=int, default=2)
+    config.scrape_use_async.from_env("SCRAPE_USE_ASYNC", default="false")
+    
     # LangChain configuration (optional)
     config.langchain_api_key.from_env("LANGCHAIN_API_KEY", default="")
     config.langchain_project.from_env("LANGCHAIN_PROJECT", default="ai-news-scraper")
@@ -145,6 +150,9 @@ class AppContainer(containers.DeclarativeContainer):
         embedding_model=config.embedding_model,
         llm_model=config.llm_model,
         temperature=config.temperature,
+        scrape_max_workers=config.scrape_max_workers,
+        scrape_per_host_limit=config.scrape_per_host_limit,
+        scrape_use_async=config.scrape_use_async,
         deduplication_service=duplication_service,
         blog_summary_service=blog_summary_service,
         langchain_orchestrator=langchain_orchestrator
@@ -0,0 +1,116 @@
+"""
+Retention engine - chunked usuwanie starych artykułów z DB i vector index.
+
+Zamiast jednego unbounded old_articles.delete() (Django collector ładuje
+wszystkie rows i kaskaduje duplicate_of, M2M, ArticleEmbedding, MinHashBand
+w jednej długiej transakcji, która blokuje SQLite) i delete call per article
+do Qdrant, engine:
+
+1. Streamuje IDs w chunkach (keyset pagination po pk, tylko kolumna id)
+2. Dołącza duplikaty wskazujące na chunk (duplicate_of CASCADE) jawnie
+3. Usuwa points z vector index jednym batched selector per chunk
+4. Usuwa rows (i odejmuje je od statistics rollup) w bounded transaction per chunk
+5. Raportuje progress po każdym chunku
+
+Usage:
+    engine = ArticleRetentionEngine(vector_deduplicator, chunk_size=500)
+    deleted = engine.purge(NewsArticle.objects.filter(scraped_date__lt=cutoff))
+"""
+import logging
+from typing import Callable, List, Optional
+
+from django.db import transaction
+
+from .article_stats import record_deleted_articles
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class ArticleRetentionEngine:
+    """
+    Chunked purge NewsArticle rows razem z vector points i rollup.
+
+    Attributes:
+        vector_deduplicator: Backend z remove_articles_from_index() (Qdrant lub FAISS); None = tylko DB
+        chunk_size (int): Artykułów per chunk (jeden vector delete + jedna transakcja)
+        progress_callback: Wywoływany jako callback(processed, total) po każdym chunku
+    """
+
+    def __init__(self, vector_deduplicator=None, chunk_size: int = 500,
+                 progress_callback: Optional[ProgressCallback] = None):
+        self.vector_deduplicator = vector_deduplicator
+        self.chunk_size = max(1, chunk_size)
+        self.progress_callback = progress_callback
+
+    def _iter_id_chunks(self, queryset):
+        """Keyset pagination po pk - każdy chunk to osobny, krótki query o same IDs."""
+        last_pk = 0
+        ids = queryset.order_by('pk')
+        while True:
+            chunk = list(ids.filter(pk__gt=last_pk).values_list('pk', flat=True)[:self.chunk_size])
+            if not chunk:
+                return
+            last_pk = chunk[-1]
+            yield chunk
+
+    @staticmethod
+    def _with_dependents(chunk: List[int]) -> List[int]:
+        """Chunk + duplikaty wskazujące na jego artykuły (usuwane przez CASCADE na duplicate_of)."""
+        from ..models import NewsArticle
+
+        dependents = NewsArticle.objects.filter(duplicate_of_id__in=chunk).exclude(
+            pk__in=chunk
+        ).values_list('pk', flat=True)
+        return chunk + list(dependents)
+
+    def _remove_vectors(self, article_ids: List[int]):
+        if self.vector_deduplicator is None:
+            return
+        # Błąd vector store nie blokuje retencji - osierocone points odpadają przy in_bulk w search
+        if not self.vector_deduplicator.remove_articles_from_index(article_ids):
+            logger.warning(f"Vector points for {len(article_ids)} articles were not removed")
+
+    def _delete_rows(self, article_ids: List[int]) -> int:
+        """Bounded transaction: rollup delta + delete (collector widzi tylko pk)."""
+        from ..models import NewsArticle
+
+        with transaction.atomic():
+            rows = NewsArticle.objects.filter(pk__in=article_ids)
+            record_deleted_articles(rows)
+            return rows.only('pk').delete()[1].get(NewsArticle._meta.label, 0)
+
+    def purge(self, queryset) -> int:
+        """
+        Usuwa wszystkie artykuły z queryset chunk po chunku.
+
+        Args:
+            queryset: NewsArticle queryset do usunięcia (np. scraped_date__lt=cutoff)
+
+        Returns:
+            int: Liczba usuniętych artykułów (łącznie z kaskadowanymi duplikatami)
+        """
+        total = queryset.count()
+        if not total:
+            return 0
+
+        deleted = 0
+        processed = 0
+        for chunk in self._iter_id_chunks(queryset):
+            article_ids = self._with_dependents(chunk)
+            self._remove_vectors(article_ids)
+            try:
+                deleted += self._delete_rows(article_ids)
+            except Exception as e:
+                logger.error(f"Error deleting chunk of {len(article_ids)} articles: {e}")
+            processed += len(chunk)
+
+            logger.info(f"Retention progress: {processed}/{total} articles processed, {deleted} deleted")
+            if self.progress_callback:
+                self.progress_callback(processed, total)
+
+        # Lokalny index (FAISS) zapisywany raz po całym purge, nie per chunk
+        if self.vector_deduplicator is not None:
+            self.vector_deduplicator.flush()
+        return deleted
@@ -1,6 +1,8 @@
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
+import hashlib
 import logging
+import re
 from django.conf import settings
 
 # LangChain imports - updated for Python 3.12 and latest versions
@@ -15,6 +17,9 @@ from langchain.chains.combine_documents.map_reduce import MapReduceDocumentsChai
 from langchain_core.runnables import RunnablePassthrough
 from langchain_core.output_parsers import StrOutputParser
 
+from .summary_cache import MapExtractionCache
+from .token_budget import TokenCounter, context_window, pack_by_budget
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,8 +44,8 @@ class LangChainSummarizer:
     - Management commands do batch processing
     
     Performance considerations:
-    - Limit 10 artykułów per summary (token optimization)
-    - Max 8000 znaków treści (context window management)
+    - Token budget per map call (tiktoken) zamiast stałego limitu artykułów
+    - Krótkie artykuły dzielą map call, długie są dzielone na chunks
     - Temperature 0.7 (balance creativity vs consistency)
     
     Note:
@@ -48,7 +53,18 @@ class LangChainSummarizer:
         Zawiera metodę _prepare_documents() używaną przez wszystkie implementacje.
     """
     
-    def __init__(self, model: str = "gpt-4o-mini", temperature: float = 0.7):
+    # Tokeny zarezerwowane w context window na prompt i output (map i reduce)
+    PROMPT_RESERVED_TOKENS = 4096
+    MIN_BUDGET_TOKENS = 1024
+    # Max poziomów tree collapse przed final reduce
+    MAX_COLLAPSE_LEVELS = 5
+    # Miejsce na "Title/Source" header w każdym chunku długiego artykułu
+    CHUNK_HEADER_TOKENS = 256
+    # Output map call rośnie z liczbą artykułów - limit sekcji per call
+    max_articles_per_map_call = 12
+    
+    def __init__(self, model: str = "gpt-4o-mini", temperature: float = 0.7,
+                 map_max_concurrency: Optional[int] = None):
         """
         Inicjalizuje LangChain summarizer z konfiguracją OpenAI i text splitter.
         
@@ -60,32 +76,42 @@ class LangChainSummarizer:
                   Wybór między szybkością a jakością - mini jest optymalne
             temperature: Poziom kreatywności 0.0-1.0 (default 0.7)
                         0.7 zapewnia balance między consistency a creativity
+            map_max_concurrency: Max równoległych LLM calls w map phase
+                                (None = AppConfig.summary_map_concurrency)
         
         Configuration:
-        - max_articles_per_summary: 10 (token limit optimization)
-        - max_content_length: 8000 chars (context window management)
-        - chunk_size: 2000 (optimal dla GPT-4o-mini)
-        - chunk_overlap: 200 (maintains context between chunks)
+        - map_token_budget: AppConfig.summary_map_max_tokens, ograniczony context window modelu
+        - reduce_token_budget: AppConfig.summary_reduce_max_tokens (powyżej - tree collapse)
+        - max_articles_per_map_call: limit artykułów w jednym map call (rozmiar output)
+        - chunk_size: map_token_budget minus header (w tokenach, nie znakach)
+        - chunk_overlap: 200 tokens (maintains context between chunks)
         """
-        # Limity przetwarzania - optimized dla OpenAI context windows
-        self.max_articles_per_summary = 10  # Balance między quality a cost
-        self.max_content_length = 8000      # Zapobiega przekroczeniu token limits
+        self.model = model
+        self.temperature = temperature
         
         # Inicjalizujemy OpenAI LLM - wyłącznie OpenAI, bez fallbacks
         # GPT-4o-mini oferuje najlepszy balance cost/performance dla summarization
         from ..core.config import get_app_config
         config = get_app_config()
+        self.map_max_concurrency = max(1, map_max_concurrency or config.summary_map_concurrency)
+        
+        # Limity przetwarzania liczone w tokenach (tiktoken) - optimized dla OpenAI context windows
+        self.token_counter = TokenCounter(model)
+        usable_context = context_window(model) - self.PROMPT_RESERVED_TOKENS
+        self.map_token_budget = max(self.MIN_BUDGET_TOKENS, min(config.summary_map_max_tokens, usable_context))
+        self.reduce_token_budget = max(self.MIN_BUDGET_TOKENS, min(config.summary_reduce_max_tokens, usable_context))
         self.llm = ChatOpenAI(
             model=model,                    # Default: gpt-4o-mini (cost-effective)
             temperature=temperature,        # 0.7 = balance creativity vs consistency
             api_key=config.openai_api_key  # Configuration management integration
         )
         
-        # Text splitter dla długich dokumentów - hierarchical splitting
-        # Używa intelligent separators do zachowania semantic boundaries
+        # Text splitter dla artykułów dłuższych niż map_token_budget - hierarchical splitting
+        # Używa intelligent separators do zachowania semantic boundaries, długość w tokenach
         self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=2000,    # Optimal size dla GPT-4o-mini context
+            chunk_size=self.map_token_budget - self.CHUNK_HEADER_TOKENS,  # Miejsce na Title/Source header
             chunk_overlap=200,  # Overlap zachowuje context między chunks
+            length_function=self.token_counter.count,
             separators=["\n\n", "\n", ".", "!", "?", ",", " ", ""]  # Hierarchical splitting
         )
     
@@ -95,12 +121,15 @@ class LangChainSummarizer:
         
         Transforms list artykułów na format wymagany przez LangChain chains.
         Każdy artykuł staje się Document z structured content i comprehensive metadata.
+        Wszystkie artykuły są zachowane - o liczbie LLM calls decyduje token budget
+        w _map_documents(), nie obcinanie listy.
         
         Process:
-        1. Limituje do max_articles_per_summary (performance)
-        2. Kombinuje title, source i content w structured format
-        3. Tworzy LangChain Document z page_content i metadata
-        4. Metadata używana przez chains dla context i filtering
+        1. Kombinuje title, source i content w structured format
+        2. Liczy tokeny (tiktoken) każdego artykułu
+        3. Artykuł > map_token_budget jest dzielony text_splitter na chunks
+           (każdy chunk z Title/Source header i własnym cache key)
+        4. Metadata używana przez chains dla context, packing i map cache
         
         Wykorzystywana przez:
         - BlogSummarizer.summarize() do przygotowania input data
@@ -108,36 +137,61 @@ class LangChainSummarizer:
         - LangChain document loaders jako standard format
         
         Args:
-            articles: Lista NewsArticle objects do konwersji
-                     Może zawierać więcej niż max_articles_per_summary
+            articles: Lista NewsArticle objects do konwersji (dowolna liczba)
                      
         Returns:
             List[Document]: LangChain Documents gotowe do AI processing
-                           Każdy Document ma structured content i metadata
+                           (jeden per artykuł lub per chunk długiego artykułu)
                            
         Note:
-            Automatycznie obcina do pierwszych max_articles_per_summary artykułów.
             Format content: "Title: X\nSource: Y\nContent: Z" - structured dla AI
         """
         documents = []
-        # Ograniczamy do max_articles_per_summary dla token efficiency
-        for article in articles[:self.max_articles_per_summary]:
+        for article in articles:
             # Tworzymy structured content format dla AI comprehension
             # Format: "Title: X\nSource: Y\nContent: Z" - clear structure dla LLM
             content = f"Title: {article.title}\nSource: {article.source}\nContent: {article.content}"
+            content_hash = self._article_content_hash(article)
+            metadata = {                # Rich metadata dla chains i filtering
+                "title": article.title,                    # Tytuł dla reference
+                "source": article.source,                  # Źródło dla grouping
+                "url": article.url,                        # URL dla validation
+                "published_date": str(article.published_date),  # Data dla sorting
+            }
             
-            # Tworzymy LangChain Document z comprehensive metadata
-            documents.append(Document(
-                page_content=content,  # Main content dla AI processing
-                metadata={              # Rich metadata dla chains i filtering
-                    "title": article.title,                    # Tytuł dla reference
-                    "source": article.source,                  # Źródło dla grouping
-                    "url": article.url,                        # URL dla validation
-                    "published_date": str(article.published_date)  # Data dla sorting
-                }
-            ))
+            tokens = self.token_counter.count(content)
+            if tokens <= self.map_token_budget:
+                documents.append(Document(
+                    page_content=content,  # Main content dla AI processing
+                    metadata={**metadata, "content_hash": content_hash, "tokens": tokens}
+                ))
+                continue
+            
+            # Długi artykuł - chunks mieszczące się w budżecie jednego map call
+            chunks = self.text_splitter.split_text(article.content)
+            for part, chunk in enumerate(chunks, 1):
+                chunk_content = (f"Title: {article.title} (part {part}/{len(chunks)})\n"
+                                 f"Source: {article.source}\nContent: {chunk}")
+                documents.append(Document(
+                    page_content=chunk_content,
+                    metadata={
+                        **metadata,
+                        "part": part,
+                        # Cache key z tekstu chunka - zmiana budżetu/splittera daje inne chunks i klucze
+                        "content_hash": hashlib.sha256(chunk_content.encode('utf-8')).hexdigest(),
+                        "tokens": self.token_counter.count(chunk_content)
+                    }
+                ))
         return documents
     
+    @staticmethod
+    def _article_content_hash(article) -> str:
+        """NewsArticle.content_hash albo ten sam SHA-256 z title + content (np. NewsArticleData)."""
+        content_hash = getattr(article, 'content_hash', None)
+        if content_hash:
+            return content_hash
+        return hashlib.sha256(f"{article.title}{article.content}".encode('utf-8')).hexdigest()
+    
     def summarize(self, articles: List, topic: str = "AI News") -> Optional[str]:
         """
         Abstrakcyjna metoda sumaryzacji - musi być zaimplementowana przez subklasy.
@@ -187,12 +241,14 @@ class BlogSummarizer(LangChainSummarizer):
     - Highlights most important developments
     
     Performance:
-    - Processes up to 10 articles per summary (token optimization)
+    - Token-budget packing - wszystkie artykuły, minimum map calls
     - Map-reduce scales dla large article sets
     - GPT-4o-mini balance cost vs quality
     """
     
-    def __init__(self, model: str = "gpt-4o-mini", temperature: float = 0.7):
+    def __init__(self, model: str = "gpt-4o-mini", temperature: float = 0.7,
+                 map_max_concurrency: Optional[int] = None,
+                 map_cache=None, map_cache_max_entries: Optional[int] = None):
         """
         Inicjalizuje BlogSummarizer z specialized prompts dla blog generation.
         
@@ -202,13 +258,16 @@ class BlogSummarizer(LangChainSummarizer):
         Args:
             model: OpenAI model (default "gpt-4o-mini" - cost-effective)
             temperature: Creativity level (0.7 optimal dla blog content)
+            map_max_concurrency: Max równoległych map calls (None = z AppConfig)
+            map_cache: Opcjonalny MapExtractionCache (domyślnie tworzony per model/prompt)
+            map_cache_max_entries: Limit cache (None = AppConfig.summary_map_cache_max_entries, 0 = wyłączony)
             
         Prompt Templates:
         - blog_prompt: Single-stage summarization dla smaller datasets
         - map_prompt: Extract insights z individual articles
         - reduce_prompt: Combine insights into final blog post
         """
-        super().__init__(model, temperature)  # Initialize base functionality
+        super().__init__(model, temperature, map_max_concurrency)  # Initialize base functionality
         
         # Blog summary prompt template - comprehensive single-stage approach
         # Używany gdy mamy mniejszą liczbę artykułów (< 5) i wszystkie mieszczą się w context
@@ -243,20 +302,52 @@ SUMMARY:
         )
         
         # Map prompt - pierwszy stage Map-Reduce pattern
-        # Ekstraktuje kluczowe insights z pojedynczych artykułów parallel
+        # Ekstraktuje kluczowe insights z packu artykułów; markery [n] pozwalają
+        # rozdzielić output per artykuł (map cache per content_hash)
         self.map_prompt = PromptTemplate(
             input_variables=["text"],
-            template="""Extract CONCRETE technical information from this news article. Focus on specific details:
+            template="""Extract CONCRETE technical information from the news articles below. Each article starts with its marker ([1], [2], ...). Focus on specific details:
 
-Article: {text}
+{text}
 
-Extract and list:
+For EACH article write its marker on its own line (e.g. [1]) and then extract and list:
 1. Specific tools, models, or technologies mentioned (with version numbers if available)
 2. Performance metrics, benchmark scores, or quantified improvements
 3. Company/organization names and their specific contributions
 4. Technical capabilities, APIs, or features launched
 5. Actionable information developers/researchers can use
 
+Format as bullet points with specific details:"""
+        )
+        
+        # Map outputs cache - klucz (content_hash, model, prompt version);
+        # wersja to hash template, więc edycja map_prompt unieważnia stare wpisy
+        self.map_prompt_version = hashlib.sha256(self.map_prompt.template.encode('utf-8')).hexdigest()[:16]
+        if map_cache is None:
+            if map_cache_max_entries is None:
+                from ..core.config import get_app_config
+                map_cache_max_entries = get_app_config().summary_map_cache_max_entries
+            map_cache = MapExtractionCache(
+                model_name=model,
+                prompt_version=self.map_prompt_version,
+                max_entries=map_cache_max_entries
+            )
+        self.map_cache = map_cache
+        
+        # Collapse prompt - pośredni stage tree reduce dla dużych zbiorów insights
+        # Kompresuje grupę map outputs zachowując konkretne szczegóły
+        self.collapse_prompt = PromptTemplate(
+            input_variables=["text", "topic"],
+            template="""Consolidate these extracted {topic} insights into one deduplicated list of bullet points:
+
+{text}
+
+Requirements:
+1. Merge items about the same tool, model, company or release
+2. Keep specific names, version numbers, metrics and benchmark scores
+3. Keep actionable details (APIs, availability, pricing, deployment)
+4. Drop generic statements without concrete information
+
 Format as bullet points with specific details:"""
         )
         
@@ -295,7 +386,7 @@ SUMMARY:
         i quality dla różnych scenarios.
         
         Workflow:
-        1. Prepare documents z artykułów (max 10)
+        1. Prepare documents z artykułów (wszystkie, długie podzielone na chunks)
         2. Zawsze używa Map-Reduce dla consistency i scalability
         3. Parallel processing individual articles
         4. Combine insights w final blog post
@@ -307,7 +398,7 @@ SUMMARY:
         - Management commands dla batch processing
         
         Args:
-            articles: Lista NewsArticle objects (będzie limited do 10)
+            articles: Lista NewsArticle objects (dowolna liczba - packing po tokenach)
             topic: Kategoria tematu dla context (np. "AI News", "Tech")
             
         Returns:
@@ -334,6 +425,212 @@ SUMMARY:
             logger.error(f"Error with LangChain summarization: {e}")
             return None
     
+    def summarize_incremental(self, daily_summaries: List[str], articles: List,
+                              topic: str = "AI News") -> Optional[str]:
+        """
+        Weekly summary z gotowych daily summaries + artykułów jeszcze nimi nie pokrytych.
+        
+        Daily summaries idą bezpośrednio do reduce (jak map outputs), map stage
+        przechodzą tylko uncovered artykuły - zamiast map-reduce całego tygodnia
+        płacimy za kilka map calls i jeden reduce (collapse tylko gdy > reduce budget).
+        
+        Args:
+            daily_summaries: Teksty daily BlogSummary (z datą i tytułem)
+            articles: NewsArticle spoza daily summaries (może być pusta)
+            topic: Kategoria tematu dla final synthesis
+            
+        Returns:
+            Optional[str]: Formatted blog post lub None jeśli error occurred
+        """
+        try:
+            mapped_results = self._map_documents(self._prepare_documents(articles)) if articles else []
+            results = list(daily_summaries) + mapped_results
+            
+            if not results:
+                return None
+            
+            logger.info(f"Incremental summary: {len(daily_summaries)} daily summaries + "
+                        f"{len(articles)} uncovered articles")
+            return self._reduce_results(results, topic)
+        
+        except Exception as e:
+            logger.error(f"Error with incremental summarization: {e}")
+            return None
+    
+    def _map_documents(self, documents: List[Document]) -> List[str]:
+        """
+        MAP stage: extract insights z documents przez map_cache + packed map_chain.batch().
+        
+        Documents z trafieniem w map_cache (content_hash, model, prompt version) nie
+        idą do LLM - weekly summary i rerun po błędzie płacą tylko za nowe artykuły.
+        Pozostałe są pakowane (pack_by_budget) tak, że kilka krótkich artykułów dzieli
+        jeden map call w granicach map_token_budget. Calls idą równolegle
+        (max_concurrency = map_max_concurrency), więc latency map phase to
+        ~najwolniejszy call zamiast sumy wszystkich.
+        
+        Output packu jest dzielony po markerach [n] na sekcje per document i cache'owany
+        per content_hash. Gdy model pominął/przenumerował markery albo zostawił pustą
+        sekcję, output nie jest używany ani cache'owany - documents z tego packu idą
+        ponownie, jeden per call. return_exceptions=True izoluje błędy -
+        failed pack jest pomijany (i nie trafia do cache), reszta wyników zostaje.
+        
+        Args:
+            documents: Lista LangChain Documents do przetworzenia
+            
+        Returns:
+            List[str]: Extracted insights w kolejności documents (bez failed)
+        """
+        keys = [doc.metadata.get("content_hash") for doc in documents]
+        cached = self.map_cache.get_many(keys)
+        pending = [index for index, key in enumerate(keys) if key not in cached]
+        
+        extracted = {}
+        if pending:
+            token_counts = [
+                documents[index].metadata.get("tokens") or self.token_counter.count(documents[index].page_content)
+                for index in pending
+            ]
+            packs = [
+                [pending[position] for position in group]
+                for group in pack_by_budget(token_counts, self.map_token_budget, self.max_articles_per_map_call)
+            ]
+            
+            # Pipe operator (|) tworzy composable chain: prompt → LLM → parser
+            map_chain = self.map_prompt | self.llm | StrOutputParser()
+            
+            new_entries = {}
+            retries = self._run_map_packs(map_chain, documents, packs, keys, extracted, new_entries)
+            if retries:
+                # Output bez zgodnych markerów nie jest przypisywany ani cache'owany -
+                # te documents idą ponownie, jeden per call
+                logger.warning(f"Map output lost its markers for {len(retries)} documents - retrying one per call")
+                self._run_map_packs(map_chain, documents, [[index] for index in retries],
+                                    keys, extracted, new_entries)
+            
+            self.map_cache.set_many(new_entries)
+            logger.info(f"Map phase: {len(pending)} documents in {len(packs) + len(retries)} LLM calls "
+                        f"({len(documents) - len(pending)} from cache)")
+        
+        return [
+            cached[key] if key in cached else extracted[index]
+            for index, key in enumerate(keys)
+            if key in cached or index in extracted
+        ]
+    
+    def _run_map_packs(self, map_chain, documents: List[Document], packs: List[List[int]],
+                       keys: List, extracted: Dict, new_entries: Dict) -> List[int]:
+        """
+        Jeden map_chain.batch dla packów; sekcje trafiają do extracted i new_entries (cache).
+        
+        Returns:
+            List[int]: Indeksy documents z packów, których output nie ma markerów [1]..[n]
+        """
+        results = map_chain.batch(
+            [{"text": self._pack_text([documents[index] for index in pack])} for pack in packs],
+            config={"max_concurrency": self.map_max_concurrency},
+            return_exceptions=True
+        )
+        
+        mismatched = []
+        for pack, result in zip(packs, results):
+            if isinstance(result, Exception):
+                # Graceful handling - single pack failure nie crashuje całego process
+                logger.warning(f"Error processing {len(pack)} document(s): {result}")
+                continue
+            sections = self._split_sections(result, len(pack))
+            if sections is None:
+                mismatched.extend(pack)
+                continue
+            for index, section in zip(pack, sections):
+                extracted[index] = section
+                if keys[index]:
+                    new_entries[keys[index]] = section
+        return mismatched
+    
+    @staticmethod
+    def _pack_text(documents: List[Document]) -> str:
+        """Treść packu dla map prompt - każdy document poprzedzony markerem [n]."""
+        return "\n\n".join(f"[{number}]\n{doc.page_content}" for number, doc in enumerate(documents, 1))
+    
+    _SECTION_MARKER = re.compile(r"^\W*\[(\d+)\]\W*$", re.MULTILINE)
+    
+    @classmethod
+    def _split_sections(cls, text: str, count: int) -> Optional[List[str]]:
+        """
+        Dzieli map output na sekcje po markerach [1]..[count].
+        
+        Returns:
+            Optional[List[str]]: Sekcje w kolejności markerów albo None gdy markery
+                                 nie odpowiadają packowi lub sekcja jest pusta
+                                 (pojedynczy document zawsze się udaje)
+        """
+        markers = list(cls._SECTION_MARKER.finditer(text))
+        if count == 1:
+            return [text[markers[0].end():].strip() if markers else text.strip()]
+        if [int(marker.group(1)) for marker in markers] != list(range(1, count + 1)):
+            return None
+        
+        ends = [marker.start() for marker in markers[1:]] + [len(text)]
+        sections = [text[marker.end():end].strip() for marker, end in zip(markers, ends)]
+        return sections if all(sections) else None
+    
+    def _collapse_results(self, results: List[str], topic: str) -> List[str]:
+        """
+        Hierarchical (tree) collapse map outputs do rozmiaru jednego reduce call.
+        
+        Każdy poziom pakuje wyniki w grupy mieszczące się w reduce_token_budget
+        (pack_by_budget), kompresuje grupy collapse_prompt równolegle (batch
+        z max_concurrency) i powtarza, aż całość zmieści się w budżecie. Liczba
+        poziomów rośnie logarytmicznie z liczbą artykułów.
+        
+        Failed grupa przechodzi na następny poziom bez zmian. Gdy poziom nie
+        zmniejszył insights (np. wszystkie grupy failed) albo po MAX_COLLAPSE_LEVELS
+        całość nadal się nie mieści, collapse się kończy i do reduce trafiają
+        wszystkie dotychczasowe insights (warning w logach) - bez odrzucania grup.
+        
+        Args:
+            results: Map outputs (insights per article/pack)
+            topic: Kategoria tematu dla collapse prompt
+            
+        Returns:
+            List[str]: Insights do jednego reduce call
+        """
+        collapse_chain = self.collapse_prompt | self.llm | StrOutputParser()
+        
+        level = 0
+        total_tokens = self.token_counter.count("\n\n".join(results))
+        while total_tokens > self.reduce_token_budget:
+            if level >= self.MAX_COLLAPSE_LEVELS:
+                logger.warning(f"Insights still exceed reduce budget after {level} collapse levels - "
+                               f"reducing all {len(results)} insights")
+                break
+            
+            groups = pack_by_budget([self.token_counter.count(text) for text in results], self.reduce_token_budget)
+            collapsed = collapse_chain.batch(
+                [{"text": "\n\n".join(results[index] for index in group), "topic": topic} for group in groups],
+                config={"max_concurrency": self.map_max_concurrency},
+                return_exceptions=True
+            )
+            
+            next_results = []
+            for group, result in zip(groups, collapsed):
+                if isinstance(result, Exception):
+                    logger.warning(f"Error collapsing {len(group)} insights: {result}")
+                    next_results.extend(results[index] for index in group)
+                else:
+                    next_results.append(result)
+            
+            level += 1
+            logger.info(f"Collapse level {level}: {len(results)} -> {len(next_results)} insights")
+            next_tokens = self.token_counter.count("\n\n".join(next_results))
+            if next_tokens >= total_tokens:
+                # Kolejny poziom dałby ten sam wynik - nie powtarzamy collapse calls
+                logger.warning(f"Collapse level {level} made no progress - reducing all {len(next_results)} insights")
+                return next_results
+            results, total_tokens = next_results, next_tokens
+        
+        return results
+    
     def _modern_map_reduce_summarize(self, documents: List[Document], topic: str) -> str:
         """
         Modern Map-Reduce implementation używający LangChain Expression Language (LCEL).
@@ -363,33 +660,36 @@ SUMMARY:
                  Format: "TITLE: ...\n\nSUMMARY: ..."
                  
         Process Flow:
-            Documents → MAP (extract insights) → REDUCE (combine) → Final Blog Post
-        """
-        
-        # STAGE 1: MAP - Create LCEL chain dla extracting insights
-        # Pipe operator (|) tworzy composable chain: prompt → LLM → parser
-        map_chain = self.map_prompt | self.llm | StrOutputParser()
-        
-        # Process wszystkie documents w parallel (conceptually)
-        # W praktyce sequential ale każdy document jest processed independently
-        mapped_results = []
-        for doc in documents:
-            try:
-                # Invoke chain dla każdego document - extract key insights
-                result = map_chain.invoke({"text": doc.page_content})
-                mapped_results.append(result)
-            except Exception as e:
-                # Graceful handling - single document failure nie crashuje całego process
-                logger.warning(f"Error processing document: {e}")
-                continue
+            Documents → MAP (extract insights, concurrent) → COLLAPSE (tree, gdy > reduce budget)
+            → REDUCE (combine) → Final Blog Post
+        """
+        
+        # STAGE 1: MAP - extract insights z każdego document (concurrent LLM calls)
+        mapped_results = self._map_documents(documents)
         
         # Fallback jeśli wszystkie documents failed
         if not mapped_results:
             return f"TITLE: {topic} Update\n\nSUMMARY: No content available for summarization."
         
-        # STAGE 2: REDUCE - Combine wszystkie extracted insights
+        return self._reduce_results(mapped_results, topic)
+    
+    def _reduce_results(self, results: List[str], topic: str) -> str:
+        """
+        COLLAPSE + REDUCE stage: map outputs (lub daily summaries) → final blog post.
+        
+        Args:
+            results: Insights do syntezy
+            topic: Kategoria tematu dla final synthesis
+            
+        Returns:
+            str: Formatted blog post "TITLE: ...\n\nSUMMARY: ..."
+        """
+        # STAGE 2: COLLAPSE - tree reduce dopóki insights nie mieszczą się w reduce budget
+        results = self._collapse_results(results, topic)
+        
+        # STAGE 3: REDUCE - Combine wszystkie extracted insights
         # Join insights z double newlines dla clear separation
-        combined_text = "\n\n".join(mapped_results)
+        combined_text = "\n\n".join(results)
         
         # Create reduce chain using LCEL dla final synthesis
         reduce_chain = self.reduce_prompt | self.llm | StrOutputParser()
@@ -507,15 +807,20 @@ class BlogSummaryService:
             return None
         
         # Generate summary using private method
-        return self._create_summary(list(articles), topic_category)
+        return self._create_summary(list(articles), topic_category, period='daily')
     
-    def create_weekly_summary(self, topic_category: str = "AI News") -> Optional:
+    def create_weekly_summary(self, topic_category: str = "AI News", incremental: bool = True) -> Optional:
         """
         Tworzy weekly blog summary z artykułów opublikowanych w ostatnich 7 dniach.
         
         Generates comprehensive weekly roundup covering major trends i developments
         z past week. More extensive than daily summaries - covers broader topics.
         
+        Incremental mode (default): daily BlogSummary rows z ostatnich 7 dni
+        (ten sam topic_category) plus artykuły nie pokryte przez żaden z nich
+        idą do jednego reduce zamiast map-reduce całego tygodnia. Bez daily
+        summaries w oknie - pełny map-reduce jak wcześniej.
+        
         Wykorzystywana przez:
         - Weekly scheduled tasks (Sunday summary generation)
         - Management commands z --weekly flag
@@ -526,12 +831,13 @@ class BlogSummaryService:
         1. Calculate 7-day window (week ago to now)
         2. Query unique articles z database (larger dataset)
         3. Order chronologically (newest first)
-        4. Generate comprehensive weekly overview
+        4. Generate weekly overview (incremental z daily summaries lub pełny map-reduce)
         5. Save jako BlogSummary w database
         
         Args:
             topic_category: Kategoria tematu (default "AI News")
                            Context dla AI to understand focus area
+            incremental: False wymusza pełny map-reduce wszystkich artykułów tygodnia
                            
         Returns:
             Optional[BlogSummary]: Generated weekly summary lub None
@@ -539,9 +845,9 @@ class BlogSummaryService:
                                   
         Note:
             7-day window typically contains more articles than daily
-            BlogSummarizer automatically limits to 10 most recent dla processing
+            BlogSummarizer pakuje artykuły po token budget - cały tydzień jest pokryty
         """
-        from ..models import NewsArticle
+        from ..models import BlogSummary, NewsArticle
         
         # Calculate 7-day window dla weekly summary
         week_ago = datetime.now() - timedelta(days=7)
@@ -553,13 +859,55 @@ class BlogSummaryService:
             published_date__lt=datetime.now()       # Until now
         ).order_by('-published_date')      # Newest first
         
+        if incremental:
+            daily_summaries = list(BlogSummary.objects.filter(
+                period='daily',
+                topic_category=topic_category,
+                created_date__gte=week_ago
+            ).order_by('created_date'))
+            
+            if daily_summaries:
+                return self._create_incremental_weekly_summary(daily_summaries, articles, topic_category)
+            logger.info("No daily summaries in the last 7 days - running full weekly map-reduce")
+        
         # Check if any articles found
         if not articles.exists():
             logger.info("No articles found for weekly summary")
             return None
         
         # Generate comprehensive weekly summary
-        return self._create_summary(list(articles), topic_category)
+        return self._create_summary(list(articles), topic_category, period='weekly')
+    
+    def _create_incremental_weekly_summary(self, daily_summaries: List, articles, topic_category: str) -> Optional:
+        """
+        Weekly summary z daily summaries + uncovered artykułów (jeden reduce).
+        
+        Args:
+            daily_summaries: Daily BlogSummary z okna tygodnia
+            articles: QuerySet unique artykułów z okna tygodnia
+            topic_category: Topic context dla AI generation
+            
+        Returns:
+            Optional[BlogSummary]: Created weekly summary lub None
+        """
+        # Tylko artykuły z okna tygodnia (unique) - daily summary mógł objąć też duplikaty
+        covered_ids = list(articles.filter(blog_summaries__in=daily_summaries).order_by()
+                           .values_list('id', flat=True).distinct())
+        uncovered = list(articles.exclude(id__in=covered_ids))
+        
+        summary_texts = [
+            f"Daily summary ({daily.created_date:%Y-%m-%d}): {daily.title}\n{daily.summary}"
+            for daily in daily_summaries
+        ]
+        
+        try:
+            summary_text = self.summarizer.summarize_incremental(summary_texts, uncovered, topic_category)
+        except Exception as e:
+            logger.error(f"Error creating incremental weekly summary: {e}")
+            return None
+        
+        # articles.set() przyjmuje też primary keys - covered bez ładowania pełnych wierszy
+        return self._save_summary(summary_text, covered_ids + uncovered, topic_category, period='weekly')
     
     def create_custom_summary(self, articles: List, topic_category: str = "AI News") -> Optional:
         """
@@ -582,7 +930,7 @@ class BlogSummaryService:
         
         Args:
             articles: Lista NewsArticle objects do summarization
-                     Can be any size - BlogSummarizer limits to 10
+                     Can be any size - BlogSummarizer packs them by token budget
             topic_category: Custom topic kategoria (default "AI News")
                            Allows specialized context dla AI generation
                            
@@ -601,7 +949,7 @@ class BlogSummaryService:
         # Delegate to private summary creation method
         return self._create_summary(articles, topic_category)
     
-    def _create_summary(self, articles: List, topic_category: str) -> Optional:
+    def _create_summary(self, articles: List, topic_category: str, period: str = 'custom') -> Optional:
         """
         Private method dla actual blog summary creation i database storage.
         
@@ -624,6 +972,7 @@ class BlogSummaryService:
         Args:
             articles: Lista NewsArticle objects (already filtered)
             topic_category: Topic context dla AI generation
+            period: BlogSummary.period ('daily', 'weekly', 'custom')
             
         Returns:
             Optional[BlogSummary]: Created BlogSummary object lub None
@@ -633,12 +982,32 @@ class BlogSummaryService:
             Used internally by create_daily_summary, create_weekly_summary,
             create_custom_summary - provides unified implementation
         """
-        from ..models import BlogSummary
-        
         try:
             # Generate AI summary using BlogSummarizer
             summary_text = self.summarizer.summarize(articles, topic_category)
+        except Exception as e:
+            logger.error(f"Error creating blog summary: {e}")
+            return None
+        
+        return self._save_summary(summary_text, articles, topic_category, period)
+    
+    def _save_summary(self, summary_text: Optional[str], articles: List, topic_category: str,
+                      period: str = 'custom') -> Optional:
+        """
+        Parsuje TITLE/SUMMARY z LLM response i zapisuje BlogSummary z articles.
+        
+        Args:
+            summary_text: Output summarizera ("TITLE: ...\n\nSUMMARY: ...") lub None
+            articles: NewsArticle objects (lub ich id) powiązane z summary
+            topic_category: Topic category summary
+            period: BlogSummary.period ('daily', 'weekly', 'custom')
             
+        Returns:
+            Optional[BlogSummary]: Created BlogSummary object lub None
+        """
+        from ..models import BlogSummary
+        
+        try:
             if not summary_text:
                 logger.error("Failed to generate summary with LangChain")
                 return None
@@ -665,7 +1034,8 @@ class BlogSummaryService:
             blog_summary = BlogSummary.objects.create(
                 title=title,                    # Parsed lub default title
                 summary=summary,                # Extracted summary content
-                topic_category=topic_category   # User-specified category
+                topic_category=topic_category,  # User-specified category
+                period=period                   # daily/weekly/custom
             )
             
             # Associate articles z created summary (many-to-many relationship)
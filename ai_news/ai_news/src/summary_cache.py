@@ -0,0 +1,41 @@
+"""
+Persistent cache map-step extractions keyed by (content_hash, model, prompt_version).
+
+Map prompt w BlogSummarizer zależy tylko od treści artykułu, modelu i wersji
+promptu - ten sam artykuł przechodzi przez niego w daily summary, potem
+w weekly i przy każdym rerun po błędzie. Cache w lokalnej bazie
+(MapExtractionCacheEntry) sprawia, że płacimy tylko za reduce call i za
+artykuły, których map step jeszcze nie widział.
+
+prompt_version to hash template map promptu - zmiana promptu automatycznie
+unieważnia stare wpisy. Rozmiar cache jest ograniczony przez max_entries
+z eviction najdawniej używanych wpisów (DatabaseLRUCache).
+"""
+from typing import Dict
+
+from .db_lru_cache import DatabaseLRUCache
+
+
+class MapExtractionCache(DatabaseLRUCache):
+    """Size-bounded LRU cache map outputs w tabeli MapExtractionCacheEntry"""
+
+    value_field = 'extraction'
+    label = 'map extraction cache'
+
+    def __init__(self, model_name: str, prompt_version: str, max_entries: int = 20000):
+        """
+        Args:
+            model_name: Nazwa LLM (część klucza - inny model = inna ekstrakcja)
+            prompt_version: Wersja map promptu (część klucza)
+            max_entries: Maksymalna liczba wpisów dla wszystkich modeli (0 = cache wyłączony)
+        """
+        super().__init__(max_entries)
+        self.model_name = model_name
+        self.prompt_version = prompt_version
+
+    def _entry_model(self):
+        from ..models import MapExtractionCacheEntry
+        return MapExtractionCacheEntry
+
+    def _key_fields(self) -> Dict[str, str]:
+        return {'model': self.model_name, 'prompt_version': self.prompt_version}
@@ -0,0 +1,104 @@
+"""
+Token counting i packing dokumentów pod budżet tokenów LLM call.
+
+TokenCounter liczy tokeny przez tiktoken (encoding modelu OpenAI). Gdy
+encoding nie jest dostępny (nieznany model, brak sieci przy pierwszym
+pobraniu BPE file), używa konserwatywnego szacunku ~4 znaki na token.
+
+pack_by_budget() grupuje kolejne elementy (first-fit, kolejność zachowana)
+tak, żeby suma tokenów grupy mieściła się w budżecie - kilka krótkich
+artykułów trafia do jednego map call zamiast osobnych.
+
+Usage:
+    counter = TokenCounter("gpt-4o-mini")
+    groups = pack_by_budget([counter.count(text) for text in texts], budget=6000)
+"""
+import functools
+import logging
+import math
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Context windows (input + output tokens) modeli używanych do summarization
+MODEL_CONTEXT_TOKENS = {
+    "gpt-4o-mini": 128000,
+    "gpt-4o": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+}
+DEFAULT_CONTEXT_TOKENS = 8192
+
+# Szacunek dla fallback bez tiktoken (angielski tekst ~4 znaki/token)
+CHARS_PER_TOKEN = 4
+
+
+def context_window(model: str) -> int:
+    """Context window modelu (najdłuższy pasujący prefix nazwy, np. gpt-4o-mini-2024-07-18)."""
+    matches = [name for name in MODEL_CONTEXT_TOKENS if model and model.startswith(name)]
+    return MODEL_CONTEXT_TOKENS[max(matches, key=len)] if matches else DEFAULT_CONTEXT_TOKENS
+
+
+@functools.lru_cache(maxsize=None)
+def _load_encoding(model: str):
+    """tiktoken encoding per model (raz na proces) albo None."""
+    try:
+        import tiktoken
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable for {model} ({e}) - estimating {CHARS_PER_TOKEN} chars/token")
+        return None
+
+
+class TokenCounter:
+    """Liczy tokeny tekstu dla danego modelu (tiktoken lub szacunek znakowy)."""
+
+    def __init__(self, model: str):
+        self.model = model
+
+    @property
+    def encoding(self):
+        return _load_encoding(self.model)
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        encoding = self.encoding
+        if encoding is None:
+            return math.ceil(len(text) / CHARS_PER_TOKEN)
+        return len(encoding.encode(text, disallowed_special=()))
+
+
+def pack_by_budget(token_counts: List[int], budget: int,
+                   max_items: Optional[int] = None) -> List[List[int]]:
+    """
+    Grupuje indeksy kolejnych elementów tak, żeby suma tokenów grupy <= budget.
+
+    Element większy niż budget dostaje własną grupę (caller powinien go wcześniej
+    podzielić). Kolejność elementów jest zachowana.
+
+    Args:
+        token_counts: Tokeny per element
+        budget: Maksymalna suma tokenów grupy
+        max_items: Opcjonalny limit elementów w grupie
+
+    Returns:
+        List[List[int]]: Grupy indeksów elementów
+    """
+    groups: List[List[int]] = []
+    current: List[int] = []
+    used = 0
+    for index, tokens in enumerate(token_counts):
+        full = max_items is not None and len(current) >= max_items
+        if current and (used + tokens > budget or full):
+            groups.append(current)
+            current, used = [], 0
+        current.append(index)
+        used += tokens
+    if current:
+        groups.append(current)
+    return groups
@@ -0,0 +1,48 @@
+"""
+Tests for backfill_summary_periods management command
+"""
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from ai_news.models import BlogSummary, NewsArticle
+from ai_news.tests.base import BaseTestCase
+
+
+class TestBackfillSummaryPeriodsCommand(BaseTestCase):
+    """Test re-labelling of summaries saved before BlogSummary.period"""
+
+    def setUp(self):
+        super().setUp()
+        self.stdout = StringIO()
+        self.now = timezone.now()
+
+    def _summary(self, title, hours_ago_list):
+        summary = BlogSummary.objects.create(title=title, summary='Text', topic_category='AI News',
+                                             created_date=self.now)
+        summary.articles.set([
+            NewsArticle.objects.create(
+                title=f'{title} {index}', content='Content', url=f'https://example.com/{title}/{index}',
+                source='Test', published_date=self.now - timedelta(hours=hours_ago)
+            )
+            for index, hours_ago in enumerate(hours_ago_list)
+        ])
+        return summary
+
+    def test_relabels_legacy_rows_by_article_span(self):
+        """Test 24h spans become daily, 7-day spans weekly and wider ones stay custom"""
+
+        daily = self._summary('daily', [1, 20])
+        weekly = self._summary('weekly', [1, 100])
+        custom = self._summary('custom', [1, 24 * 30])
+
+        call_command('backfill_summary_periods', '--dry-run', stdout=self.stdout)
+        self.assertEqual(BlogSummary.objects.filter(period='custom').count(), 3)
+
+        call_command('backfill_summary_periods', stdout=self.stdout)
+
+        periods = dict(BlogSummary.objects.values_list('id', 'period'))
+        self.assertEqual(periods, {daily.id: 'daily', weekly.id: 'weekly', custom.id: 'custom'})
+        self.assertIn('Re-labelled 1 daily and 1 weekly summaries', self.stdout.getvalue())
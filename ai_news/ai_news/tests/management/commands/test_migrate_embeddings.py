@@ -0,0 +1,52 @@
+"""
+Tests for migrate_embeddings management command
+"""
+from io import StringIO
+
+import numpy as np
+from django.core.management import call_command
+from django.utils import timezone
+
+from ai_news.models import NewsArticle, ArticleEmbedding
+from ai_news.tests.base import BaseTestCase
+
+
+class TestMigrateEmbeddingsCommand(BaseTestCase):
+    """Test conversion of legacy JSON embeddings to binary blobs"""
+    
+    def setUp(self):
+        super().setUp()
+        self.stdout = StringIO()
+    
+    def _article(self, url, vector):
+        return NewsArticle.objects.create(
+            title=url, content='body', url=url, source='Test',
+            published_date=timezone.now(), embedding_vector=vector
+        )
+    
+    def test_converts_json_vectors_in_batches(self):
+        """Test every JSON vector moves to ArticleEmbedding and JSON is cleared"""
+        
+        articles = [self._article(f'https://example.com/{i}', [float(i), 0.5, -1.0]) for i in range(3)]
+        self._article('https://example.com/none', None)
+        
+        call_command('migrate_embeddings', '--batch-size', '2', stdout=self.stdout)
+        
+        self.assertEqual(ArticleEmbedding.objects.count(), 3)
+        self.assertFalse(NewsArticle.objects.filter(embedding_vector__isnull=False).exists())
+        stored = NewsArticle.objects.get(pk=articles[2].pk).get_embedding()
+        np.testing.assert_array_equal(stored, np.array([2.0, 0.5, -1.0], dtype=np.float32))
+        self.assertIn('Converted 3 embeddings', self.stdout.getvalue())
+    
+    def test_float16_keep_json(self):
+        """Test float16 blobs halve the size and --keep-json leaves legacy data"""
+        
+        article = self._article('https://example.com/1', [0.25] * 1536)
+        
+        call_command('migrate_embeddings', '--dtype', 'float16', '--keep-json', stdout=self.stdout)
+        
+        embedding = ArticleEmbedding.objects.get(article=article)
+        self.assertEqual((embedding.dtype, embedding.dimension, len(bytes(embedding.vector))), ('float16', 1536, 3072))
+        self.assertEqual(embedding.as_array()[0], np.float16(0.25))
+        article.refresh_from_db()
+        self.assertIsNotNone(article.embedding_vector)
@@ -2,9 +2,14 @@
 Tests for RSS base scraper functionality
 """
 
+import asyncio
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 
+import feedparser
+from datetime import datetime, timezone as dt_timezone
+
+from ai_news.models import FeedCacheState, SourceWatermark
 from ai_news.src.parsers.rss_base import RSSFeedScraper
 from ai_news.src.parsers.base import NewsArticleData
 from ai_news.tests.base import BaseTestCase, mock_feedparser_parse
@@ -201,4 +206,113 @@ class TestRSSFeedScraper(BaseTestCase):
         
         # Should handle entry processing errors gracefully
         articles = self.scraper.scrape()
-        self.assertEqual(articles, [])
\ No newline at end of file
+        self.assertEqual(articles, [])
+    
+    def test_async_rss_scraping_parses_downloaded_bytes(self):
+        """Test ascrape() downloads via async client and hands bytes to feedparser"""
+        
+        rss_bytes = (
+            b'<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>'
+            b'<item><title>Async Entry</title><link>https://example.com/async</link>'
+            b'<description>Async body</description></item></channel></rss>'
+        )
+        mock_response = Mock(content=rss_bytes, status_code=200, headers={})
+        
+        with patch.object(self.scraper, '_load_validators', return_value={}), \
+             patch.object(self.scraper, '_store_validators'), \
+             patch.object(self.scraper, '_load_watermark', return_value=(None, set())), \
+             patch.object(self.scraper, '_afetch', AsyncMock(return_value=mock_response)) as mock_fetch:
+            articles = asyncio.run(self.scraper.ascrape())
+        
+        mock_fetch.assert_awaited_once_with('https://example.com/rss', headers={})
+        self.assertEqual(len(articles), 1)
+        self.assertEqual(articles[0].title, 'Async Entry')
+        self.assertEqual(articles[0].url, 'https://example.com/async')
+    
+    @patch('ai_news.src.parsers.rss_base.feedparser.parse')
+    def test_async_rss_scraping_not_modified(self, mock_parse):
+        """Test ascrape() returns no articles on 304 without parsing the body"""
+        
+        mock_response = Mock(status_code=304)
+        
+        with patch.object(self.scraper, '_load_validators', return_value={'etag': '"abc123"'}), \
+             patch.object(self.scraper, '_store_validators'), \
+             patch.object(self.scraper, '_afetch', AsyncMock(return_value=mock_response)) as mock_fetch:
+            articles = asyncio.run(self.scraper.ascrape())
+        
+        self.assertEqual(articles, [])
+        mock_fetch.assert_awaited_once_with(
+            'https://example.com/rss', headers={'If-None-Match': '"abc123"'}
+        )
+        mock_parse.assert_not_called()
+    
+    def test_async_rss_scraping_with_exception(self):
+        """Test ascrape() handles network errors gracefully"""
+        
+        with patch.object(self.scraper, '_afetch', AsyncMock(side_effect=Exception('Network error'))):
+            articles = asyncio.run(self.scraper.ascrape())
+        
+        self.assertEqual(articles, [])
+    
+    @patch('ai_news.src.parsers.rss_base.feedparser.parse')
+    def test_conditional_get_not_modified_skips_parsing(self, mock_parse):
+        """Test stored validators are sent and a 304 returns no articles"""
+        
+        FeedCacheState.objects.create(
+            feed_url='https://example.com/rss',
+            etag='"abc123"',
+            last_modified='Wed, 01 Jan 2025 00:00:00 GMT'
+        )
+        mock_parse.return_value = feedparser.FeedParserDict(status=304, entries=[])
+        
+        with patch.object(self.scraper, '_parse_feed') as mock_parse_feed:
+            articles = self.scraper.scrape()
+        
+        self.assertEqual(articles, [])
+        mock_parse_feed.assert_not_called()
+        mock_parse.assert_called_once_with(
+            'https://example.com/rss',
+            etag='"abc123"',
+            modified='Wed, 01 Jan 2025 00:00:00 GMT'
+        )
+    
+    @patch('ai_news.src.parsers.rss_base.feedparser.parse')
+    def test_conditional_get_stores_validators(self, mock_parse):
+        """Test validators from a 200 response are persisted only once ingestion commits them"""
+        
+        mock_parse.return_value = feedparser.FeedParserDict(
+            status=200, entries=[], etag='"v2"', modified='Thu, 02 Jan 2025 00:00:00 GMT'
+        )
+        
+        self.scraper.scrape()
+        self.assertFalse(FeedCacheState.objects.exists())
+        
+        self.scraper.commit_fetch_state()
+        
+        state = FeedCacheState.objects.get(feed_url='https://example.com/rss')
+        self.assertEqual(state.etag, '"v2"')
+        self.assertEqual(state.last_modified, 'Thu, 02 Jan 2025 00:00:00 GMT')
+        self.assertEqual(state.last_status, 200)
+    
+    def test_watermark_skips_known_urls_and_stops_at_cutoff(self):
+        """Test known URLs are skipped and entries older than the high-water mark stop parsing"""
+        
+        SourceWatermark.objects.create(
+            source='Test RSS Source',
+            newest_published=datetime(2025, 1, 10, tzinfo=dt_timezone.utc),
+            recent_urls=['https://example.com/known']
+        )
+        feed = feedparser.FeedParserDict(entries=[
+            feedparser.FeedParserDict(title='Fresh', link='https://example.com/fresh',
+                                      summary='Body', published='2025-01-11T00:00:00Z'),
+            feedparser.FeedParserDict(title='Known', link='https://example.com/known',
+                                      summary='Body', published='2025-01-09T00:00:00Z'),
+            feedparser.FeedParserDict(title='Ancient', link='https://example.com/ancient',
+                                      summary='Body', published='2024-12-01T00:00:00Z'),
+            feedparser.FeedParserDict(title='After cutoff', link='https://example.com/after',
+                                      summary='Body', published='2025-01-12T00:00:00Z'),
+        ])
+        
+        articles = self.scraper._parse_feed(feed, self.scraper._load_watermark())
+        
+        self.assertEqual([a.url for a in articles], ['https://example.com/fresh'])
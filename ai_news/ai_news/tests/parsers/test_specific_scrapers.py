@@ -2,9 +2,10 @@
 Tests for specific scraper implementations
 """
 
+import asyncio
 import unittest
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
+from datetime import datetime, timedelta
 
 from ai_news.src.parsers.openai_blog_scraper import OpenAIBlogScraper
 from ai_news.src.parsers.hackernews_scraper import HackerNewsScraper
@@ -31,7 +32,7 @@ class TestSpecificScrapers(BaseTestCase):
         self.assertEqual(scraper.api_url, 'https://hacker-news.firebaseio.com/v0')
         self.assertEqual(scraper.max_stories, 30)
     
-    @patch('ai_news.src.parsers.hackernews_scraper.requests.Session.get')
+    @patch('requests.Session.get')
     def test_hackernews_scraper_successful_scraping(self, mock_get):
         """Test Hacker News scraper successful operation"""
         
@@ -66,7 +67,14 @@ class TestSpecificScrapers(BaseTestCase):
             'time': 1609632000
         })
         
-        mock_get.side_effect = [story_ids_response, story1_response, story2_response, story3_response]
+        # Item requests run concurrently, so responses are keyed by URL instead of call order
+        responses = {
+            'topstories.json': story_ids_response,
+            'item/1.json': story1_response,
+            'item/2.json': story2_response,
+            'item/3.json': story3_response,
+        }
+        mock_get.side_effect = lambda url, **kwargs: responses[url.split('/v0/', 1)[1]]
         
         articles = scraper.scrape()
         
@@ -76,6 +84,53 @@ class TestSpecificScrapers(BaseTestCase):
         self.assertEqual(articles[0].source, 'Hacker News')
         self.assertEqual(articles[1].title, 'Test AI Story 2')
     
+    @patch('requests.Session.get')
+    def test_hackernews_scraper_item_cache(self, mock_get):
+        """Test stories seen on a previous run are served from the item cache"""
+        
+        scraper = HackerNewsScraper(max_stories=2)
+        responses = {
+            'topstories.json': MockRequestsResponse(json_data=[1, 2, 3]),
+            'item/1.json': MockRequestsResponse(json_data={
+                'type': 'story', 'title': 'Story 1', 'url': 'https://example.com/1', 'time': 1609459200
+            }),
+            'item/2.json': MockRequestsResponse(json_data={
+                'type': 'story', 'title': 'Story 2', 'url': 'https://example.com/2', 'time': 1609459200
+            }),
+        }
+        mock_get.side_effect = lambda url, **kwargs: responses[url.split('/v0/', 1)[1]]
+        
+        first_run = scraper.scrape()
+        second_run = HackerNewsScraper(max_stories=2).scrape()
+        
+        requested = [call.args[0].split('/v0/', 1)[1] for call in mock_get.call_args_list]
+        self.assertEqual(sorted(requested), ['item/1.json', 'item/2.json', 'topstories.json', 'topstories.json'])
+        self.assertEqual([a.title for a in first_run], ['Story 1', 'Story 2'])
+        self.assertEqual([a.title for a in second_run], ['Story 1', 'Story 2'])
+    
+    @patch('requests.Session.get')
+    def test_hackernews_item_cache_expires_after_ttl(self, mock_get):
+        """Test items are persisted in the database and refetched once older than the TTL"""
+        from django.utils import timezone
+        from ai_news.models import HackerNewsItem
+        
+        HackerNewsItem.objects.create(
+            item_id=1, fetched_at=timezone.now() - timedelta(hours=2),
+            payload={'type': 'story', 'title': 'Stale', 'url': 'https://example.com/1', 'time': 1609459200}
+        )
+        responses = {
+            'topstories.json': MockRequestsResponse(json_data=[1]),
+            'item/1.json': MockRequestsResponse(json_data={
+                'type': 'story', 'title': 'Fresh', 'url': 'https://example.com/1', 'time': 1609459200
+            }),
+        }
+        mock_get.side_effect = lambda url, **kwargs: responses[url.split('/v0/', 1)[1]]
+        
+        articles = HackerNewsScraper(max_stories=1, item_cache_ttl=3600).scrape()
+        
+        self.assertEqual([a.title for a in articles], ['Fresh'])
+        self.assertEqual(HackerNewsItem.objects.get(item_id=1).payload['title'], 'Fresh')
+    
     @patch('ai_news.src.parsers.hackernews_scraper.requests.Session.get')
     def test_hackernews_scraper_network_error(self, mock_get):
         """Test Hacker News scraper with network error"""
@@ -88,6 +143,29 @@ class TestSpecificScrapers(BaseTestCase):
         # Should handle error gracefully
         self.assertEqual(articles, [])
     
+    def test_hackernews_async_scraping(self):
+        """Test Hacker News ascrape() keeps top-story order and filters items"""
+        
+        scraper = HackerNewsScraper()
+        payloads = {
+            'topstories': [1, 2, 3],
+            1: {'type': 'story', 'title': 'Story 1', 'url': 'https://example.com/1', 'time': 1609459200},
+            2: {'type': 'ask', 'title': 'Ask HN', 'url': '', 'time': 1609459200},
+            3: {'type': 'story', 'title': 'Story 3', 'url': 'https://example.com/3', 'time': 1609459200},
+        }
+        
+        async def fake_fetch(url, **kwargs):
+            key = 'topstories' if url.endswith('topstories.json') else int(url.rsplit('/', 1)[1].split('.')[0])
+            return MockRequestsResponse(json_data=payloads[key])
+        
+        # Item cache stubbed - sync_to_async would write HackerNewsItem outside the test transaction
+        with patch.object(scraper, '_aget_cached_items', AsyncMock(return_value={})), \
+             patch.object(scraper, '_acache_items', AsyncMock()), \
+             patch.object(scraper, '_afetch', AsyncMock(side_effect=fake_fetch)):
+            articles = asyncio.run(scraper.ascrape())
+        
+        self.assertEqual([a.title for a in articles], ['Story 1', 'Story 3'])
+    
     def test_reddit_scraper_initialization(self):
         """Test Reddit scraper initialization"""
         scraper = RedditMachineLeaningScraper()
@@ -14,7 +14,8 @@ from rest_framework import status
 from ai_news.models import BlogSummary, NewsArticle
 from ai_news.api_views import (
     LatestSummaryAPIView, SummaryListAPIView, 
-    SystemStatusAPIView, SummaryDetailAPIView
+    SystemStatusAPIView, SummaryDetailAPIView,
+    summary_articles_prefetch
 )
 
 
@@ -184,6 +185,31 @@ class SummaryDetailAPIViewTest(BaseAPITestCase):
         self.assertEqual(data['error'], 'summary_not_found')
 
 
+class LeanArticleQueryTest(BaseAPITestCase):
+    """Tests for lean article projections used by list endpoints."""
+    
+    def test_summary_prefetch_loads_only_source(self):
+        """Test summary serializers read prefetched articles without heavy columns."""
+        summary = BlogSummary.objects.prefetch_related(summary_articles_prefetch()).get(id=self.summary.id)
+        
+        with self.assertNumQueries(0):
+            sources = {article.source for article in summary.articles.all()}
+            count = summary.articles.count()
+        
+        self.assertEqual((sources, count), ({'Test Source'}, 2))
+        self.assertIn('content', summary.articles.all()[0].get_deferred_fields())
+    
+    def test_lean_defers_heavy_fields_opt_in(self):
+        """Test the default manager loads full rows and lean() defers content and embedding_vector."""
+        article = NewsArticle.objects.get(id=self.article1.id)
+        lean_article = NewsArticle.objects.lean().get(id=self.article1.id)
+        full_article = NewsArticle.objects.with_body().get(id=self.article1.id)
+        
+        self.assertEqual(article.get_deferred_fields(), set())
+        self.assertEqual(lean_article.get_deferred_fields(), {'content', 'embedding_vector'})
+        self.assertEqual(full_article.get_deferred_fields(), set())
+
+
 class SystemStatusAPIViewTest(BaseAPITestCase):
     """Tests for SystemStatusAPIView."""
     
@@ -0,0 +1,95 @@
+"""
+Tests for the statistics rollup (SourceStats / DailyStats)
+"""
+from datetime import timedelta
+
+from django.utils import timezone
+
+from ai_news.src.article_stats import (
+    aggregate_article_statistics, collect_article_statistics, daily_article_counts,
+    rebuild_statistics_rollup, record_deleted_articles, record_ingested_articles
+)
+from ai_news.tests.base import BaseTestCase
+
+
+class TestStatisticsRollup(BaseTestCase):
+    """Test incremental rollup updates, O(1) reads and rebuild"""
+
+    def _articles(self, source, count, days_ago=0, duplicates=0):
+        from ai_news.models import NewsArticle
+        published = timezone.now() - timedelta(days=days_ago)
+        return [
+            NewsArticle.objects.create(
+                title=f'{source} {days_ago} {index}', content='Content',
+                url=f'https://example.com/{source}/{days_ago}/{index}', source=source,
+                published_date=published, is_duplicate=index < duplicates
+            )
+            for index in range(count)
+        ]
+
+    def test_ingested_batches_update_rollup(self):
+        """Test ingestion deltas match the full aggregate and reads take one query"""
+
+        today = self._articles('OpenAI Blog', 3, duplicates=1)
+        record_ingested_articles(today, [True, False, False])
+        yesterday = self._articles('TechCrunch', 2, days_ago=1)
+        record_ingested_articles(yesterday)
+
+        with self.assertNumQueries(1):
+            stats = collect_article_statistics()
+
+        self.assertEqual(stats, aggregate_article_statistics())
+        self.assertEqual(stats['source_statistics']['OpenAI Blog'], {'total': 3, 'unique': 2})
+        self.assertEqual(stats['source_count'], 2)
+
+        daily = daily_article_counts(days=7)
+        self.assertEqual(daily[timezone.localdate()], {'total': 3, 'unique': 2})
+        self.assertEqual(daily[timezone.localdate() - timedelta(days=1)], {'total': 2, 'unique': 2})
+
+    def test_deleted_articles_are_subtracted(self):
+        """Test record_deleted_articles removes rows from source and day counts"""
+        from ai_news.models import NewsArticle, SourceStats
+
+        articles = self._articles('OpenAI Blog', 4, duplicates=1)
+        record_ingested_articles(articles, [True, False, False, False])
+
+        old = NewsArticle.objects.filter(id__in=[articles[0].id, articles[1].id])
+        record_deleted_articles(old)
+        old.delete()
+
+        row = SourceStats.objects.get(source='OpenAI Blog')
+        self.assertEqual((row.total_articles, row.unique_articles, row.duplicate_articles), (2, 2, 0))
+        self.assertEqual(collect_article_statistics(), aggregate_article_statistics())
+
+    def test_rebuild_reconciles_drift(self):
+        """Test rebuild_stats recomputes the rollup and reports corrected rows"""
+        from django.core.management import call_command
+        from io import StringIO
+
+        self._articles('OpenAI Blog', 2)
+        self._articles('TechCrunch', 1, days_ago=2)
+
+        # Empty rollup falls back to the grouped aggregate
+        self.assertEqual(collect_article_statistics()['total_articles'], 3)
+
+        self.assertEqual(rebuild_statistics_rollup(), {'sources_corrected': 2, 'days_corrected': 2})
+        self.assertEqual(rebuild_statistics_rollup(), {'sources_corrected': 0, 'days_corrected': 0})
+
+        out = StringIO()
+        call_command('rebuild_stats', stdout=out)
+        self.assertIn('0 sources and 0 days corrected', out.getvalue())
+        self.assertEqual(collect_article_statistics(), aggregate_article_statistics())
+
+    def test_first_ingestion_backfills_empty_rollup(self):
+        """Test the first batch after an upgrade rebuilds the rollup instead of counting only itself"""
+        from ai_news.models import SourceStats
+
+        self._articles('OpenAI Blog', 5, days_ago=3)
+        recent = self._articles('TechCrunch', 1)
+        record_ingested_articles(recent)
+
+        self.assertEqual(SourceStats.objects.get(source='OpenAI Blog').total_articles, 5)
+        with self.assertNumQueries(1):
+            stats = collect_article_statistics()
+        self.assertEqual(stats['total_articles'], 6)
+        self.assertEqual(stats, aggregate_article_statistics())
@@ -6,6 +6,9 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 import hashlib
 
+from django.utils import timezone
+from langchain_core.embeddings import Embeddings
+
 from ai_news.src.deduplication import (
     ContentHashDeduplicator, 
     VectorDeduplicator, 
@@ -317,4 +320,249 @@ class TestDuplicationService(BaseTestCase):
         result = self.service.process_article_for_duplicates(mock_article)
         
         # Should default to not duplicate on error
-        self.assertFalse(result)
\ No newline at end of file
+        self.assertFalse(result)
+
+class TopicEmbeddings(Embeddings):
+    """Deterministic embeddings: one-hot vector per topic keyword, so same-topic texts are identical"""
+    
+    TOPICS = ['openai', 'robotics', 'chips']
+    
+    def __init__(self):
+        self.document_calls = 0
+        self.query_calls = 0
+    
+    def embed_documents(self, texts):
+        self.document_calls += 1
+        return [self._topic_vector(text) for text in texts]
+    
+    def embed_query(self, text):
+        self.query_calls += 1
+        return self._topic_vector(text)
+    
+    def _topic_vector(self, text):
+        vector = [0.0] * 1536
+        for index, topic in enumerate(self.TOPICS):
+            if topic in text.lower():
+                vector[index] = 1.0
+        return vector
+
+
+class TestBatchDeduplication(BaseTestCase):
+    """Test batch embedding API against an in-memory Qdrant collection"""
+    
+    def setUp(self):
+        super().setUp()
+        from qdrant_client import QdrantClient
+        
+        self.embeddings = TopicEmbeddings()
+        self.deduplicator = VectorDeduplicator(
+            qdrant_client=QdrantClient(":memory:"),
+            embeddings=self.embeddings,
+            embedding_batch_size=2
+        )
+        # QdrantVectorStore probes dimension at init
+        self.embeddings.document_calls = self.embeddings.query_calls = 0
+        self.service = DuplicationService(
+            vector_deduplicator=self.deduplicator,
+            hash_deduplicator=ContentHashDeduplicator()
+        )
+    
+    def _article(self, title, url):
+        from ai_news.models import NewsArticle
+        return NewsArticle.objects.create(
+            title=title, content=f'{title} body', url=url,
+            source='Test', published_date=timezone.now()
+        )
+    
+    def test_index_and_find_similar_batch(self):
+        """Test batch indexing and batch search use chunked embed_documents"""
+        
+        indexed = [self._article('OpenAI release', 'https://example.com/1'),
+                   self._article('Robotics funding', 'https://example.com/2')]
+        self.assertEqual(self.deduplicator.index_articles(indexed), 2)
+        
+        queries = [self._article('OpenAI launches model', 'https://example.com/3'),
+                   self._article('Chips shortage', 'https://example.com/4'),
+                   self._article('Robotics startup', 'https://example.com/5')]
+        results = self.deduplicator.find_similar_batch(queries)
+        
+        self.assertEqual([[match.id for match, _ in row] for row in results],
+                         [[indexed[0].id], [], [indexed[1].id]])
+        # 2 + 3 texts in chunks of 2 -> 1 + 2 embed_documents calls, no per-article embed_query
+        self.assertEqual(self.embeddings.document_calls, 3)
+        indexed[0].refresh_from_db()
+        self.assertEqual(indexed[0].get_embedding().shape, (1536,))
+    
+    def test_process_articles_for_duplicates_batch(self):
+        """Test batch pipeline catches index and intra-batch duplicates"""
+        
+        existing = self._article('Robotics funding', 'https://example.com/1')
+        self.deduplicator.index_articles([existing])
+        
+        batch = [self._article('OpenAI release', 'https://example.com/2'),
+                 self._article('OpenAI release recap', 'https://example.com/3'),
+                 self._article('Robotics round', 'https://example.com/4'),
+                 self._article('Chips shortage', 'https://example.com/5')]
+        
+        flags = self.service.process_articles_for_duplicates(batch)
+        
+        self.assertEqual(flags, [False, True, True, False])
+        self.assertEqual(batch[1].duplicate_of_id, batch[0].id)
+        self.assertEqual(batch[2].duplicate_of_id, existing.id)
+        self.assertEqual(self.deduplicator.client.count('news_articles').count, 3)
+    
+    def test_cluster_batch_searches_only_leaders(self):
+        """Test same-story copies cluster in NumPy and only cluster leaders hit Qdrant"""
+        
+        batch = [self._article('OpenAI release', 'https://example.com/1'),
+                 self._article('Chips shortage', 'https://example.com/2'),
+                 self._article('OpenAI release recap', 'https://example.com/3'),
+                 self._article('Robotics startup', 'https://example.com/4')]
+        vectors = self.deduplicator.embed_articles(batch)
+        
+        clusters = self.service._cluster_batch(batch, vectors)
+        self.assertEqual([leader for leader, _ in clusters], [0, 1, 0, 3])
+        
+        with patch.object(self.deduplicator, 'find_similar_batch', wraps=self.deduplicator.find_similar_batch) as search:
+            flags = self.service.process_articles_for_duplicates(batch)
+        
+        self.assertEqual(flags, [False, False, True, False])
+        self.assertEqual(search.call_args.args[0], [batch[0], batch[1], batch[3]])
+    
+    def test_process_article_embeds_once(self):
+        """Test single-article pipeline reuses one vector for search, upsert and DB storage"""
+        
+        article = self._article('OpenAI release', 'https://example.com/1')
+        
+        is_duplicate = self.service.process_article_for_duplicates(article)
+        
+        self.assertFalse(is_duplicate)
+        self.assertEqual(self.embeddings.document_calls + self.embeddings.query_calls, 1)
+        self.assertEqual(self.deduplicator.client.count('news_articles').count, 1)
+        article.refresh_from_db()
+        self.assertEqual(article.get_embedding()[0], 1.0)
+    
+    def test_reindex_uses_embedding_cache(self):
+        """Test re-indexing after a Qdrant wipe costs no embedding calls"""
+        from qdrant_client import QdrantClient
+        
+        articles = [self._article('OpenAI release', 'https://example.com/1'),
+                    self._article('Chips shortage', 'https://example.com/2')]
+        self.deduplicator.index_articles(articles)
+        
+        rebuilt = VectorDeduplicator(qdrant_client=QdrantClient(":memory:"), embeddings=self.embeddings)
+        self.embeddings.document_calls = self.embeddings.query_calls = 0
+        
+        self.assertEqual(rebuilt.index_articles(articles), 2)
+        self.assertEqual(self.embeddings.document_calls + self.embeddings.query_calls, 0)
+    
+    def test_dedup_window_ignores_old_articles(self):
+        """Test only articles published within the dedup window are duplicate candidates"""
+        from datetime import timedelta
+        
+        old = self._article('OpenAI release', 'https://example.com/1')
+        old.published_date = timezone.now() - timedelta(days=30)
+        old.save()
+        recent = self._article('Robotics funding', 'https://example.com/2')
+        self.deduplicator.index_articles([old, recent])
+        
+        queries = [self._article('OpenAI launches model', 'https://example.com/3'),
+                   self._article('Robotics startup', 'https://example.com/4')]
+        results = self.deduplicator.find_similar_batch(queries)
+        
+        self.assertEqual([[match.id for match, _ in row] for row in results], [[], [recent.id]])
+    
+    def test_dedup_window_keeps_points_indexed_without_published_ts(self):
+        """Test points indexed before published_ts existed stay duplicate candidates within the window"""
+        from datetime import timedelta
+        from langchain_qdrant import QdrantVectorStore
+        
+        legacy = self._article('OpenAI release', 'https://example.com/1')
+        old = self._article('Robotics funding', 'https://example.com/2')
+        old.published_date = timezone.now() - timedelta(days=30)
+        old.save()
+        self.deduplicator.index_articles([legacy, old])
+        for article in (legacy, old):
+            self.deduplicator.client.set_payload(
+                collection_name='news_articles',
+                payload={QdrantVectorStore.METADATA_KEY: {"article_id": article.id, "title": article.title}},
+                points=[article.id]
+            )
+        
+        queries = [self._article('OpenAI launches model', 'https://example.com/3'),
+                   self._article('Robotics startup', 'https://example.com/4')]
+        results = self.deduplicator.find_similar_batch(queries)
+        
+        self.assertEqual([[match.id for match, _ in row] for row in results], [[legacy.id], []])
+    
+    def test_collection_gets_published_ts_payload_index(self):
+        """Test the dedup window field is indexed when the collection is ensured"""
+        from qdrant_client import QdrantClient
+        
+        client = QdrantClient(":memory:")
+        with patch.object(client, 'create_payload_index') as create_payload_index:
+            VectorDeduplicator(qdrant_client=client, embeddings=self.embeddings)
+        
+        self.assertEqual(create_payload_index.call_args.kwargs['field_name'], 'metadata.published_ts')
+    
+    def test_search_similar_content_single_query_and_payload_only(self):
+        """Test hits load with one in_bulk in score order; payload_only skips the DB"""
+        
+        articles = [self._article('Robotics funding', 'https://example.com/1'),
+                    self._article('OpenAI release', 'https://example.com/2')]
+        self.deduplicator.index_articles(articles)
+        
+        with self.assertNumQueries(1):
+            results = self.deduplicator.search_similar_content('openai', limit=2)
+        self.assertEqual(results[0], articles[1])
+        
+        with self.assertNumQueries(0):
+            hits = self.deduplicator.search_similar_content('openai', limit=1, payload_only=True)
+        self.assertEqual(hits[0].article_id, articles[1].id)
+        self.assertEqual((hits[0].title, hits[0].url), ('OpenAI release', 'https://example.com/2'))
+        self.assertEqual(hits[0].published_date, articles[1].published_date)
+
+
+class FakeSentenceTransformer:
+    """Stand-in for sentence_transformers.SentenceTransformer with a 384d model"""
+    
+    def __init__(self, model_name, device=None):
+        self.model_name = model_name
+        self.device = device
+    
+    def get_sentence_embedding_dimension(self):
+        return 384
+    
+    def encode(self, texts, **kwargs):
+        import numpy as np
+        vectors = np.zeros((len(texts), 384), dtype=np.float32)
+        for row, text in enumerate(texts):
+            vectors[row, len(text) % 384] = 1.0
+        return vectors
+
+
+class TestLocalEmbeddingBackend(BaseTestCase):
+    """Test sentence-transformers backend selection and collection sizing"""
+    
+    def test_local_backend_sizes_collection_from_model(self):
+        """Test EMBEDDING_BACKEND=sentence-transformers creates a 384d collection"""
+        import sys
+        import types
+        from qdrant_client import QdrantClient
+        
+        fake_module = types.ModuleType('sentence_transformers')
+        fake_module.SentenceTransformer = FakeSentenceTransformer
+        client = QdrantClient(":memory:")
+        
+        with patch.dict(sys.modules, {'sentence_transformers': fake_module}):
+            deduplicator = VectorDeduplicator(
+                qdrant_client=client,
+                embedding_backend='sentence-transformers',
+                embedding_cache_max_entries=0
+            )
+            vectors = deduplicator.embeddings.embed_documents(['a', 'bb'])
+        
+        self.assertEqual(deduplicator.embedding_size, 384)
+        self.assertEqual(client.get_collection('news_articles').config.params.vectors.size, 384)
+        self.assertEqual(deduplicator.embeddings.model, 'sentence-transformers/all-MiniLM-L6-v2')
+        self.assertEqual([len(vector) for vector in vectors], [384, 384])
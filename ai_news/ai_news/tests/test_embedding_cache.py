@@ -0,0 +1,55 @@
+"""
+Tests for persistent embedding cache
+"""
+
+from datetime import timedelta
+
+from django.utils import timezone
+
+from ai_news.models import EmbeddingCacheEntry
+from ai_news.src.embedding_cache import EmbeddingCache
+from ai_news.tests.base import BaseTestCase
+
+
+class TestEmbeddingCache(BaseTestCase):
+    """Test (model, content_hash) keyed embedding cache"""
+    
+    def setUp(self):
+        super().setUp()
+        self.cache = EmbeddingCache(model_name='test-model', max_entries=2)
+    
+    def test_roundtrip_is_keyed_by_model(self):
+        """Test vectors round-trip as float32 and are isolated per model"""
+        
+        self.cache.set_many({'hash-a': [0.5, -1.0, 0.25]})
+        
+        self.assertEqual(self.cache.get_many(['hash-a', 'hash-b']), {'hash-a': [0.5, -1.0, 0.25]})
+        self.assertEqual(EmbeddingCache(model_name='other-model').get_many(['hash-a']), {})
+    
+    def test_eviction_drops_least_recently_used(self):
+        """Test cache is trimmed to max_entries by last_used"""
+        
+        self.cache.set_many({'hash-a': [1.0], 'hash-b': [2.0]})
+        EmbeddingCacheEntry.objects.filter(content_hash='hash-a').update(
+            last_used=timezone.now() - timedelta(days=1)
+        )
+        self.cache.get_many(['hash-a'])  # Hit refreshes last_used - hash-b is now oldest
+        EmbeddingCacheEntry.objects.filter(content_hash='hash-b').update(
+            last_used=timezone.now() - timedelta(days=2)
+        )
+        
+        self.cache.set_many({'hash-c': [3.0]})
+        
+        self.assertEqual(
+            sorted(EmbeddingCacheEntry.objects.values_list('content_hash', flat=True)),
+            ['hash-a', 'hash-c']
+        )
+    
+    def test_disabled_cache(self):
+        """Test max_entries=0 disables reads and writes"""
+        
+        cache = EmbeddingCache(model_name='test-model', max_entries=0)
+        cache.set_many({'hash-a': [1.0]})
+        
+        self.assertEqual(cache.get_many(['hash-a']), {})
+        self.assertFalse(EmbeddingCacheEntry.objects.exists())
@@ -0,0 +1,140 @@
+"""
+Tests for the in-process FAISS vector store
+"""
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+from django.utils import timezone
+
+from ai_news.core.config import AppConfig
+from ai_news.src.deduplication import create_vector_deduplicator
+from ai_news.src.faiss_store import FaissVectorDeduplicator
+from ai_news.tests.base import BaseTestCase
+from ai_news.tests.test_deduplication import TopicEmbeddings
+
+
+class TestFaissVectorDeduplicator(BaseTestCase):
+    """Test FAISS add/search/remove/persistence behind the deduplicator interface"""
+
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = tempfile.mkdtemp()
+        self.index_path = os.path.join(self.tmpdir, 'index', 'news.faiss')
+        self.deduplicator = self._deduplicator()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+        super().tearDown()
+
+    def _deduplicator(self, **kwargs):
+        return FaissVectorDeduplicator(
+            index_path=self.index_path,
+            embeddings=TopicEmbeddings(),
+            embedding_cache_max_entries=0,
+            **kwargs
+        )
+
+    def _article(self, title, url, days_ago=0):
+        from ai_news.models import NewsArticle
+        return NewsArticle.objects.create(
+            title=title, content=f'{title} body', url=url,
+            source='Test', published_date=timezone.now() - timedelta(days=days_ago)
+        )
+
+    def test_index_and_search_with_threshold(self):
+        """Test only same-topic articles pass the similarity threshold"""
+
+        indexed = [self._article('OpenAI release', 'https://example.com/1'),
+                   self._article('Robotics funding', 'https://example.com/2')]
+        self.assertEqual(self.deduplicator.index_articles(indexed), 2)
+
+        queries = [self._article('OpenAI launches model', 'https://example.com/3'),
+                   self._article('Chips shortage', 'https://example.com/4')]
+        results = self.deduplicator.find_similar_batch(queries)
+
+        self.assertEqual([[match.id for match, _ in row] for row in results], [[indexed[0].id], []])
+        self.assertAlmostEqual(results[0][0][1], 1.0, places=5)
+
+    def test_upsert_and_remove(self):
+        """Test re-indexing replaces the vector and remove drops it"""
+
+        article = self._article('OpenAI release', 'https://example.com/1')
+        self.deduplicator.index_articles([article])
+        self.deduplicator.index_articles([article])
+        self.assertEqual(self.deduplicator.get_collection_info()['vectors_count'], 1)
+
+        self.deduplicator.remove_article_from_index(article.id)
+
+        query = self._article('OpenAI news', 'https://example.com/2')
+        self.assertEqual(self.deduplicator.find_similar_articles(query), [])
+        self.assertEqual(self.deduplicator.get_collection_info()['vectors_count'], 0)
+
+    def test_index_persists_across_instances(self):
+        """Test index is written to disk on flush and memory-mapped on the next start"""
+
+        article = self._article('Robotics funding', 'https://example.com/1')
+        self.deduplicator.index_articles([article])
+        self.assertFalse(os.path.exists(self.index_path))
+
+        self.deduplicator.flush()
+        self.assertTrue(os.path.exists(self.index_path))
+
+        reloaded = self._deduplicator()
+        query = self._article('Robotics startup', 'https://example.com/2')
+
+        self.assertEqual([match.id for match, _ in reloaded.find_similar_articles(query)], [article.id])
+        self.assertEqual(reloaded.search_similar_content('robotics'), [article])
+        self.assertEqual(reloaded.search_similar_content('robotics', payload_only=True)[0].title, 'Robotics funding')
+        self.assertEqual(reloaded.get_collection_info()['backend'], 'faiss')
+
+    def test_backend_selected_from_config(self):
+        """Test VECTOR_STORE_BACKEND=faiss builds the FAISS deduplicator"""
+
+        config = AppConfig(vector_store_backend='faiss', faiss_index_path=self.index_path)
+        with patch('ai_news.core.config.get_app_config', return_value=config):
+            deduplicator = create_vector_deduplicator(
+                qdrant_host='localhost',
+                embeddings=TopicEmbeddings(),
+                embedding_cache_max_entries=0
+            )
+
+        self.assertIsInstance(deduplicator, FaissVectorDeduplicator)
+        self.assertEqual(deduplicator.index_path, self.index_path)
+
+    def test_dedup_window_finds_in_window_match_behind_older_neighbours(self):
+        """Test the window is applied before the top-k cut, like the Qdrant payload filter"""
+
+        deduplicator = self._deduplicator(dedup_window_days=7)
+        old = [self._article(f'OpenAI release {index}', f'https://example.com/old/{index}', days_ago=60)
+               for index in range(5)]
+        recent = self._article('OpenAI release recent', 'https://example.com/recent', days_ago=1)
+        deduplicator.index_articles(old + [recent])
+
+        query = self._article('OpenAI launches model', 'https://example.com/query')
+        matches = deduplicator.find_similar_articles(query, limit=1)
+
+        self.assertEqual([match.id for match, _ in matches], [recent.id])
+
+    def test_batch_pipeline_writes_index_once(self):
+        """Test single-article upserts only mark the index dirty and the batch pipeline saves it once"""
+        from ai_news.src.deduplication import DuplicationService
+
+        articles = [self._article('OpenAI release', 'https://example.com/1'),
+                    self._article('Robotics funding', 'https://example.com/2')]
+        with patch.object(self.deduplicator, '_save_index', wraps=self.deduplicator._save_index) as save:
+            for article in articles:
+                self.deduplicator.add_article_to_index(article)
+            self.assertEqual(save.call_count, 0)
+
+            service = DuplicationService(
+                vector_deduplicator=self.deduplicator,
+                hash_deduplicator=Mock(find_hash_duplicates_batch=Mock(return_value={})),
+                near_duplicate_deduplicator=Mock(find_near_duplicates_batch=Mock(return_value={}))
+            )
+            service.process_articles_for_duplicates([self._article('Chips shortage', 'https://example.com/3')])
+
+        self.assertEqual(save.call_count, 1)
+        self.assertEqual(self._deduplicator().get_collection_info()['vectors_count'], 3)
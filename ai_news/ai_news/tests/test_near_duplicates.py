@@ -0,0 +1,128 @@
+"""
+Tests for MinHash/LSH near-duplicate detection
+"""
+from datetime import timedelta
+
+from django.utils import timezone
+
+from ai_news.src.deduplication import ContentHashDeduplicator, DuplicationService, VectorDeduplicator
+from ai_news.src.near_duplicates import MinHashDeduplicator
+from ai_news.tests.base import BaseTestCase
+from ai_news.tests.test_deduplication import TopicEmbeddings
+
+
+STORY = (
+    "OpenAI announced a new reasoning model on Tuesday that the company says outperforms "
+    "previous releases on math and coding benchmarks while costing less to run. The model "
+    "will be available to paying subscribers first and rolled out to the free tier over the "
+    "coming weeks according to a blog post published by the company."
+)
+# Syndicated copy: same story with light edits
+EDITED_STORY = STORY.replace("on Tuesday", "on Tuesday morning").replace("a blog post", "a post")
+OTHER_STORY = (
+    "Nvidia reported record data center revenue as demand for accelerators used to train large "
+    "language models continued to outstrip supply, and the chipmaker guided above analyst "
+    "expectations for the next quarter citing new cloud customers."
+)
+
+
+class TestMinHashDeduplicator(BaseTestCase):
+    """Test shingled MinHash + LSH band index"""
+
+    def setUp(self):
+        super().setUp()
+        self.near = MinHashDeduplicator(threshold=0.8)
+
+    def _article(self, content, url, title='AI news', days_ago=0):
+        from ai_news.models import NewsArticle
+        return NewsArticle.objects.create(
+            title=title, content=content, url=url,
+            source='Test', published_date=timezone.now() - timedelta(days=days_ago)
+        )
+
+    def test_edited_copy_matches_indexed_article(self):
+        """Test lightly edited copy is found through LSH bands with high Jaccard"""
+
+        original = self._article(STORY, 'https://techcrunch.com/a')
+        self.assertEqual(self.near.index_articles([original]), 1)
+
+        copy = self._article(EDITED_STORY, 'https://venturebeat.com/a')
+        other = self._article(OTHER_STORY, 'https://venturebeat.com/b')
+        matches = self.near.find_near_duplicates_batch([copy, other])
+
+        self.assertEqual(list(matches), [copy.id])
+        match, similarity = matches[copy.id]
+        self.assertEqual(match.id, original.id)
+        self.assertGreaterEqual(similarity, 0.8)
+
+    def test_intra_batch_copy_matches_earlier_article(self):
+        """Test copies inside one batch match the first occurrence"""
+
+        first = self._article(STORY, 'https://techcrunch.com/a')
+        copy = self._article(EDITED_STORY, 'https://artificialintelligence-news.com/a')
+
+        matches = self.near.find_near_duplicates_batch([first, copy])
+
+        self.assertEqual({key: value[0].id for key, value in matches.items()}, {copy.id: first.id})
+
+    def test_dedup_window_ignores_old_articles(self):
+        """Test indexed and in-batch copies outside the dedup window are not candidates"""
+
+        near = MinHashDeduplicator(threshold=0.8, dedup_window_days=7)
+        original = self._article(STORY, 'https://techcrunch.com/a', days_ago=90)
+        near.index_articles([original])
+
+        copy = self._article(EDITED_STORY, 'https://venturebeat.com/a')
+        self.assertEqual(near.find_near_duplicates_batch([copy]), {})
+
+        old_in_batch = self._article(EDITED_STORY + " Update.", 'https://example.com/old', days_ago=30)
+        self.assertEqual(near.find_near_duplicates_batch([old_in_batch, copy]), {})
+        unbounded = MinHashDeduplicator(threshold=0.8, dedup_window_days=0)
+        self.assertEqual(unbounded.find_near_duplicates_batch([copy])[copy.id][0].id, original.id)
+
+    def test_short_text_and_disabled_stage_are_skipped(self):
+        """Test short texts and threshold 0 fall through to embeddings"""
+        from ai_news.models import MinHashBand
+
+        short = self._article('OpenAI news', 'https://example.com/short', title='OpenAI')
+        self.assertEqual(self.near.index_articles([short]), 0)
+
+        disabled = MinHashDeduplicator(threshold=0)
+        original = self._article(STORY, 'https://techcrunch.com/a')
+        self.assertEqual(disabled.index_articles([original]), 0)
+        self.assertEqual(disabled.find_near_duplicates_batch([original]), {})
+        self.assertEqual(MinHashBand.objects.count(), 0)
+
+
+class TestNearDuplicateStage(BaseTestCase):
+    """Test near duplicates are rejected before the embedding stage"""
+
+    def test_batch_pipeline_skips_embeddings_for_near_duplicates(self):
+        """Test syndicated copy is marked without embedding it"""
+        from qdrant_client import QdrantClient
+        from ai_news.models import NewsArticle
+
+        embeddings = TopicEmbeddings()
+        service = DuplicationService(
+            vector_deduplicator=VectorDeduplicator(
+                qdrant_client=QdrantClient(":memory:"),
+                embeddings=embeddings,
+                embedding_cache_max_entries=0
+            ),
+            hash_deduplicator=ContentHashDeduplicator(),
+            near_duplicate_deduplicator=MinHashDeduplicator(threshold=0.8)
+        )
+        embeddings.document_calls = 0
+
+        original = NewsArticle.objects.create(title='OpenAI model', content=STORY, url='https://a.com/1',
+                                              source='TechCrunch', published_date=timezone.now())
+        self.assertEqual(service.process_articles_for_duplicates([original]), [False])
+
+        copy = NewsArticle.objects.create(title='OpenAI model', content=EDITED_STORY, url='https://b.com/1',
+                                          source='VentureBeat', published_date=timezone.now())
+        calls_before = embeddings.document_calls
+        self.assertEqual(service.process_articles_for_duplicates([copy]), [True])
+
+        copy.refresh_from_db()
+        self.assertEqual(copy.duplicate_of_id, original.id)
+        self.assertEqual(embeddings.document_calls, calls_before)
@@ -98,7 +98,63 @@ class TestNewsOrchestrationService(BaseTestCase):
         self.assertEqual(results['good_source'], 10)
         self.assertEqual(results['bad_source'], 0)
     
-    @patch('ai_news.src.news_service.ScraperFactory')
+    @patch('ai_news.src.parsers.ScraperFactory')
+    def test_scrape_all_sources_concurrent(self, mock_factory):
+        """Test concurrent scraping keeps result shape and serializes ingestion"""
+        import threading
+        
+        mock_factory.get_available_scrapers.return_value = ['source1', 'source2', 'source3']
+        
+        def make_scraper(name):
+            scraper = Mock()
+            scraper.host = 'example.com'
+            scraper.scrape.return_value = [Mock()] * {'source1': 2, 'source2': 0, 'source3': 4}[name]
+            return scraper
+        
+        mock_factory.create_scraper.side_effect = make_scraper
+        
+        ingest_threads = set()
+        
+        def fake_ingest(name, articles_data, scraper=None):
+            ingest_threads.add(threading.get_ident())
+            return len(articles_data)
+        
+        self.service._ingest_scraped_articles = Mock(side_effect=fake_ingest)
+        
+        results = self.service.scrape_all_sources(max_workers=4, per_host_limit=1)
+        
+        # Same per-source dict, in discovery order
+        self.assertEqual(list(results.items()), [('source1', 2), ('source2', 0), ('source3', 4)])
+        
+        # Ingestion runs only in the calling thread
+        self.assertEqual(ingest_threads, {threading.get_ident()})
+        
+        # Per-source wall time recorded
+        self.assertEqual(set(self.service.last_scrape_timings), {'source1', 'source2', 'source3'})
+    
+    @patch('ai_news.src.parsers.ScraperFactory')
+    def test_scrape_all_sources_concurrent_with_errors(self, mock_factory):
+        """Test concurrent scraping isolates fetch failures"""
+        
+        mock_factory.get_available_scrapers.return_value = ['good_source', 'bad_source']
+        
+        def make_scraper(name):
+            scraper = Mock()
+            scraper.host = name
+            if name == 'bad_source':
+                scraper.scrape.side_effect = Exception("Network error")
+            else:
+                scraper.scrape.return_value = [Mock()]
+            return scraper
+        
+        mock_factory.create_scraper.side_effect = make_scraper
+        self.service._ingest_scraped_articles = Mock(return_value=1)
+        
+        results = self.service.scrape_all_sources(max_workers=2)
+        
+        self.assertEqual(results, {'good_source': 1, 'bad_source': 0})
+    
+    @patch('ai_news.src.parsers.ScraperFactory')
     @patch('ai_news.models.NewsArticle')
     def test_scrape_single_source_success(self, mock_article_model, mock_factory):
         """Test successful single source scraping"""
@@ -114,23 +170,30 @@ class TestNewsOrchestrationService(BaseTestCase):
         mock_scraper.scrape.return_value = mock_articles_data
         mock_factory.create_scraper.return_value = mock_scraper
         
-        # Mock database operations
-        mock_article_model.objects.filter.return_value.exists.return_value = False
-        mock_article_instance = Mock()
-        mock_article_model.return_value = mock_article_instance
+        # Mock database operations (bulk path: url__in / content_hash__in lookups + bulk_create)
+        mock_article_model.objects.filter.return_value.values_list.return_value = []
+        mock_article_model.side_effect = lambda **fields: Mock(**fields)
+        mock_article_model.objects.bulk_create.side_effect = lambda rows: rows
         
         # Mock deduplication (not duplicates)
-        self.mock_deduplication_service.process_article_for_duplicates.return_value = False
+        self.mock_deduplication_service.process_articles_for_duplicates.return_value = [False, False]
         
         result = self.service.scrape_single_source('test_source')
         
         # Should return count of new articles
         self.assertEqual(result, 2)
         
-        # Should process deduplication for each article
-        self.assertEqual(self.mock_deduplication_service.process_article_for_duplicates.call_count, 2)
+        # Should insert both rows in one bulk_create and dedup them in one batch call
+        mock_article_model.objects.bulk_create.assert_called_once()
+        created = self.mock_deduplication_service.process_articles_for_duplicates.call_args[0][0]
+        self.assertEqual([a.url for a in created], ['http://example.com/1', 'http://example.com/2'])
+        self.assertTrue(all(len(a.content_hash) == 64 for a in created))
+        
+        # Statistics rollup is updated from the same batch
+        from ai_news.models import SourceStats
+        self.assertEqual(SourceStats.objects.get(source='Test Source').unique_articles, 2)
     
-    @patch('ai_news.src.news_service.ScraperFactory')
+    @patch('ai_news.src.parsers.ScraperFactory')
     @patch('ai_news.models.NewsArticle')
     def test_scrape_single_source_with_duplicates(self, mock_article_model, mock_factory):
         """Test single source scraping with duplicate detection"""
@@ -146,17 +209,113 @@ class TestNewsOrchestrationService(BaseTestCase):
         mock_factory.create_scraper.return_value = mock_scraper
         
         # Mock no existing URL duplicates
-        mock_article_model.objects.filter.return_value.exists.return_value = False
-        mock_article_model.return_value = Mock()
+        mock_article_model.objects.filter.return_value.values_list.return_value = []
+        mock_article_model.side_effect = lambda **fields: Mock(**fields)
+        mock_article_model.objects.bulk_create.side_effect = lambda rows: rows
         
         # Mock deduplication results (one duplicate, one not)
-        self.mock_deduplication_service.process_article_for_duplicates.side_effect = [False, True]
+        self.mock_deduplication_service.process_articles_for_duplicates.return_value = [False, True]
         
         result = self.service.scrape_single_source('test_source')
         
         # Should return count of unique articles only
         self.assertEqual(result, 1)
     
+    @patch('ai_news.src.parsers.ScraperFactory')
+    @patch('ai_news.models.NewsArticle')
+    def test_scrape_single_source_advances_watermark(self, mock_article_model, mock_factory):
+        """Test ingestion records newest published date and recent URLs per source"""
+        from ai_news.models import SourceWatermark
+        
+        mock_scraper = Mock()
+        mock_scraper.scrape.return_value = [
+            Mock(title='Older', content='Content', url='http://example.com/old',
+                 source='Test Source', published_date=datetime(2025, 1, 1), author='Author'),
+            Mock(title='Newer', content='Content', url='http://example.com/new',
+                 source='Test Source', published_date=datetime(2025, 1, 2), author='Author'),
+        ]
+        mock_factory.create_scraper.return_value = mock_scraper
+        mock_article_model.objects.filter.return_value.values_list.return_value = []
+        mock_article_model.side_effect = lambda **fields: Mock(**fields)
+        mock_article_model.objects.bulk_create.side_effect = lambda rows: rows
+        self.mock_deduplication_service.process_articles_for_duplicates.return_value = [False, False]
+        
+        self.service.scrape_single_source('test_source')
+        
+        state = SourceWatermark.objects.get(source='Test Source')
+        self.assertEqual(state.newest_published.date(), datetime(2025, 1, 2).date())
+        self.assertEqual(state.recent_urls, ['http://example.com/new', 'http://example.com/old'])
+    
+    @patch('ai_news.src.parsers.ScraperFactory')
+    @patch('ai_news.models.NewsArticle')
+    def test_scrape_single_source_skips_existing_urls_and_hashes(self, mock_article_model, mock_factory):
+        """Test bulk ingestion drops known URLs and exact content duplicates before insert"""
+        
+        mock_scraper = Mock()
+        mock_scraper.scrape.return_value = [
+            Mock(title='Known', content='Content', url='http://example.com/known',
+                 source='Test', published_date=datetime.now(), author='Author'),
+            Mock(title='Copy', content='Same', url='http://example.com/copy-1',
+                 source='Test', published_date=datetime.now(), author='Author'),
+            Mock(title='Copy', content='Same', url='http://example.com/copy-2',
+                 source='Test', published_date=datetime.now(), author='Author'),
+        ]
+        mock_factory.create_scraper.return_value = mock_scraper
+        mock_article_model.objects.filter.return_value.values_list.side_effect = [
+            ['http://example.com/known'],  # url__in lookup
+            [],                            # content_hash__in lookup
+        ]
+        mock_article_model.side_effect = lambda **fields: Mock(**fields)
+        mock_article_model.objects.bulk_create.side_effect = lambda rows: rows
+        self.mock_deduplication_service.process_articles_for_duplicates.return_value = [False]
+        
+        result = self.service.scrape_single_source('test_source')
+        
+        self.assertEqual(result, 1)
+        inserted = mock_article_model.objects.bulk_create.call_args[0][0]
+        self.assertEqual([a.url for a in inserted], ['http://example.com/copy-1'])
+        mock_scraper.commit_fetch_state.assert_called_once()
+    
+    @patch('ai_news.src.parsers.ScraperFactory')
+    @patch('ai_news.models.NewsArticle')
+    def test_failed_ingestion_keeps_fetch_state_uncommitted(self, mock_article_model, mock_factory):
+        """Test HTTP validators are not saved when the batch could not be stored"""
+        
+        mock_scraper = Mock()
+        mock_scraper.scrape.return_value = [
+            Mock(title='Fresh', content='Content', url='http://example.com/fresh',
+                 source='Test', published_date=datetime.now(), author='Author'),
+        ]
+        mock_factory.create_scraper.return_value = mock_scraper
+        mock_article_model.objects.filter.side_effect = Exception("database is locked")
+        
+        result = self.service.scrape_single_source('test_source')
+        
+        self.assertEqual(result, 0)
+        mock_scraper.commit_fetch_state.assert_not_called()
+    
+    @patch('ai_news.src.parsers.ScraperFactory')
+    def test_failed_deduplication_rolls_back_ingestion(self, mock_factory):
+        """Test a dedup failure leaves no rows, rollup, watermark or validators behind"""
+        from ai_news.models import NewsArticle, SourceStats, SourceWatermark
+        
+        mock_scraper = Mock()
+        mock_scraper.scrape.return_value = [
+            Mock(title='Fresh', content='Content', url='http://example.com/fresh',
+                 source='Test Source', published_date=datetime(2025, 1, 2), author='Author'),
+        ]
+        mock_factory.create_scraper.return_value = mock_scraper
+        self.mock_deduplication_service.process_articles_for_duplicates.side_effect = Exception("Qdrant down")
+        
+        result = self.service.scrape_single_source('test_source')
+        
+        self.assertEqual(result, 0)
+        self.assertFalse(NewsArticle.objects.exists())
+        self.assertFalse(SourceStats.objects.exists())
+        self.assertFalse(SourceWatermark.objects.exists())
+        mock_scraper.commit_fetch_state.assert_not_called()
+        self.mock_deduplication_service.vector_deduplicator.remove_articles_from_index.assert_called_once()
+    
     @patch('ai_news.src.news_service.ScraperFactory')
     def test_scrape_single_source_error_handling(self, mock_factory):
         """Test single source scraping error handling"""
@@ -287,67 +446,65 @@ class TestNewsOrchestrationService(BaseTestCase):
             is_duplicate=False
         )
     
-    @patch('ai_news.models.NewsArticle')
-    @patch('ai_news.models.BlogSummary')
-    @patch('ai_news.src.news_service.ScraperFactory')
-    def test_get_statistics(self, mock_factory, mock_blog_model, mock_article_model):
-        """Test getting comprehensive statistics"""
-        
-        # Mock article counts
-        mock_article_model.objects.count.return_value = 100
-        mock_article_model.objects.filter.side_effect = [
-            Mock(count=Mock(return_value=85)),  # unique
-            Mock(count=Mock(return_value=15))   # duplicates
-        ]
-        
-        # Mock source statistics
-        mock_article_model.objects.values_list.return_value.distinct.return_value = ['Source1', 'Source2']
-        
-        def mock_source_filter(**kwargs):
-            if kwargs.get('source') == 'Source1':
-                return Mock(count=Mock(return_value=60))
-            else:
-                return Mock(count=Mock(return_value=40))
-        
-        mock_article_model.objects.filter = Mock(side_effect=mock_source_filter)
-        
-        # Mock other data
-        mock_blog_model.objects.count.return_value = 10
+    @patch('ai_news.src.parsers.ScraperFactory')
+    def test_get_statistics(self, mock_factory):
+        """Test statistics are read from the rollup regardless of source count"""
+        from django.utils import timezone
+        from ai_news.models import NewsArticle, BlogSummary
+        from ai_news.src.article_stats import rebuild_statistics_rollup
+        
+        for index in range(20):
+            NewsArticle.objects.create(
+                title=f'Article {index}', content='Content', url=f'https://example.com/{index}',
+                source=f'Source{index % 4}', published_date=timezone.now(),
+                is_duplicate=index % 4 == 0
+            )
+        BlogSummary.objects.create(title='Summary', summary='Content', topic_category='Daily')
         mock_factory.get_available_scrapers.return_value = ['scraper1', 'scraper2']
-        
-        result = self.service.get_statistics()
-        
-        # Should return comprehensive stats
-        self.assertEqual(result['total_articles'], 100)
-        self.assertEqual(result['unique_articles'], 85)
-        self.assertEqual(result['duplicates'], 15)
-        self.assertEqual(result['duplicate_rate'], 15.0)
-        self.assertIn('source_statistics', result)
-        self.assertEqual(result['total_summaries'], 10)
+        rebuild_statistics_rollup()
+        
+        # SourceStats rollup + BlogSummary count
+        with self.assertNumQueries(2):
+            result = self.service.get_statistics()
+        
+        self.assertEqual(result['total_articles'], 20)
+        self.assertEqual(result['unique_articles'], 15)
+        self.assertEqual(result['duplicates'], 5)
+        self.assertEqual(result['duplicate_rate'], 25.0)
+        self.assertEqual(result['source_statistics']['Source0'], {'total': 5, 'unique': 0})
+        self.assertEqual(result['source_statistics']['Source1'], {'total': 5, 'unique': 5})
+        self.assertEqual(len(result['source_statistics']), 4)
+        self.assertEqual(result['total_summaries'], 1)
     
-    @patch('ai_news.models.NewsArticle')
-    def test_cleanup_old_articles(self, mock_article_model):
-        """Test cleaning up old articles"""
-        
-        # Mock old articles
-        old_articles = [Mock(id=1), Mock(id=2), Mock(id=3)]
-        mock_queryset = Mock()
-        mock_queryset.filter.return_value = old_articles
-        mock_queryset.count.return_value = 3
-        mock_queryset.delete.return_value = None
-        mock_article_model.objects = mock_queryset
+    def test_cleanup_old_articles(self):
+        """Test cleaning up old articles in chunks with one vector delete per chunk"""
+        from django.utils import timezone
+        from ai_news.models import NewsArticle
+        
+        for index in range(3):
+            NewsArticle.objects.create(
+                title=f'Old {index}', content='Content', url=f'https://example.com/old/{index}',
+                source='Test', published_date=timezone.now(),
+                scraped_date=timezone.now() - timedelta(days=40)
+            )
+        NewsArticle.objects.create(title='Recent', content='Content', url='https://example.com/new',
+                                   source='Test', published_date=timezone.now())
         
-        # Mock vector index removal
-        self.mock_deduplication_service.vector_deduplicator.remove_article_from_index = Mock()
+        vector_deduplicator = self.mock_deduplication_service.vector_deduplicator
+        vector_deduplicator.remove_articles_from_index = Mock(return_value=True)
+        progress = []
         
-        result = self.service.cleanup_old_articles(days=30)
+        result = self.service.cleanup_old_articles(
+            days=30, chunk_size=2, progress_callback=lambda done, total: progress.append((done, total))
+        )
         
         # Should return count of cleaned articles
         self.assertEqual(result, 3)
+        self.assertEqual(NewsArticle.objects.count(), 1)
+        self.assertEqual(progress, [(2, 3), (3, 3)])
         
-        # Should remove from vector index
-        removal_calls = self.mock_deduplication_service.vector_deduplicator.remove_article_from_index.call_args_list
-        self.assertEqual(len(removal_calls), 3)
+        # Should remove from vector index in batches
+        self.assertEqual(vector_deduplicator.remove_articles_from_index.call_count, 2)
     
     @patch('ai_news.models.NewsArticle')
     @patch('ai_news.models.BlogSummary')
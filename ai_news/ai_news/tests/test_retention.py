@@ -0,0 +1,73 @@
+"""
+Tests for the chunked retention engine
+"""
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.utils import timezone
+
+from ai_news.src.article_stats import collect_article_statistics, rebuild_statistics_rollup
+from ai_news.src.deduplication import VectorDeduplicator
+from ai_news.src.retention import ArticleRetentionEngine
+from ai_news.tests.base import BaseTestCase
+from ai_news.tests.test_deduplication import TopicEmbeddings
+
+
+class TestArticleRetentionEngine(BaseTestCase):
+    """Test chunked purge of rows, vector points and rollup"""
+
+    def setUp(self):
+        super().setUp()
+        from qdrant_client import QdrantClient
+        self.deduplicator = VectorDeduplicator(
+            qdrant_client=QdrantClient(":memory:"),
+            embeddings=TopicEmbeddings(),
+            embedding_cache_max_entries=0
+        )
+
+    def _article(self, title, index, days_old, **fields):
+        from ai_news.models import NewsArticle
+        scraped = timezone.now() - timedelta(days=days_old)
+        return NewsArticle.objects.create(
+            title=title, content=f'{title} body', url=f'https://example.com/{index}',
+            source='Test', published_date=scraped, scraped_date=scraped, **fields
+        )
+
+    def test_purge_in_chunks(self):
+        """Test old rows, their duplicates and vector points go away one chunk at a time"""
+        from ai_news.models import NewsArticle
+
+        old = [self._article(f'OpenAI release {index}', index, days_old=40) for index in range(5)]
+        recent = self._article('Robotics funding', 10, days_old=1)
+        # Recent duplicate of an old original is removed by the duplicate_of cascade
+        dependent = self._article('OpenAI copy', 11, days_old=1, is_duplicate=True, duplicate_of=old[0])
+        self.deduplicator.index_articles(old + [recent])
+        rebuild_statistics_rollup()
+
+        progress = []
+        engine = ArticleRetentionEngine(self.deduplicator, chunk_size=2,
+                                        progress_callback=lambda done, total: progress.append((done, total)))
+        with patch.object(self.deduplicator.client, 'delete',
+                          wraps=self.deduplicator.client.delete) as delete:
+            deleted = engine.purge(NewsArticle.objects.filter(scraped_date__lt=timezone.now() - timedelta(days=30)))
+
+        self.assertEqual(deleted, 6)
+        self.assertEqual(delete.call_count, 3)
+        self.assertEqual(progress, [(2, 5), (4, 5), (5, 5)])
+        self.assertEqual(list(NewsArticle.objects.values_list('id', flat=True)), [recent.id])
+        self.assertFalse(NewsArticle.objects.filter(id=dependent.id).exists())
+        self.assertEqual(self.deduplicator.client.count(self.deduplicator.collection_name).count, 1)
+
+        stats = collect_article_statistics()
+        self.assertEqual((stats['total_articles'], stats['unique_articles']), (1, 1))
+
+    def test_vector_failure_does_not_block_row_deletion(self):
+        """Test rows are still pruned when the vector store delete fails"""
+        from ai_news.models import NewsArticle
+
+        self._article('OpenAI release', 1, days_old=40)
+        engine = ArticleRetentionEngine(self.deduplicator, chunk_size=10)
+
+        with patch.object(self.deduplicator.client, 'delete', side_effect=Exception('Qdrant down')):
+            self.assertEqual(engine.purge(NewsArticle.objects.all()), 1)
+        self.assertEqual(NewsArticle.objects.count(), 0)
@@ -2,11 +2,13 @@
 Tests for summarization service functionality
 """
 
+import re
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
 
 from ai_news.src.summarization import BlogSummarizer, BlogSummaryService
+from ai_news.src.summary_cache import MapExtractionCache
 from ai_news.tests.base import BaseTestCase
 
 
@@ -62,26 +64,30 @@ class TestBlogSummarizer(BaseTestCase):
         # Should handle empty list gracefully
         self.assertIsNone(summary)
     
-    @patch('ai_news.src.summarization.load_summarize_chain')
-    def test_modern_map_reduce_summarize(self, mock_load_chain):
+    def test_modern_map_reduce_summarize(self):
         """Test modern map-reduce summarization"""
-        
-        # Mock the map-reduce chain
-        mock_chain = Mock()
-        mock_chain.run.return_value = "Map-reduce summary result"
-        mock_load_chain.return_value = mock_chain
-        
-        articles = self.create_mock_articles_list(count=10)  # Large number for map-reduce
-        
-        # Mock Document creation
-        with patch('ai_news.src.summarization.Document') as mock_document:
-            mock_docs = [Mock() for _ in range(10)]
-            mock_document.side_effect = mock_docs
-            
-            result = self.summarizer._modern_map_reduce_summarize(mock_docs, "AI News")
-            
-            self.assertEqual(result, "Map-reduce summary result")
-            mock_load_chain.assert_called()
+        from langchain_core.documents import Document
+        
+        llm = FakeSummaryLLM()
+        self.summarizer.llm = llm.runnable
+        
+        # Real Documents z token metadata jak z _prepare_documents()
+        documents = [
+            Document(
+                page_content=f"Title: Test Article {index}\nSource: Test Source\nContent: AI and ML topics.",
+                metadata={"title": f"Test Article {index}", "source": "Test Source",
+                          "content_hash": f"hash-{index}", "tokens": 20}
+            )
+            for index in range(10)  # Large number for map-reduce
+        ]
+        
+        result = self.summarizer._modern_map_reduce_summarize(documents, "AI News")
+        
+        self.assertEqual(result, "TITLE: Weekly AI\n\nSUMMARY: Reduced")
+        self.assertTrue(llm.map_prompts)
+        self.assertEqual(len(llm.reduce_prompts), 1)
+        for index in range(10):
+            self.assertIn(f"insight: Test Article {index}", llm.reduce_prompts[0])
     
     def test_prepare_articles_for_summarization(self):
         """Test preparing articles for summarization"""
@@ -342,4 +348,325 @@ class TestSummarizationIntegration(BaseTestCase):
             
             # All should complete successfully
             self.assertEqual(len(results), 3)
-            self.assertTrue(all(r is not None for r in results))
\ No newline at end of file
+            self.assertTrue(all(r is not None for r in results))
+
+class FakeSummaryLLM:
+    """RunnableLambda-based LLM stand-in recording map/collapse/reduce prompts and peak concurrency"""
+    
+    def __init__(self, delay=0.0, fail_on=None):
+        import threading
+        from langchain_core.runnables import RunnableLambda
+        
+        self.delay = delay
+        self.fail_on = fail_on
+        self.map_prompts = []
+        self.collapse_prompts = []
+        self.reduce_prompts = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        self.runnable = RunnableLambda(self._respond)
+    
+    def _respond(self, prompt_value):
+        import time
+        
+        text = prompt_value.to_string()
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if text.startswith("Extract CONCRETE"):
+                self.map_prompts.append(text)
+                if self.fail_on and self.fail_on in text:
+                    raise RuntimeError("rate limited")
+                sections = re.findall(r"^\[(\d+)\]\nTitle: (.*)$", text, re.MULTILINE)
+                return "\n".join(f"[{number}]\n- insight: {title}" for number, title in sections)
+            if text.startswith("Consolidate"):
+                self.collapse_prompts.append(text)
+                return f"- consolidated {len(self.collapse_prompts)}"
+            self.reduce_prompts.append(text)
+            return "TITLE: Weekly AI\n\nSUMMARY: Reduced"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestMapPhase(BaseTestCase):
+    """Test the map phase of BlogSummarizer map-reduce"""
+    
+    def _summarizer(self, llm, per_call=1, **kwargs):
+        with patch('ai_news.src.summarization.ChatOpenAI'):
+            summarizer = BlogSummarizer(**kwargs)
+        summarizer.llm = llm.runnable
+        summarizer.max_articles_per_map_call = per_call
+        return summarizer
+    
+    def test_map_calls_run_concurrently_and_failures_are_isolated(self):
+        """Test map phase uses batch concurrency and drops only the failed document"""
+        
+        llm = FakeSummaryLLM(delay=0.05, fail_on='Test Article 2')
+        summarizer = self._summarizer(llm, map_max_concurrency=4)
+        documents = summarizer._prepare_documents(self.create_mock_articles_list(count=4))
+        
+        result = summarizer._modern_map_reduce_summarize(documents, "AI News")
+        
+        self.assertEqual(result, "TITLE: Weekly AI\n\nSUMMARY: Reduced")
+        self.assertEqual(len(llm.map_prompts), 4)
+        self.assertGreater(llm.peak, 1)
+        reduce_prompt = llm.reduce_prompts[0]
+        self.assertIn("insight: Test Article 1", reduce_prompt)
+        self.assertNotIn("insight: Test Article 2", reduce_prompt)
+        self.assertIn("insight: Test Article 4", reduce_prompt)
+    
+    def test_max_concurrency_is_respected(self):
+        """Test map_max_concurrency=1 keeps map calls sequential"""
+        
+        llm = FakeSummaryLLM(delay=0.01)
+        summarizer = self._summarizer(llm, map_max_concurrency=1)
+        documents = summarizer._prepare_documents(self.create_mock_articles_list(count=3))
+        
+        self.assertEqual(len(summarizer._map_documents(documents)), 3)
+        self.assertEqual(llm.peak, 1)
+    
+    def test_map_outputs_are_reused_across_runs(self):
+        """Test cached extractions skip the map call and failed documents are retried"""
+        from ai_news.models import MapExtractionCacheEntry
+        
+        articles = self.create_mock_articles_list(count=3)
+        llm = FakeSummaryLLM(fail_on='Test Article 3')
+        summarizer = self._summarizer(llm)
+        summarizer._map_documents(summarizer._prepare_documents(articles))
+        self.assertEqual(MapExtractionCacheEntry.objects.count(), 2)
+        
+        # Weekly run: only the previously failed article pays for a map call
+        llm = FakeSummaryLLM()
+        summarizer = self._summarizer(llm)
+        results = summarizer._map_documents(summarizer._prepare_documents(articles))
+        
+        self.assertEqual(results, ['- insight: Test Article 1', '- insight: Test Article 2',
+                                   '- insight: Test Article 3'])
+        self.assertEqual(len(llm.map_prompts), 1)
+        self.assertIn('Test Article 3', llm.map_prompts[0])
+    
+    def test_map_cache_key_includes_model_and_prompt_version(self):
+        """Test another model or an edited map prompt misses the cache"""
+        
+        articles = self.create_mock_articles_list(count=2)
+        summarizer = self._summarizer(FakeSummaryLLM())
+        summarizer._map_documents(summarizer._prepare_documents(articles))
+        
+        llm = FakeSummaryLLM()
+        other_model = self._summarizer(llm, model='gpt-4o')
+        other_model._map_documents(other_model._prepare_documents(articles))
+        self.assertEqual(len(llm.map_prompts), 2)
+        
+        llm = FakeSummaryLLM()
+        edited = self._summarizer(llm, map_cache=MapExtractionCache('gpt-4o-mini', 'edited-prompt'))
+        edited._map_documents(edited._prepare_documents(articles))
+        self.assertEqual(len(llm.map_prompts), 2)
+    
+    def test_short_articles_share_a_map_call(self):
+        """Test articles are packed by token budget and split back per article"""
+        from ai_news.models import MapExtractionCacheEntry
+        
+        llm = FakeSummaryLLM()
+        summarizer = self._summarizer(llm, per_call=12)
+        articles = self.create_mock_articles_list(count=15)
+        documents = summarizer._prepare_documents(articles)
+        
+        results = summarizer._map_documents(documents)
+        
+        # All 15 articles covered (no top-10 cut) in two calls
+        self.assertEqual(len(documents), 15)
+        self.assertEqual(len(llm.map_prompts), 2)
+        self.assertEqual(results, [f'- insight: Test Article {number}' for number in range(1, 16)])
+        self.assertEqual(MapExtractionCacheEntry.objects.count(), 15)
+    
+    def test_long_article_is_split_to_fit_the_budget(self):
+        """Test an article above the token budget becomes several map documents"""
+        
+        from langchain_text_splitters import RecursiveCharacterTextSplitter
+        
+        summarizer = self._summarizer(FakeSummaryLLM())
+        long_article = self.create_mock_article_data(
+            title='Long read', content='Transformers scale with data and compute. ' * 1500
+        )
+        
+        documents = summarizer._prepare_documents([long_article])
+        
+        self.assertGreater(len(documents), 1)
+        self.assertTrue(all(doc.metadata['tokens'] <= summarizer.map_token_budget for doc in documents))
+        self.assertIn('Title: Long read (part 1/', documents[0].page_content)
+        self.assertEqual(len({doc.metadata['content_hash'] for doc in documents}), len(documents))
+        
+        # Inny podział (np. mniejszy budget) nie trafia w cache extractions starych chunks
+        summarizer.text_splitter = RecursiveCharacterTextSplitter(chunk_size=2000, chunk_overlap=0)
+        resplit = summarizer._prepare_documents([long_article])
+        self.assertFalse({doc.metadata['content_hash'] for doc in resplit}
+                         & {doc.metadata['content_hash'] for doc in documents})
+    
+    def test_output_without_markers_is_retried_per_document(self):
+        """Test a pack whose output lost the [n] markers is re-run one document per call, uncached"""
+        from langchain_core.runnables import RunnableLambda
+        from ai_news.models import MapExtractionCacheEntry
+        
+        llm = FakeSummaryLLM()
+        
+        def drop_markers_for_packs(prompt_value):
+            if prompt_value.to_string().count("\nTitle: ") > 1:
+                return "- merged insights"
+            return llm._respond(prompt_value)
+        
+        summarizer = self._summarizer(llm, per_call=12)
+        summarizer.llm = RunnableLambda(drop_markers_for_packs)
+        articles = self.create_mock_articles_list(count=3)
+        documents = summarizer._prepare_documents(articles)
+        
+        results = summarizer._map_documents(documents)
+        
+        self.assertEqual(results, [f"- insight: {article.title}" for article in articles])
+        self.assertEqual(len(llm.map_prompts), 3)
+        self.assertEqual(sorted(MapExtractionCacheEntry.objects.values_list('extraction', flat=True)),
+                         sorted(results))
+    
+    def test_empty_section_invalidates_pack_split(self):
+        """Test a marker with no extraction is treated as a mismatch"""
+        
+        self.assertIsNone(BlogSummarizer._split_sections("[1]\n- a\n[2]\n", 2))
+        self.assertEqual(BlogSummarizer._split_sections("[1]\n- a\n[2]\n- b", 2), ["- a", "- b"])
+    
+    def test_large_map_output_is_collapsed_before_reduce(self):
+        """Test insights above the reduce budget go through tree collapse and one final reduce"""
+        
+        llm = FakeSummaryLLM(delay=0.01)
+        summarizer = self._summarizer(llm, map_max_concurrency=4)
+        summarizer.reduce_token_budget = 100
+        mapped_results = [f"- insight {number}: " + "detail " * 40 for number in range(12)]
+        
+        with patch.object(summarizer, '_map_documents', return_value=mapped_results):
+            result = summarizer._modern_map_reduce_summarize([], "AI News")
+        
+        self.assertEqual(result, "TITLE: Weekly AI\n\nSUMMARY: Reduced")
+        self.assertGreater(len(llm.collapse_prompts), 1)
+        self.assertGreater(llm.peak, 1)
+        self.assertEqual(len(llm.reduce_prompts), 1)
+        self.assertIn("- consolidated", llm.reduce_prompts[0])
+        self.assertNotIn("- insight", llm.reduce_prompts[0])
+    
+    def test_failed_collapse_stops_and_reduces_all_insights(self):
+        """Test a collapse level without progress is not retried and no insights are dropped"""
+        
+        from langchain_core.runnables import RunnableLambda
+        
+        llm = FakeSummaryLLM()
+        respond = llm._respond
+        
+        def failing_collapse(prompt_value):
+            if prompt_value.to_string().startswith("Consolidate"):
+                llm.collapse_prompts.append(prompt_value.to_string())
+                raise RuntimeError("rate limited")
+            return respond(prompt_value)
+        
+        summarizer = self._summarizer(llm)
+        summarizer.llm = RunnableLambda(failing_collapse)
+        summarizer.reduce_token_budget = 100
+        mapped_results = [f"- insight {number}: " + "detail " * 40 for number in range(12)]
+        
+        with patch.object(summarizer, '_map_documents', return_value=mapped_results):
+            result = summarizer._modern_map_reduce_summarize([], "AI News")
+        
+        self.assertEqual(result, "TITLE: Weekly AI\n\nSUMMARY: Reduced")
+        self.assertEqual(len(llm.collapse_prompts), 12)
+        self.assertEqual(len(llm.reduce_prompts), 1)
+        for number in range(12):
+            self.assertIn(f"- insight {number}:", llm.reduce_prompts[0])
+    
+    def test_small_map_output_skips_collapse(self):
+        """Test insights within the reduce budget go straight to the final reduce"""
+        
+        llm = FakeSummaryLLM()
+        summarizer = self._summarizer(llm)
+        
+        self.assertEqual(summarizer._collapse_results(["- a", "- b"], "AI News"), ["- a", "- b"])
+        self.assertEqual(llm.collapse_prompts, [])
+
+
+class TestIncrementalWeeklySummary(BaseTestCase):
+    """Test weekly summaries composed from stored daily summaries"""
+    
+    def setUp(self):
+        super().setUp()
+        self.llm = FakeSummaryLLM()
+        with patch('ai_news.src.summarization.ChatOpenAI'):
+            self.service = BlogSummaryService()
+        self.service.summarizer.llm = self.llm.runnable
+        self.service.summarizer.max_articles_per_map_call = 1
+    
+    def _articles(self, prefix, count, days_ago):
+        from django.utils import timezone
+        from ai_news.models import NewsArticle
+        
+        published = timezone.now() - timedelta(days=days_ago)
+        return [
+            NewsArticle.objects.create(
+                title=f'{prefix} {index}', content=f'{prefix} content {index}',
+                url=f'https://example.com/{prefix}/{index}'.replace(' ', '-'), source='Test Source',
+                published_date=published
+            )
+            for index in range(count)
+        ]
+    
+    def test_weekly_summary_reuses_daily_summaries(self):
+        """Test only articles outside daily summaries are mapped and everything goes to one reduce"""
+        from ai_news.models import BlogSummary
+        
+        covered = self._articles('Covered', 3, days_ago=1)
+        uncovered = self._articles('Uncovered', 2, days_ago=2)
+        daily = BlogSummary.objects.create(title='Monday AI', summary='Daily digest text',
+                                           topic_category='AI News', period='daily')
+        daily.articles.set(covered)
+        
+        weekly = self.service.create_weekly_summary('AI News')
+        
+        self.assertEqual(weekly.period, 'weekly')
+        self.assertEqual(weekly.articles.count(), 5)
+        self.assertEqual(len(self.llm.map_prompts), 2)
+        self.assertTrue(all('Covered' not in prompt for prompt in self.llm.map_prompts))
+        self.assertEqual(len(self.llm.reduce_prompts), 1)
+        self.assertIn('Monday AI', self.llm.reduce_prompts[0])
+        self.assertIn('Daily digest text', self.llm.reduce_prompts[0])
+        self.assertIn(f'insight: {uncovered[0].title}', self.llm.reduce_prompts[0])
+    
+    def test_weekly_summary_links_only_unique_articles_from_the_week(self):
+        """Test daily-covered duplicates and articles outside the week are not linked to the weekly"""
+        from ai_news.models import BlogSummary
+        
+        covered = self._articles('Covered', 2, days_ago=1)
+        duplicate = self._articles('Duplicate', 1, days_ago=1)[0]
+        duplicate.is_duplicate = True
+        duplicate.save()
+        stale = self._articles('Stale', 1, days_ago=10)[0]
+        daily = BlogSummary.objects.create(title='Monday AI', summary='Daily digest text',
+                                           topic_category='AI News', period='daily')
+        daily.articles.set(covered + [duplicate, stale])
+        
+        weekly = self.service.create_weekly_summary('AI News')
+        
+        self.assertEqual(set(weekly.articles.values_list('id', flat=True)), {article.id for article in covered})
+        self.assertEqual(self.llm.map_prompts, [])
+    
+    def test_weekly_summary_without_dailies_maps_the_whole_week(self):
+        """Test the full map-reduce path when no daily summary exists in the window"""
+        from ai_news.models import BlogSummary
+        
+        self._articles('Article', 3, days_ago=1)
+        previous_weekly = BlogSummary.objects.create(title='Last week', summary='Old weekly',
+                                                     topic_category='AI News', period='weekly')
+        
+        weekly = self.service.create_weekly_summary('AI News')
+        
+        self.assertNotEqual(weekly.id, previous_weekly.id)
+        self.assertEqual(len(self.llm.map_prompts), 3)
+        self.assertNotIn('Old weekly', self.llm.reduce_prompts[0])
+        self.assertEqual(weekly.articles.count(), 3)